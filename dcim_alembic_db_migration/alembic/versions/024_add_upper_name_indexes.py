@@ -0,0 +1,56 @@
+"""
+Add function-based UPPER(name) indexes for case-insensitive name lookups
+
+Revision ID: 024_add_upper_name_indexes
+Revises: 023_alter_model_device_rack_schema
+Create Date: 2026-10-16 00:00:00.000000
+
+Changes:
+- Add an index on UPPER(name) to every entity table the API looks up by name.
+  The backend filters with UPPER(name) = UPPER(:name); without a matching
+  function-based index Oracle cannot use the plain index on name and falls
+  back to a full table scan.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from oracle_helpers import index_exists
+
+revision = "024_add_upper_name_indexes"
+down_revision = "023_alter_model_device_rack_schema"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "dcim"
+
+# table name -> index name (kept under Oracle's 30 character limit)
+UPPER_NAME_INDEXES = {
+    "dcim_location": "ix_location_uname",
+    "dcim_building": "ix_building_uname",
+    "dcim_wing": "ix_wing_uname",
+    "dcim_floor": "ix_floor_uname",
+    "dcim_datacenter": "ix_datacenter_uname",
+    "dcim_rack": "ix_rack_uname",
+    "dcim_make": "ix_make_uname",
+    "dcim_device_type": "ix_device_type_uname",
+    "dcim_model": "ix_model_uname",
+    "dcim_asset_owner": "ix_asset_owner_uname",
+    "dcim_applications_mapped": "ix_applications_mapped_uname",
+    "dcim_device": "ix_device_uname",
+}
+
+
+def upgrade() -> None:
+    for table_name, index_name in UPPER_NAME_INDEXES.items():
+        if not index_exists(SCHEMA, index_name):
+            op.execute(
+                sa.text(f"CREATE INDEX {SCHEMA}.{index_name} ON {SCHEMA}.{table_name} (UPPER(name))")
+            )
+
+
+def downgrade() -> None:
+    for index_name in UPPER_NAME_INDEXES.values():
+        if index_exists(SCHEMA, index_name):
+            op.execute(sa.text(f"DROP INDEX {SCHEMA}.{index_name}"))
@@ -0,0 +1,38 @@
+"""
+Add a composite (rack_id, position) index on dcim_device
+
+Revision ID: 025_add_device_rack_position_index
+Revises: 024_add_upper_name_indexes
+Create Date: 2026-10-16 00:00:00.000000
+
+Changes:
+- Index dcim_device on (rack_id, position). Device placement checks look for
+  devices in one rack whose position range overlaps the requested units
+  (rack_id = :rack AND position <= :end ... ORDER BY position), which this
+  index answers with a range scan instead of visiting every device in the
+  rack.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+from oracle_helpers import index_exists
+
+revision = "025_add_device_rack_position_index"
+down_revision = "024_add_upper_name_indexes"
+branch_labels = None
+depends_on = None
+
+SCHEMA = "dcim"
+TABLE_NAME = "dcim_device"
+INDEX_NAME = "ix_device_rack_position"
+
+
+def upgrade() -> None:
+    if not index_exists(SCHEMA, INDEX_NAME):
+        op.create_index(INDEX_NAME, TABLE_NAME, ["rack_id", "position"], schema=SCHEMA)
+
+
+def downgrade() -> None:
+    if index_exists(SCHEMA, INDEX_NAME):
+        op.drop_index(INDEX_NAME, table_name=TABLE_NAME, schema=SCHEMA)
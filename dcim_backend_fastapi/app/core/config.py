@@ -77,11 +77,16 @@ class Settings(BaseSettings):
     SMTP_USE_TLS: bool = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
     SMTP_USE_SSL: bool = os.getenv("SMTP_USE_SSL", "false").lower() == "true"
     SMTP_TIMEOUT: int = int(os.getenv("SMTP_TIMEOUT", "30"))
+    # Threads that deliver queued emails (each keeps its own SMTP connection)
+    SMTP_SEND_WORKERS: int = int(os.getenv("SMTP_SEND_WORKERS", "2"))
 
     # Token expiration settings (in seconds)
     ACCESS_TOKEN_EXPIRE_SECONDS: int = 3600 # 1 hour
     REFRESH_TOKEN_EXPIRE_SECONDS: int = 86400  # 1 day
 
+    # Verified JWT payload cache (raw token -> claims); 0 disables caching
+    JWT_DECODE_CACHE_MAX_ENTRIES: int = int(os.getenv("JWT_DECODE_CACHE_MAX_ENTRIES", "4096"))
+
     # Listing cache configuration (can be overridden via env vars)
     LISTING_CACHE_TTL_SECONDS: int = int(os.getenv("LISTING_CACHE_TTL_SECONDS", "30"))
     LISTING_CACHE_MAX_ENTRIES: int = int(os.getenv("LISTING_CACHE_MAX_ENTRIES", "256"))
@@ -89,6 +94,18 @@ class Settings(BaseSettings):
     # Summary cache configuration (0 disables caching)
     SUMMARY_CACHE_TTL_SECONDS: int = int(os.getenv("SUMMARY_CACHE_TTL_SECONDS", "30"))
 
+    # Entity detail cache (cleared on every write); 0 disables caching
+    DETAIL_CACHE_TTL_SECONDS: int = int(os.getenv("DETAIL_CACHE_TTL_SECONDS", "30"))
+    DETAIL_CACHE_MAX_ENTRIES: int = int(os.getenv("DETAIL_CACHE_MAX_ENTRIES", "512"))
+
+    # RBAC menu cache (per user/role set); 0 disables caching
+    MENU_CACHE_TTL_SECONDS: int = int(os.getenv("MENU_CACHE_TTL_SECONDS", "300"))
+    MENU_CACHE_MAX_ENTRIES: int = int(os.getenv("MENU_CACHE_MAX_ENTRIES", "2048"))
+
+    # Device listing lookup tables (locations, buildings, datacenters, makes,
+    # device types, models); cleared on local writes, 0 disables caching
+    LOOKUP_CACHE_TTL_SECONDS: int = int(os.getenv("LOOKUP_CACHE_TTL_SECONDS", "300"))
+
     # Change-log helper cache (entity name -> id lookups)
     CHANGELOG_ENTITY_CACHE_TTL_SECONDS: int = int(
         os.getenv("CHANGELOG_ENTITY_CACHE_TTL_SECONDS", "60")
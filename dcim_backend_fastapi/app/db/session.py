@@ -6,6 +6,7 @@ This significantly speeds up FastAPI startup.
 import os
 from typing import Generator
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
 
 # Global variables for lazy initialization
@@ -30,6 +31,14 @@ def get_engine():
     if _engine is None:
         database_url = _get_database_url()
         is_dev = os.getenv("APP_ENV", "dev").lower() == "dev"
+
+        connect_args = {}
+        if make_url(database_url).get_backend_name() == "oracle":
+            # python-oracledb's per-connection statement cache keeps parsed
+            # cursors open, so re-running a listing/detail statement skips the
+            # server-side parse. The default of 20 is smaller than the set of
+            # hot statement texts (list_* per filter combination, lookups).
+            connect_args["stmtcachesize"] = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "100"))
         
         _engine = create_engine(
             database_url,
@@ -37,7 +46,11 @@ def get_engine():
             pool_size=5,
             max_overflow=10,
             pool_timeout=30,
+            # Compiled-SQL cache entries; the listing/detail queries vary by
+            # filter combination, so keep more than the default 500 around
+            query_cache_size=int(os.getenv("DB_QUERY_CACHE_SIZE", "1200")),
             echo=False,  # Disable SQL logging for performance (set to True to debug)
+            connect_args=connect_args,
         )
     return _engine
 
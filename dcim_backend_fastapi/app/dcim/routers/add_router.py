@@ -6,15 +6,16 @@ import json
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from app.db.session import get_db
 from app.helpers.rbac_helper import AccessLevel, require_editor_or_admin
 from app.helpers.listing_types import ListingType
+from app.helpers.db_utils import name_equals
 from app.helpers.auth_helper import get_current_user
 from app.helpers.audit_helper import build_audit_context, log_create
+from app.helpers.detail_cache import invalidate_detail_cache
 from app.helpers.listing_cache import invalidate_listing_cache_for_entity
 from app.helpers.summary_cache import invalidate_location_summary_cache
 from app.models.auth_models import User
@@ -125,7 +126,7 @@ def check_row_uniqueness(entity: ListingType, data: Dict[str, Any], db: Session)
         
         existing = (
             db.query(Wing)
-            .filter(func.upper(Wing.name) == func.upper(data["name"]))
+            .filter(name_equals(Wing, data["name"]))
             .filter(Wing.location_id == location.id)
             .filter(Wing.building_id == building.id)
             .first()
@@ -145,7 +146,7 @@ def check_row_uniqueness(entity: ListingType, data: Dict[str, Any], db: Session)
         
         existing = (
             db.query(Floor)
-            .filter(func.upper(Floor.name) == func.upper(data["name"]))
+            .filter(name_equals(Floor, data["name"]))
             .filter(Floor.location_id == location.id)
             .filter(Floor.building_id == building.id)
             .filter(Floor.wing_id == wing.id)
@@ -167,7 +168,7 @@ def check_row_uniqueness(entity: ListingType, data: Dict[str, Any], db: Session)
         
         existing = (
             db.query(Datacenter)
-            .filter(func.upper(Datacenter.name) == func.upper(data["name"]))
+            .filter(name_equals(Datacenter, data["name"]))
             .filter(Datacenter.location_id == location.id)
             .filter(Datacenter.building_id == building.id)
             .filter(Datacenter.wing_id == wing.id)
@@ -187,7 +188,7 @@ def check_row_uniqueness(entity: ListingType, data: Dict[str, Any], db: Session)
         
         existing = (
             db.query(ApplicationMapped)
-            .filter(func.upper(ApplicationMapped.name) == func.upper(data["name"]))
+            .filter(name_equals(ApplicationMapped, data["name"]))
             .filter(ApplicationMapped.asset_owner_id == asset_owner.id)
             .first()
         )
@@ -411,6 +412,7 @@ async def add_entity(
         db.commit()
         invalidate_listing_cache_for_entity(entity)
         invalidate_location_summary_cache()
+        invalidate_detail_cache()
     except IntegrityError as e:
         db.rollback()
         # Clean up image if model creation failed
@@ -29,18 +29,19 @@ from fastapi import (
 )
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
 
 from app.core.logger import app_logger
 from app.db.session import SessionLocal
 from app.helpers.rbac_helper import AccessLevel, require_editor_or_admin
 from app.helpers.listing_types import ListingType
+from app.helpers.db_utils import name_equals
 from app.helpers.add_entity_helper import ENTITY_CREATE_HANDLERS
 from app.helpers.auth_helper import get_current_user
 from app.helpers.audit_helper import build_audit_context, log_create
-from app.helpers.email_helper import send_bulk_upload_report
+from app.helpers.email_helper import send_bulk_upload_report, submit_email_task
 from app.schemas.entity_schemas import ENTITY_CREATE_SCHEMAS
 from app.models.auth_models import User
+from app.helpers.detail_cache import invalidate_detail_cache
 from app.helpers.listing_cache import invalidate_listing_cache_for_entity
 from app.helpers.summary_cache import invalidate_location_summary_cache
 
@@ -223,7 +224,7 @@ def check_row_uniqueness_for_bulk(
             building = get_building_by_name(db, data["building_name"])
             existing = (
                 db.query(Wing)
-                .filter(func.upper(Wing.name) == func.upper(data["name"]))
+                .filter(name_equals(Wing, data["name"]))
                 .filter(Wing.location_id == location.id)
                 .filter(Wing.building_id == building.id)
                 .first()
@@ -237,7 +238,7 @@ def check_row_uniqueness_for_bulk(
             wing = get_wing_by_name(db, data["wing_name"])
             existing = (
                 db.query(Floor)
-                .filter(func.upper(Floor.name) == func.upper(data["name"]))
+                .filter(name_equals(Floor, data["name"]))
                 .filter(Floor.location_id == location.id)
                 .filter(Floor.building_id == building.id)
                 .filter(Floor.wing_id == wing.id)
@@ -253,7 +254,7 @@ def check_row_uniqueness_for_bulk(
             floor = get_floor_by_name(db, data["floor_name"])
             existing = (
                 db.query(Datacenter)
-                .filter(func.upper(Datacenter.name) == func.upper(data["name"]))
+                .filter(name_equals(Datacenter, data["name"]))
                 .filter(Datacenter.location_id == location.id)
                 .filter(Datacenter.building_id == building.id)
                 .filter(Datacenter.wing_id == wing.id)
@@ -267,7 +268,7 @@ def check_row_uniqueness_for_bulk(
             asset_owner = get_asset_owner_by_name(db, data["asset_owner_name"])
             existing = (
                 db.query(ApplicationMapped)
-                .filter(func.upper(ApplicationMapped.name) == func.upper(data["name"]))
+                .filter(name_equals(ApplicationMapped, data["name"]))
                 .filter(ApplicationMapped.asset_owner_id == asset_owner.id)
                 .first()
             )
@@ -821,7 +822,7 @@ def _process_bulk_upload_job(
                 for listing_type in [ListingType.makes, ListingType.device_types, ListingType.models]:
                     if success_data.get(listing_type.value):
                         invalidate_listing_cache_for_entity(listing_type)
-        
+
         app_logger.info(
             f"Bulk {entity_type.value} upload job completed",
             extra={
@@ -837,8 +838,14 @@ def _process_bulk_upload_job(
             extra={"job_id": job_id},
         )
     finally:
+        # Detail payloads span entity types. Rows may have been committed even
+        # when the job failed part-way (skip_errors commits per row), so they
+        # are dropped whatever the outcome.
+        invalidate_detail_cache()
         try:
-            send_bulk_upload_report(
+            # Deliver the report on the email pool; the job's worker is freed now
+            submit_email_task(
+                send_bulk_upload_report,
                 job_id=job_id,
                 summary=summary,
                 results=results,
@@ -10,11 +10,12 @@ from threading import RLock
 
 from fastapi import APIRouter, Depends, Query, Path, status, HTTPException
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc, func, exc
+from sqlalchemy import desc, exc
 
 from app.db.session import get_db
 from app.helpers.rbac_helper import AccessLevel, require_at_least_viewer
 from app.helpers.listing_types import ListingType
+from app.helpers.db_utils import name_equals
 from app.core.config import settings
 from app.models.auth_models import AuditLog, User
 from app.models.entity_models import (
@@ -66,7 +67,7 @@ def get_entity_id_by_name(db: Session, entity_type: ListingType, entity_name: st
                 detail=f"Unsupported entity type: {entity_type}",
             )
         
-        entity = db.query(model).filter(func.upper(model.name) == func.upper(normalized_name)).first()
+        entity = db.query(model).filter(name_equals(model, normalized_name)).first()
         if not entity:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -162,7 +163,7 @@ def get_change_logs(
             base_query = base_query.filter(AuditLog.object_id == object_id)
         
         if username:
-            user = db.query(User).filter(func.upper(User.name) == func.upper(username)).first()
+            user = db.query(User).filter(name_equals(User, username)).first()
             if not user:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
@@ -4,7 +4,7 @@ Supports deleting entities of any type via a single parameterized endpoint.
 """
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Path, Request, status
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -13,6 +13,7 @@ from app.helpers.rbac_helper import AccessLevel, require_admin
 from app.helpers.listing_types import ListingType
 from app.helpers.auth_helper import get_current_user
 from app.helpers.audit_helper import build_audit_context, log_delete
+from app.helpers.detail_cache import invalidate_detail_cache
 from app.helpers.listing_cache import invalidate_listing_cache_for_entity
 from app.helpers.summary_cache import invalidate_location_summary_cache
 from app.models.auth_models import User
@@ -35,6 +36,7 @@ def _get_delete_handlers():
 )
 def delete_entity(
     request: Request,
+    background_tasks: BackgroundTasks,
     entity_name: str = Path(
         ...,
         description="The name of the entity to delete",
@@ -83,7 +85,11 @@ def delete_entity(
     audit_entry = None
     # Execute delete with error handling
     try:
-        result = handler(db, entity_name)
+        if entity is ListingType.models:
+            # Model image files are unlinked after the response is sent
+            result = handler(db, entity_name, background_tasks=background_tasks)
+        else:
+            result = handler(db, entity_name)
         
         # Log the delete action to audit log
         object_id = result.get("id")
@@ -105,6 +111,7 @@ def delete_entity(
         db.commit()
         invalidate_listing_cache_for_entity(entity)
         invalidate_location_summary_cache()
+        invalidate_detail_cache()
     except IntegrityError as e:
         db.rollback()
         raise HTTPException(
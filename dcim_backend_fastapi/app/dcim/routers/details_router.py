@@ -5,13 +5,13 @@ Supports fetching single entity details by type and ID with all related data.
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.helpers.auth_helper import get_current_user
 from app.helpers.rbac_helper import AccessLevel, require_at_least_viewer
 from app.helpers.listing_types import ListingType
+from app.helpers.db_utils import name_equals
 from app.helpers.location_scope import get_allowed_location_ids
 from app.models.entity_models import Location, Building, Rack, Device, Datacenter, AssetOwner
 
@@ -25,6 +25,12 @@ def _get_detail_handlers():
     return ENTITY_DETAIL_HANDLERS
 
 
+def _get_entity_details(db: Session, entity: ListingType, name: str, handler) -> Dict[str, Any]:
+    from app.helpers.details_helper import get_entity_details
+
+    return get_entity_details(db, entity, name, handler)
+
+
 def _ensure_entity_in_location_scope(
     db: Session,
     entity: ListingType,
@@ -50,7 +56,7 @@ def _ensure_entity_in_location_scope(
 
     query = (
         db.query(location_column)
-        .filter(func.upper(model_cls.name) == func.upper(name))
+        .filter(name_equals(model_cls, name))
         .filter(location_column.in_(allowed_location_ids))
     )
 
@@ -105,7 +111,7 @@ def get_entity_details(
     allowed_location_ids = get_allowed_location_ids(current_user, access_level)
     _ensure_entity_in_location_scope(db, entity, name, allowed_location_ids)
 
-    data = handler(db, name)
+    data = _get_entity_details(db, entity, name, handler)
 
     return {
         "entity": entity,
@@ -157,9 +157,11 @@ def _export_stream(
     total_records: Optional[int] = None
 
     while True:
+        # Only the first batch needs the window-function total
         batch_total, records = handler(
             offset=offset,
             page_size=DEFAULT_EXPORT_CHUNK_SIZE,
+            include_total=total_records is None,
             **handler_kwargs,
         )
         if total_records is None:
@@ -6,7 +6,7 @@ Updated to match Alembic migrations.
 from datetime import date
 from typing import Any, Dict, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -58,6 +58,17 @@ def _parse_optional_date(value: Union[str, date, None]) -> Optional[date]:
     return value if isinstance(value, date) else None
 
 
+def _listing_response(entry: Any) -> Any:
+    """
+    Send a listing cache entry. Encoded entries (JSON bytes) go out as the
+    body unchanged, skipping jsonable_encoder and a second serialisation;
+    plain payload dicts take FastAPI's usual path.
+    """
+    if isinstance(entry, bytes):
+        return Response(content=entry, media_type="application/json")
+    return entry
+
+
 def _get_listing_handler(entity: ListingType):
     """Lazy import for heavy listing helper module."""
     from app.helpers.listing_helper import ENTITY_LIST_HANDLERS
@@ -65,6 +76,13 @@ def _get_listing_handler(entity: ListingType):
     return ENTITY_LIST_HANDLERS.get(entity)
 
 
+def _supports_keyset(entity: ListingType) -> bool:
+    """Whether the entity's handler accepts an after_id cursor."""
+    from app.helpers.listing_helper import KEYSET_LIST_ENTITIES
+
+    return entity in KEYSET_LIST_ENTITIES
+
+
 @router.get(
     "/list",
     response_model=Dict[str, Any],
@@ -80,6 +98,15 @@ def list_dcim_entities(
     ),
     offset: int = Query(0, ge=0, description="Offset for pagination (0-based)"),
     page_size: int = Query(10, ge=1, le=100, description="Page size for pagination (max 100)"),
+    after_id: Optional[int] = Query(
+        None,
+        ge=0,
+        description=(
+            "Keyset cursor: return rows with id greater than this (offset is ignored). "
+            "Pass the previous response's next_cursor. "
+            "Supported for locations, buildings, racks, devices and datacenters"
+        ),
+    ),
     # Location filters
     location_name: Optional[str] = Query(None, description="Filter by location name"),
     location_description: Optional[str] = Query(None, description="Filter by location description"),
@@ -141,7 +168,9 @@ def list_dcim_entities(
     Single endpoint to list different DCIM entities with aggregates and derived fields.
     
     Supports:
-    - Pagination via offset/page_size
+    - Pagination via offset/page_size, or via after_id/next_cursor for
+      locations, buildings, racks, devices and datacenters (constant cost on
+      deep pages)
     - Filtering by location_name, building_name, wing_name, floor_name, rack_name, device_name, device_type, make_name, model_name, datacenter_name
     - Role-based access control (viewer, editor, admin)
     
@@ -246,6 +275,14 @@ def list_dcim_entities(
         'application_description': _normalize_empty_to_none(application_description),
     }
     
+    # Handlers without keyset support page by offset only. Ignoring the cursor
+    # would serve the offset page again with no next_cursor, so reject it.
+    if after_id is not None and not _supports_keyset(entity):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"after_id is not supported for entity type: {entity.value}",
+        )
+
     # Build cache key with all parameters
     cache_key = build_listing_cache_key(
         entity=entity,
@@ -253,13 +290,26 @@ def list_dcim_entities(
         page_size=page_size,
         user_id=getattr(current_user, "id", None),
         access_level=getattr(access_level, "value", str(access_level)),
+        after_id=after_id,
         **filter_params,
     )
 
     # Check cache first
-    cached_payload = listing_cache.get(cache_key)
-    if cached_payload:
-        return cached_payload
+    cached_entry = listing_cache.get_entry(cache_key)
+    if cached_entry is not None:
+        return _listing_response(cached_entry)
+
+    # The total only depends on the filters, so any page (or page size) of the
+    # same listing can reuse it and skip the COUNT(*) OVER() window
+    total_cache_key = build_listing_cache_key(
+        entity=entity,
+        offset=0,
+        page_size=0,
+        user_id=getattr(current_user, "id", None),
+        access_level=getattr(access_level, "value", str(access_level)),
+        **filter_params,
+    )
+    cached_total = listing_cache.get(total_cache_key)
 
     # Get handler
     handler = _get_listing_handler(entity)
@@ -275,8 +325,14 @@ def list_dcim_entities(
         offset=offset,
         page_size=page_size,
         allowed_location_ids=allowed_location_ids,
+        include_total=cached_total is None,
+        after_id=after_id,
         **filter_params,
     )
+    if cached_total is None:
+        listing_cache.set(total_cache_key, {"total": total}, entity=entity)
+    else:
+        total = cached_total["total"]
 
     response_payload = {
         "entity": entity,
@@ -285,7 +341,12 @@ def list_dcim_entities(
         "total": total,
         "results": data,
     }
+    if _supports_keyset(entity):
+        # A short page is the last one
+        response_payload["next_cursor"] = (
+            data[-1]["id"] if len(data) == page_size else None
+        )
 
-    listing_cache.set(cache_key, response_payload, entity=entity)
+    entry = listing_cache.set(cache_key, response_payload, entity=entity)
 
-    return response_payload
+    return _listing_response(response_payload if entry is None else entry)
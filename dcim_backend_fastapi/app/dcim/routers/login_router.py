@@ -6,13 +6,14 @@ from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from app.db.session import get_db
 from app.helpers.auth_helper import (
     build_menu_for_user,
     create_access_token_for_user,
     create_token_pair_for_user,
+    get_active_role_codes,
     get_current_user,
     get_current_refresh_token,
 )
@@ -34,11 +35,7 @@ def _get_auth_models():
 
 
 def _build_configure_flags(user: models.User) -> schemas.ConfigureFlags:
-    role_codes = {
-        (ur.role.code or "").upper()
-        for ur in user.user_roles
-        if ur.role and ur.role.code and ur.role.is_active
-    }
+    role_codes = get_active_role_codes(user)
     has_admin = "ADMIN" in role_codes
     has_editor = "EDITOR" in role_codes
     has_viewer = "VIEWER" in role_codes
@@ -86,6 +83,7 @@ def login(
 
     user = (
         db.query(models.User)
+        .options(selectinload(models.User.user_roles).selectinload(models.UserRole.role))
         .filter(models.User.name == auth_user)
         .first()
     )
@@ -111,7 +109,7 @@ def login(
     access_token, refresh_token = create_token_pair_for_user(user=user, db=db)
 
     # Build RBAC menu
-    menu = build_menu_for_user(db, user.id)
+    menu = build_menu_for_user(db, user.id, user=user)
 
     # Update last_login (use current time)
     user.last_login = datetime.utcnow()
@@ -173,7 +171,7 @@ def refresh_token(
     db.refresh(user)
 
     # Rebuild menu
-    menu = build_menu_for_user(db, user.id)
+    menu = build_menu_for_user(db, user.id, user=user)
 
     return schemas.LoginResponse(
         access_token=new_access,
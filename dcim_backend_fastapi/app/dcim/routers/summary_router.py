@@ -1,7 +1,7 @@
 from functools import lru_cache
 from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
@@ -25,6 +25,13 @@ def _get_entity_models():
 router = APIRouter(prefix="/api/dcim", tags=["DCIM Listings"])
 
 
+def _summary_response(entry: Any) -> Any:
+    """Send cached JSON bytes as the body unchanged; dicts take FastAPI's path."""
+    if isinstance(entry, bytes):
+        return Response(content=entry, media_type="application/json")
+    return entry
+
+
 @router.get(
     "/summary/locations",
     response_model=Dict[str, Any],
@@ -50,7 +57,7 @@ def get_location_summary(
 
     cached = get_cached_location_summary() if use_cache else None
     if cached:
-        return cached
+        return _summary_response(cached)
 
     models = _get_entity_models()
     Location = models.Location
@@ -112,5 +119,5 @@ def get_location_summary(
         "results": results,
     }
     if use_cache:
-        set_cached_location_summary(payload)
+        return _summary_response(set_cached_location_summary(payload))
     return payload
@@ -14,6 +14,7 @@ from app.helpers.rbac_helper import AccessLevel, require_editor_or_admin
 from app.helpers.listing_types import ListingType
 from app.helpers.auth_helper import get_current_user
 from app.helpers.audit_helper import build_audit_context, log_update
+from app.helpers.detail_cache import invalidate_detail_cache
 from app.helpers.listing_cache import invalidate_listing_cache_for_entity
 from app.helpers.summary_cache import invalidate_location_summary_cache
 from app.models.auth_models import User
@@ -251,6 +252,7 @@ async def update_entity(
         db.commit()
         invalidate_listing_cache_for_entity(entity)
         invalidate_location_summary_cache()
+        invalidate_detail_cache()
     except IntegrityError as e:
         db.rollback()
         raise HTTPException(
@@ -2,21 +2,35 @@
 from __future__ import annotations
 
 import secrets
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, TYPE_CHECKING
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, TypeVar, TYPE_CHECKING
 
 import jwt
+from jwt import api_jws
 from fastapi import Depends, Header, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import settings
 from app.db.session import get_db  # Centralized DB dependency
+from app.helpers.menu_cache import get_cached_menu, set_cached_menu
+
+try:  # orjson is optional; fall back to PyJWT's stdlib json serialisation
+    import orjson
+except ImportError:  # pragma: no cover - depends on the deployment image
+    orjson = None
 
 if TYPE_CHECKING:  # pragma: no cover - typing only
     from app.models import auth_models as models
 
 _auth_models_module = None
 
+T = TypeVar("T")
+
 
 def _get_models():
     """Lazy-load auth models to avoid importing heavy SQLAlchemy definitions at startup."""
@@ -28,15 +42,123 @@ def _get_models():
     return _auth_models_module
 
 
+@lru_cache(maxsize=1)
+def _jwt_signing_params() -> Tuple[bytes, str, Tuple[str, ...]]:
+    """
+    Resolve the JWT key/algorithm once per process.
+
+    Returns the secret already encoded to bytes (PyJWT's HMAC signer works on
+    bytes) plus the algorithm and the accepted-algorithms tuple for decode.
+    """
+    algorithm = settings.JWT_ALGORITHM
+    return settings.JWT_SECRET_KEY.encode("utf-8"), algorithm, (algorithm,)
+
+
+class _DecodedToken:
+    """A verified token's claims plus values derived from them (see
+    derive_from_access_token), which live and die with the entry."""
+
+    __slots__ = ("exp", "payload", "derived")
+
+    def __init__(self, exp: Optional[int], payload: Dict[str, Any]) -> None:
+        self.exp = exp
+        self.payload = payload
+        self.derived: Dict[str, Any] = {}
+
+    def is_expired(self) -> bool:
+        return self.exp is not None and self.exp <= time.time()
+
+
+class _DecodedTokenCache:
+    """
+    Small LRU of already-verified JWT payloads keyed by the raw token string.
+
+    The same bearer token is presented on every request until it expires, so
+    verifying the signature once and remembering the claims avoids repeating
+    the HMAC + JSON decode. Only successfully verified tokens are stored;
+    expiry is re-checked on every hit.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._store: "OrderedDict[str, _DecodedToken]" = OrderedDict()
+
+    def get(self, token: str) -> Optional[_DecodedToken]:
+        with self._lock:
+            record = self._store.get(token)
+            if record is not None:
+                self._store.move_to_end(token)
+            return record
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        max_entries = settings.JWT_DECODE_CACHE_MAX_ENTRIES
+        if max_entries <= 0:
+            return
+
+        exp = payload.get("exp")
+        record = _DecodedToken(int(exp) if isinstance(exp, (int, float)) else None, payload)
+        with self._lock:
+            self._store[token] = record
+            self._store.move_to_end(token)
+            while len(self._store) > max_entries:
+                self._store.popitem(last=False)
+
+    def discard(self, token: str) -> None:
+        with self._lock:
+            self._store.pop(token, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
+
+_decoded_token_cache = _DecodedTokenCache()
+
+
+def _load_user_with_roles(db: Session, user_id: int) -> "models.User | None":
+    """
+    Load a user with its roles eagerly populated.
+
+    `user_roles` and each `role` are fetched with SELECT ... IN batches so
+    iterating the roles afterwards (JWT claims, admin checks, menu build)
+    costs two extra queries in total instead of one per role.
+    """
+    models = _get_models()
+    return db.get(
+        models.User,
+        user_id,
+        options=[selectinload(models.User.user_roles).selectinload(models.UserRole.role)],
+    )
+
+
+def _load_active_role_codes(db: Session, user_id: int) -> FrozenSet[str]:
+    """
+    Upper-cased active role codes for a user, straight from SQL.
+
+    Same set as get_active_role_codes() but as one column-only query, for
+    callers that only need the roles and would otherwise load the User and
+    its UserRole/Role entities just to iterate them.
+    """
+    models = _get_models()
+    codes = db.scalars(
+        select(func.upper(models.Role.code))
+        .join(models.UserRole, models.UserRole.role_id == models.Role.id)
+        .where(models.UserRole.user_id == user_id)
+        .where(models.Role.is_active == True)
+        .where(models.Role.code.is_not(None))
+    ).all()
+    return frozenset(codes)
+
+
 def _get_token_from_header(authorization: str | None) -> str:
     if not authorization:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authorization header missing",
         )
-    scheme, _, token_str = authorization.partition(" ")
-    token_str = token_str.strip()
-    if scheme.lower() != "bearer" or not token_str:
+    # "Bearer <token>": check the 7-char scheme prefix and slice off the token
+    token_str = authorization[7:].strip() if authorization[:7].lower() == "bearer " else ""
+    if not token_str:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authorization header format",
@@ -44,6 +166,25 @@ def _get_token_from_header(authorization: str | None) -> str:
     return token_str
 
 
+def get_active_role_codes(user: "models.User") -> FrozenSet[str]:
+    """
+    Upper-cased codes of the user's active roles.
+
+    JWT claims, configure flags and the menu admin check all need this set
+    during the same request, so it is computed once and memoised on the user
+    instance (which lives no longer than its session).
+    """
+    role_codes = getattr(user, "_active_role_codes", None)
+    if role_codes is None:
+        role_codes = frozenset(
+            ur.role.code.upper()
+            for ur in (user.user_roles or [])
+            if ur.role and ur.role.is_active and ur.role.code
+        )
+        user._active_role_codes = role_codes
+    return role_codes
+
+
 def _build_jwt_payload(user: "models.User") -> Dict[str, Any]:
     """
     Build JWT claims for a user including RBAC/role information.
@@ -55,15 +196,10 @@ def _build_jwt_payload(user: "models.User") -> Dict[str, Any]:
     - is_active flag
     - iat / exp based on ACCESS_TOKEN_EXPIRE_SECONDS
     """
-    # Collect active role codes for the user
-    role_codes = {
-        (ur.role.code or "").upper()
-        for ur in (user.user_roles or [])
-        if ur.role and ur.role.is_active and ur.role.code
-    }
+    role_codes = get_active_role_codes(user)
 
-    now = datetime.now(timezone.utc)
-    expire_at = now + timedelta(seconds=settings.ACCESS_TOKEN_EXPIRE_SECONDS)
+    # Claims are plain epoch seconds, so a single clock read is enough
+    issued_at = int(time.time())
 
     return {
         "sub": str(user.id),
@@ -71,8 +207,8 @@ def _build_jwt_payload(user: "models.User") -> Dict[str, Any]:
         "email": user.email,
         "roles": sorted(role_codes),
         "is_active": bool(user.is_active),
-        "iat": int(now.timestamp()),
-        "exp": int(expire_at.timestamp()),
+        "iat": issued_at,
+        "exp": issued_at + settings.ACCESS_TOKEN_EXPIRE_SECONDS,
     }
 
 
@@ -84,10 +220,15 @@ def create_access_token_for_user(*, user: "models.User") -> str:
     persisted. All RBAC/user details are embedded as claims.
     """
     payload = _build_jwt_payload(user)
+    key, algorithm, _ = _jwt_signing_params()
+    if orjson is not None:
+        # Claims are plain str/int/bool/list values, so orjson can serialise
+        # them directly; PyJWS still builds the header and signs the bytes.
+        return api_jws.encode(orjson.dumps(payload), key, algorithm=algorithm)
     token = jwt.encode(
         payload,
-        settings.JWT_SECRET_KEY,
-        algorithm=settings.JWT_ALGORITHM,
+        key,
+        algorithm=algorithm,
     )
     return token
 
@@ -96,17 +237,29 @@ def decode_access_token(token: str) -> Dict[str, Any]:
     """
     Decode and validate a JWT access token.
 
-    - Returns payload on success
+    - Returns payload on success (verified payloads are cached per token)
     - Raises HTTPException(419) if token is expired
     - Raises HTTPException(401) for other validation errors
     """
+    cached = _decoded_token_cache.get(token)
+    if cached is not None:
+        if cached.is_expired():
+            _decoded_token_cache.discard(token)
+            raise HTTPException(
+                status_code=419,
+                detail="Access token expired",
+            )
+        return dict(cached.payload)
+
+    key, _, algorithms = _jwt_signing_params()
     try:
         payload = jwt.decode(
             token,
-            settings.JWT_SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM],
+            key,
+            algorithms=algorithms,
         )
-        return payload
+        _decoded_token_cache.set(token, payload)
+        return dict(payload)
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=419,
@@ -119,6 +272,35 @@ def decode_access_token(token: str) -> Dict[str, Any]:
         )
 
 
+def derive_from_access_token(
+    token: str,
+    name: str,
+    derive: Callable[[Dict[str, Any]], T],
+) -> T:
+    """
+    Validate `token` like decode_access_token and return derive(payload).
+
+    The result is stored under `name` on the token's decode-cache entry, so it
+    is computed once per token, shares that cache's size
+    (JWT_DECODE_CACHE_MAX_ENTRIES), eviction and expiry check, and is dropped
+    with it. `derive` receives the cached claims and must not modify them.
+    """
+    cached = _decoded_token_cache.get(token)
+    if cached is None or cached.is_expired():
+        # Verifies the signature, or raises 419 for an expired cached entry
+        payload = decode_access_token(token)
+        cached = _decoded_token_cache.get(token)
+        if cached is None:
+            # Decode cache disabled
+            return derive(payload)
+
+    try:
+        return cached.derived[name]
+    except KeyError:
+        value = cached.derived[name] = derive(cached.payload)
+        return value
+
+
 def get_current_refresh_token(
     db: Session = Depends(get_db),
     authorization: str | None = Header(None, alias="Authorization"),
@@ -132,7 +314,18 @@ def get_current_refresh_token(
     token_key = _get_token_from_header(authorization)
 
     # Look up by token key first to avoid being overly strict on token_type filtering.
-    token = db.query(models.Token).filter(models.Token.token_key == token_key).first()
+    # The refresh flow re-issues a JWT from token.user, so pull user + roles in
+    # with the token instead of lazy-loading them one by one later.
+    token = (
+        db.query(models.Token)
+        .options(
+            selectinload(models.Token.user)
+            .selectinload(models.User.user_roles)
+            .selectinload(models.UserRole.role)
+        )
+        .filter(models.Token.token_key == token_key)
+        .first()
+    )
 
     if not token:
         raise HTTPException(
@@ -176,7 +369,6 @@ def get_current_user(
             detail="Access token missing subject",
         )
 
-    models = _get_models()
     try:
         user_id_int = int(user_id)
     except (TypeError, ValueError):
@@ -185,7 +377,7 @@ def get_current_user(
             detail="Invalid user identifier in token",
         )
 
-    user = db.query(models.User).get(user_id_int)
+    user = _load_user_with_roles(db, user_id_int)
     if not user or not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -193,63 +385,101 @@ def get_current_user(
         )
     return user
 
-def build_menu_for_user(db: Session, user_id: int):
+
+MenuRows = Tuple[Tuple[str, Optional[str], Tuple[Tuple[str, Optional[str], Optional[str]], ...]], ...]
+
+
+def build_menu_for_user(
+    db: Session,
+    user_id: int,
+    user: "models.User | None" = None,
+):
+    """
+    Build the RBAC-filtered menu for a user in a single query.
+
+    Only the columns the payload needs are selected (no ORM entities),
+    and the non-admin role filter is a semi-join on visible sub-menu ids so a
+    sub-menu granted by several roles comes back once. Pass `user` when the
+    caller already holds it (with roles loaded); otherwise only the active
+    role codes are read, never the user entity.
+    Results are cached per role set (see menu_cache).
+    """
+    # Role codes only: no User/UserRole/Role rows are needed for the menu
+    if user is not None:
+        role_codes = get_active_role_codes(user)
+    else:
+        role_codes = _load_active_role_codes(db, user_id)
+    is_admin = "ADMIN" in role_codes
+
+    # Every admin sees the same menu; other menus depend on the user's role grants
+    cache_key = ("admin",) if is_admin else ("user", user_id, tuple(sorted(role_codes)))
+    menu_rows = get_cached_menu(cache_key)
+    if menu_rows is None:
+        menu_rows = _load_menu_rows(db, user_id, is_admin)
+        set_cached_menu(cache_key, menu_rows)
+    return _menu_payload(menu_rows)
+
+
+def _load_menu_rows(db: Session, user_id: int, is_admin: bool) -> MenuRows:
+    """
+    Fetch visible menus as nested tuples:
+    ((header_name, icon, ((display_name, page_url, icon), ...)), ...).
+
+    Tuples are cheaper to build than per-row dicts and are immutable, so the
+    menu cache can share them between requests without copying.
+    """
     models = _get_models()
-    # Load user + roles
-    user = db.query(models.User).get(user_id)
-
-    is_admin = False
-    if user:
-        for ur in user.user_roles:
-            if ur.role and ur.role.code and ur.role.code.upper() == "ADMIN":
-                is_admin = True
-                break
-
-    if is_admin:
-        # Super admin → see ALL active menus & sub_menus
-        rows = (
-            db.query(models.Menu, models.SubMenu)
-            .join(models.SubMenu, models.SubMenu.menu_id == models.Menu.id)
-            .filter(models.Menu.is_active == True)
-            .filter(models.SubMenu.is_active == True)
-            .order_by(models.Menu.sort_order, models.SubMenu.sort_order)
-            .all()
+    query = (
+        db.query(
+            models.Menu.id,
+            models.Menu.header_name,
+            models.Menu.icon.label("menu_icon"),
+            models.SubMenu.display_name,
+            models.SubMenu.page_url,
+            models.SubMenu.icon.label("sub_menu_icon"),
         )
-    else:
-        # Normal RBAC-filtered menu (only active menus/submenus)
-        rows = (
-            db.query(models.Menu, models.SubMenu)
-            .join(models.SubMenu, models.SubMenu.menu_id == models.Menu.id)
-            .join(models.RoleSubMenuAccess, models.RoleSubMenuAccess.sub_menu_id == models.SubMenu.id)
+        .join(models.SubMenu, models.SubMenu.menu_id == models.Menu.id)
+        .filter(models.Menu.is_active == True)
+        .filter(models.SubMenu.is_active == True)
+    )
+    if not is_admin:
+        # Normal RBAC-filtered menu; super admin sees ALL active menus & sub_menus
+        visible_sub_menu_ids = (
+            select(models.RoleSubMenuAccess.sub_menu_id)
             .join(models.UserRole, models.UserRole.role_id == models.RoleSubMenuAccess.role_id)
-            .filter(models.UserRole.user_id == user_id)
-            .filter(models.RoleSubMenuAccess.can_view == 1)
-            .filter(models.Menu.is_active == True)
-            .filter(models.SubMenu.is_active == True)
-            .order_by(models.Menu.sort_order, models.SubMenu.sort_order)
-            .all()
+            .where(models.UserRole.user_id == user_id)
+            .where(models.RoleSubMenuAccess.can_view == 1)
         )
+        query = query.filter(models.SubMenu.id.in_(visible_sub_menu_ids))
 
-    menu_dict = {}
+    rows = query.order_by(models.Menu.sort_order, models.SubMenu.sort_order).all()
 
-    for menu, sub in rows:
-        key = menu.header_name
-        if key not in menu_dict:
-            menu_dict[key] = {
-                "MenuHeaderName": menu.header_name,
-                "icon": menu.icon,
-                "sub_menu_details": [],
-            }
+    # Keyed by Menu.id; dict insertion order keeps the SQL sort order
+    menus: Dict[int, Tuple[str, Optional[str], list]] = {}
+    for menu_id, header_name, menu_icon, display_name, page_url, sub_menu_icon in rows:
+        entry = menus.get(menu_id)
+        if entry is None:
+            entry = menus[menu_id] = (header_name, menu_icon, [])
+        entry[2].append((display_name, page_url, sub_menu_icon))
+
+    return tuple((header, icon, tuple(subs)) for header, icon, subs in menus.values())
 
-        menu_dict[key]["sub_menu_details"].append(
+
+def _menu_payload(menu_rows: MenuRows) -> Dict[str, Any]:
+    """Expand cached menu tuples into the `menuList` response shape."""
+    return {
+        "menuList": [
             {
-                "display_name": sub.display_name,
-                "page_url": sub.page_url,
-                "icon": sub.icon,
+                "MenuHeaderName": header_name,
+                "icon": menu_icon,
+                "sub_menu_details": [
+                    {"display_name": display_name, "page_url": page_url, "icon": sub_menu_icon}
+                    for display_name, page_url, sub_menu_icon in sub_menus
+                ],
             }
-        )
-
-    return {"menuList": list(menu_dict.values())}
+            for header_name, menu_icon, sub_menus in menu_rows
+        ]
+    }
 
 
 def create_token_for_user(
@@ -260,18 +490,21 @@ def create_token_for_user(
     token_type: str = "refresh",
 ) -> "models.Token":
     models = _get_models()
-    token_key = secrets.token_hex(32)
+    token_key = secrets.token_urlsafe(32)
+
+    now = datetime.utcnow()
 
     token = models.Token(
         token_key=token_key,
         user_id=user.id,
-        created=datetime.utcnow(),
-        expires=datetime.utcnow() + timedelta(seconds=expires_in),
+        created=now,
+        expires=now + timedelta(seconds=expires_in),
         token_type=token_type,
     )
     db.add(token)
     db.commit()
-    db.refresh(token)
+    # No db.refresh(): every column was set above, and the expired instance
+    # reloads lazily only if a caller actually reads it after the commit.
     return token
 
 
@@ -5,11 +5,13 @@ Reduces code duplication and improves performance.
 """
 from typing import TypeVar, Type, Optional, Dict, Any, List, Tuple
 from contextlib import contextmanager
+from functools import lru_cache
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, exc
-from sqlalchemy.orm import Session, Query
+from sqlalchemy import bindparam, func, exc, select
+from sqlalchemy.orm import Session, Query, load_only
 
+from app.core.logger import app_logger
 from app.models.entity_models import (
     Location, Building, Wing, Floor, Datacenter,
     Rack, Device, DeviceType, Make, Model,
@@ -20,6 +22,73 @@ from app.models.entity_models import (
 ModelType = TypeVar('ModelType')
 
 
+def upper_value(value: Any):
+    """
+    Upper-cased operand for comparing against UPPER(column).
+
+    ASCII strings are upper-cased in Python and bound directly, so the
+    database only applies UPPER() to the column. Other strings (and bound
+    parameters) stay wrapped in UPPER() because str.upper() and Oracle's
+    UPPER() disagree on some non-ASCII characters (e.g. 'ß').
+    """
+    if isinstance(value, str) and value.isascii():
+        return value.upper()
+    return func.upper(value)
+
+
+def name_equals(model_class: Type[ModelType], name: Any):
+    """
+    Case-insensitive name predicate: UPPER(name) = UPPER(:name).
+
+    Keep name lookups on this exact form - it is what the UPPER(name)
+    function-based indexes (migration 024) are built on, so Oracle can do an
+    index range scan instead of a full table scan. The right-hand side comes
+    from `upper_value`.
+    """
+    return func.upper(model_class.name) == upper_value(name)
+
+
+def child_count(child_fk, parent_id):
+    """
+    Correlated `(SELECT COUNT(*) FROM child WHERE child.fk = parent.id)`.
+
+    Added as an extra column on a parent query so per-parent counts come back
+    in the same round trip and are only evaluated for the rows returned,
+    rather than aggregating the whole child table up front. Only the parent
+    is correlated, so the count stays correct when the outer query also
+    joins the child table (e.g. for a child-name filter).
+    """
+    return (
+        select(func.count())
+        .where(child_fk == parent_id)
+        .correlate_except(child_fk.expression.table)
+        .scalar_subquery()
+    )
+
+
+@lru_cache(maxsize=None)
+def select_by_name(model_class: Type[ModelType], *columns: str):
+    """
+    Prebuilt `SELECT ... WHERE UPPER(name) = UPPER(:entity_name) LIMIT 1`.
+
+    Built once per (model, columns) and executed with the name as a bound
+    parameter, so repeated lookups reuse the same statement object and its
+    compiled form. Pass column names to restrict the load via load_only().
+    """
+    stmt = select(model_class)
+    if columns:
+        stmt = stmt.options(load_only(*(getattr(model_class, column) for column in columns)))
+    return stmt.where(name_equals(model_class, bindparam("entity_name"))).limit(1)
+
+
+@lru_cache(maxsize=None)
+def _select_id_by_name(model_class: Type[ModelType], exclude_id: bool):
+    stmt = select(model_class.id).where(name_equals(model_class, bindparam("entity_name")))
+    if exclude_id:
+        stmt = stmt.where(model_class.id != bindparam("exclude_id"))
+    return stmt.limit(1)
+
+
 def get_entity_by_name(
     db: Session,
     model_class: Type[ModelType],
@@ -42,11 +111,7 @@ def get_entity_by_name(
         HTTPException: If entity not found
     """
     try:
-        entity = (
-            db.query(model_class)
-            .filter(func.upper(model_class.name) == func.upper(name))
-            .first()
-        )
+        entity = db.scalars(select_by_name(model_class), {"entity_name": name}).first()
         if not entity:
             msg = error_message or f"{model_class.__name__} with name '{name}' not found"
             raise HTTPException(
@@ -80,10 +145,11 @@ def check_entity_exists(
         True if entity exists, False otherwise
     """
     try:
-        query = db.query(model_class).filter(func.upper(model_class.name) == func.upper(name))
+        params: Dict[str, Any] = {"entity_name": name}
         if exclude_id:
-            query = query.filter(model_class.id != exclude_id)
-        return query.first() is not None
+            params["exclude_id"] = exclude_id
+        stmt = _select_id_by_name(model_class, bool(exclude_id))
+        return db.execute(stmt, params).first() is not None
     except exc.SQLAlchemyError:
         return False
 
@@ -114,33 +180,28 @@ def batch_get_entities_by_name(
     # Fetch each model type in batch
     for model_class, names in by_model.items():
         try:
-            # Use IN clause for batch lookup
-            entities = (
-                db.query(model_class)
-                .filter(
-                    func.upper(model_class.name).in_([n.upper() for n in names])
-                )
-                .all()
-            )
+            # Use IN clause for batch lookup (de-duplicated to keep the bind list short)
+            upper_names = sorted({n.upper() for n in names})
+            entities = db.scalars(
+                select(model_class).where(func.upper(model_class.name).in_(upper_names))
+            ).all()
             
             # Create lookup map (case-insensitive)
             entity_map = {e.name.upper(): e for e in entities}
             
-            # Map results
-            for model_class_inner, name in lookups:
-                if model_class_inner == model_class:
-                    upper_name = name.upper()
-                    if upper_name in entity_map:
-                        result[(model_class_inner, name)] = entity_map[upper_name]
+            # Map results for this model's names only
+            for name in names:
+                entity = entity_map.get(name.upper())
+                if entity is not None:
+                    result[(model_class, name)] = entity
         except exc.SQLAlchemyError:
             # If batch fails, fall back to individual lookups
-            for model_class_inner, name in lookups:
-                if model_class_inner == model_class:
-                    try:
-                        entity = get_entity_by_name(db, model_class_inner, name)
-                        result[(model_class_inner, name)] = entity
-                    except HTTPException:
-                        pass
+            for name in names:
+                try:
+                    entity = get_entity_by_name(db, model_class, name)
+                    result[(model_class, name)] = entity
+                except HTTPException:
+                    pass
     
     return result
 
@@ -162,27 +223,57 @@ def db_operation(db: Session, operation_name: str = "database operation"):
         raise
     except exc.IntegrityError as e:
         db.rollback()
+        app_logger.warning("Integrity error during %s", operation_name, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=f"Database integrity error during {operation_name}: {str(e)}",
-        )
+            detail=f"Database integrity error during {operation_name}",
+        ) from e
     except exc.SQLAlchemyError as e:
         db.rollback()
+        app_logger.exception("Database error during %s", operation_name)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Database error during {operation_name}: {str(e)}",
-        )
-    except Exception as e:
+            detail=f"{operation_name} failed",
+        ) from e
+    except BaseException:
+        # Anything else propagates unchanged (FastAPI turns it into a 500
+        # with the original traceback); just don't leave the session dirty.
         db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Unexpected error during {operation_name}: {str(e)}",
-        )
+        raise
+
+
+def _flat_count_statement(query: Query):
+    """
+    Return `SELECT count(*) FROM <from> WHERE ...` for a plain query, or None
+    when the query shape needs the subquery wrapper (DISTINCT, GROUP BY/HAVING,
+    LIMIT/OFFSET or more than one FROM).
+    """
+    stmt = query.enable_eagerloads(False).statement
+    if (
+        getattr(stmt, "_distinct", True)
+        or getattr(stmt, "_group_by_clauses", True)
+        or getattr(stmt, "_having_criteria", True)
+        or getattr(stmt, "_limit_clause", None) is not None
+        or getattr(stmt, "_offset_clause", None) is not None
+    ):
+        return None
+
+    froms = stmt.get_final_froms()
+    if len(froms) != 1:
+        return None
+
+    count_stmt = select(func.count()).select_from(froms[0])
+    if stmt.whereclause is not None:
+        count_stmt = count_stmt.where(stmt.whereclause)
+    return count_stmt
 
 
 def optimize_count_query(db: Session, query: Query) -> int:
     """
-    Optimize count query by using subquery when possible.
+    Count the rows of a query with the cheapest statement that is correct.
+
+    Plain queries are counted directly against their FROM clause; anything
+    with DISTINCT/GROUP BY/LIMIT is wrapped as a subquery.
     
     Args:
         db: Database session
@@ -192,9 +283,10 @@ def optimize_count_query(db: Session, query: Query) -> int:
         Count result
     """
     try:
-        # Use subquery for better performance on complex queries
-        return db.query(func.count()).select_from(query.subquery()).scalar() or 0
-    except Exception:
+        count_stmt = _flat_count_statement(query)
+        if count_stmt is None:
+            count_stmt = select(func.count()).select_from(query.subquery())
+        return db.execute(count_stmt).scalar() or 0
+    except exc.SQLAlchemyError:
         # Fallback to regular count
         return query.count()
-
@@ -5,14 +5,15 @@ Contains all entity-specific deletion logic with validation.
 Updated to match Alembic migrations.
 Optimized: Uses utility functions, proper exception handling.
 """
-from typing import Any, Dict, Callable
+from functools import partial
+from typing import Any, Dict, Callable, Optional, Sequence, Tuple, Type
 
-from fastapi import HTTPException, status
-from sqlalchemy import func, exc
+from fastapi import BackgroundTasks, HTTPException, status
+from sqlalchemy import exc
 from sqlalchemy.orm import Session
 
 from app.helpers.listing_types import ListingType
-from app.helpers.db_utils import get_entity_by_name, db_operation
+from app.helpers.db_utils import get_entity_by_name, db_operation, select_by_name
 from app.helpers.rack_capacity_helper import release_rack_capacity
 from app.helpers.image_helper import delete_device_image
 from app.models.entity_models import (
@@ -32,105 +33,71 @@ from app.models.entity_models import (
 
 
 # =============================================================================
-# Entity-specific delete functions
+# Generic delete
 # =============================================================================
 
-def delete_location(db: Session, entity_name: str) -> Dict[str, Any]:
-    """Delete a location by name with proper exception handling."""
-    with db_operation(db, "delete location"):
-        location = get_entity_by_name(db, Location, entity_name)
-        
-        location_data = {
-            "id": location.id,
-            "name": location.name,
-        }
-        
-        db.delete(location)
-        db.commit()
-        
-        return location_data
+# Entities whose delete is "look up by name, snapshot a few columns, delete".
+# Each spec is (model class, label used in the 404 message, columns returned).
+ENTITY_DELETE_SPECS: Dict[ListingType, Tuple[Type[Any], str, Tuple[str, ...]]] = {
+    ListingType.locations: (Location, "Location", ("id", "name")),
+    ListingType.buildings: (Building, "Building", ("id", "name", "status", "location_id")),
+    ListingType.wings: (Wing, "Wing", ("id", "name")),
+    ListingType.floors: (Floor, "Floor", ("id", "name")),
+    ListingType.datacenters: (Datacenter, "Datacenter", ("id", "name")),
+    ListingType.racks: (Rack, "Rack", ("id", "name", "building_id", "location_id", "status")),
+    ListingType.device_types: (DeviceType, "Device type", ("id", "name", "make_id")),
+    ListingType.asset_owner: (AssetOwner, "Asset owner", ("id", "name", "location_id")),
+    ListingType.makes: (Make, "Make", ("id", "name")),
+    ListingType.applications: (ApplicationMapped, "Application", ("id", "name")),
+}
+
 
+def _get_for_delete(
+    db: Session,
+    model_class: Type[Any],
+    entity_name: str,
+    label: str,
+    columns: Sequence[str],
+) -> Any:
+    """
+    Fetch an entity by name (case-insensitive) loading only the given columns.
 
-def delete_building(db: Session, entity_name: str) -> Dict[str, Any]:
-    """Delete a building by name."""
-    building = db.query(Building).filter(func.upper(Building.name) == func.upper(entity_name)).first()
-    if not building:
+    Deletes only need the primary key plus the few fields echoed back to the
+    caller, so the rest of the row is deferred. The ORM instance is kept
+    (rather than a Core DELETE by id) so relationship cascades still apply.
+    """
+    entity = db.scalars(
+        select_by_name(model_class, *columns), {"entity_name": entity_name}
+    ).first()
+    if not entity:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Building with name '{entity_name}' not found",
+            detail=f"{label} with name '{entity_name}' not found",
         )
-    
-    building_data = {
-        "id": building.id,
-        "name": building.name,
-        "status": building.status,
-        "location_id": building.location_id,
-    }
-    
-    db.delete(building)
-    db.commit()
-    
-    return building_data
-
-
-def delete_wing(db: Session, entity_name: str) -> Dict[str, Any]:
-    """Delete a wing by name."""
-    wing = db.query(Wing).filter(func.upper(Wing.name) == func.upper(entity_name)).first()
-    if not wing:
-        raise HTTPException(status_code=404, detail=f"Wing with name '{entity_name}' not found")
-    
-    wing_data = {"id": wing.id, "name": wing.name}
-    db.delete(wing)
+    return entity
+
+
+def delete_entity(
+    db: Session,
+    entity_name: str,
+    *,
+    model_class: Type[Any],
+    label: str,
+    columns: Sequence[str],
+) -> Dict[str, Any]:
+    """Delete an entity by name and return the requested columns."""
+    entity = _get_for_delete(db, model_class, entity_name, label, columns)
+    entity_data = {column: getattr(entity, column) for column in columns}
+
+    db.delete(entity)
     db.commit()
-    return wing_data
-
 
-def delete_floor(db: Session, entity_name: str) -> Dict[str, Any]:
-    """Delete a floor by name."""
-    floor = db.query(Floor).filter(func.upper(Floor.name) == func.upper(entity_name)).first()
-    if not floor:
-        raise HTTPException(status_code=404, detail=f"Floor with name '{entity_name}' not found")
-    
-    floor_data = {"id": floor.id, "name": floor.name}
-    db.delete(floor)
-    db.commit()
-    return floor_data
+    return entity_data
 
 
-def delete_datacenter(db: Session, entity_name: str) -> Dict[str, Any]:
-    """Delete a datacenter by name."""
-    datacenter = db.query(Datacenter).filter(func.upper(Datacenter.name) == func.upper(entity_name)).first()
-    if not datacenter:
-        raise HTTPException(status_code=404, detail=f"Datacenter with name '{entity_name}' not found")
-    
-    datacenter_data = {"id": datacenter.id, "name": datacenter.name}
-    db.delete(datacenter)
-    db.commit()
-    return datacenter_data
-
-
-def delete_rack(db: Session, entity_name: str) -> Dict[str, Any]:
-    """Delete a rack by name."""
-    rack = db.query(Rack).filter(func.upper(Rack.name) == func.upper(entity_name)).first()
-    if not rack:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Rack with name '{entity_name}' not found",
-        )
-    
-    rack_data = {
-        "id": rack.id,
-        "name": rack.name,
-        "building_id": rack.building_id,
-        "location_id": rack.location_id,
-        "status": rack.status,
-    }
-    
-    db.delete(rack)
-    db.commit()
-    
-    return rack_data
-
+# =============================================================================
+# Entity-specific delete functions (extra side effects)
+# =============================================================================
 
 def delete_device(db: Session, entity_name: str) -> Dict[str, Any]:
     """Delete a device by name with proper exception handling.
@@ -163,105 +130,41 @@ def delete_device(db: Session, entity_name: str) -> Dict[str, Any]:
         return device_data
 
 
-def delete_device_type(db: Session, entity_name: str) -> Dict[str, Any]:
-    """Delete a device type by name."""
-    device_type = db.query(DeviceType).filter(func.upper(DeviceType.name) == func.upper(entity_name)).first()
-    if not device_type:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Device type with name '{entity_name}' not found",
-        )
-    
-    device_type_data = {
-        "id": device_type.id,
-        "name": device_type.name,
-        "make_id": device_type.make_id,
-    }
-    
-    db.delete(device_type)
-    db.commit()
-    
-    return device_type_data
-
-
-def delete_asset_owner(db: Session, entity_name: str) -> Dict[str, Any]:
-    """Delete an asset owner by name."""
-    asset_owner = db.query(AssetOwner).filter(func.upper(AssetOwner.name) == func.upper(entity_name)).first()
-    if not asset_owner:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Asset owner with name '{entity_name}' not found",
-        )
-    
-    asset_owner_data = {
-        "id": asset_owner.id,
-        "name": asset_owner.name,
-        "location_id": asset_owner.location_id,
-    }
-    
-    db.delete(asset_owner)
-    db.commit()
-    
-    return asset_owner_data
-
-
-def delete_make(db: Session, entity_name: str) -> Dict[str, Any]:
-    """Delete a make by name."""
-    make = db.query(Make).filter(func.upper(Make.name) == func.upper(entity_name)).first()
-    if not make:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Make with name '{entity_name}' not found",
-        )
-    
-    make_data = {
-        "id": make.id,
-        "name": make.name,
-    }
-    
-    db.delete(make)
-    db.commit()
-    
-    return make_data
-
+def delete_model(
+    db: Session,
+    entity_name: str,
+    background_tasks: Optional[BackgroundTasks] = None,
+) -> Dict[str, Any]:
+    """
+    Delete a model by name and its associated images.
 
-def delete_model(db: Session, entity_name: str) -> Dict[str, Any]:
-    """Delete a model by name and its associated images."""
-    model = db.query(Model).filter(func.upper(Model.name) == func.upper(entity_name)).first()
-    if not model:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Model with name '{entity_name}' not found",
-        )
+    Image files are removed only after the row delete has committed, so a
+    failed delete never leaves the model pointing at missing files. When
+    `background_tasks` is given the unlinks run after the response is sent.
+    """
+    model = _get_for_delete(
+        db, Model, entity_name, "Model",
+        ("id", "name", "make_id", "front_image_path", "rear_image_path"),
+    )
     
     model_data = {
         "id": model.id,
         "name": model.name,
         "make_id": model.make_id,
     }
-    
-    # Delete associated images if they exist
-    if model.front_image_path:
-        delete_device_image(model.front_image_path)
-    if model.rear_image_path:
-        delete_device_image(model.rear_image_path)
+    image_paths = [path for path in (model.front_image_path, model.rear_image_path) if path]
     
     db.delete(model)
     db.commit()
     
-    return model_data
-
-
-def delete_application(db: Session, entity_name: str) -> Dict[str, Any]:
-    """Delete an application by name."""
-    application = db.query(ApplicationMapped).filter(func.upper(ApplicationMapped.name) == func.upper(entity_name)).first()
-    if not application:
-        raise HTTPException(status_code=404, detail=f"Application with name '{entity_name}' not found")
+    # Delete associated images if they exist
+    for image_path in image_paths:
+        if background_tasks is not None:
+            background_tasks.add_task(delete_device_image, image_path)
+        else:
+            delete_device_image(image_path)
     
-    application_data = {"id": application.id, "name": application.name}
-    db.delete(application)
-    db.commit()
-    return application_data
+    return model_data
 
 
 # =============================================================================
@@ -269,16 +172,10 @@ def delete_application(db: Session, entity_name: str) -> Dict[str, Any]:
 # =============================================================================
 
 ENTITY_DELETE_HANDLERS: Dict[ListingType, Callable[[Session, str], Dict[str, Any]]] = {
-    ListingType.locations: delete_location,
-    ListingType.buildings: delete_building,
-    ListingType.wings: delete_wing,
-    ListingType.floors: delete_floor,
-    ListingType.datacenters: delete_datacenter,
-    ListingType.racks: delete_rack,
+    **{
+        entity: partial(delete_entity, model_class=model_class, label=label, columns=columns)
+        for entity, (model_class, label, columns) in ENTITY_DELETE_SPECS.items()
+    },
     ListingType.devices: delete_device,
-    ListingType.device_types: delete_device_type,
-    ListingType.asset_owner: delete_asset_owner,
-    ListingType.makes: delete_make,
     ListingType.models: delete_model,
-    ListingType.applications: delete_application,
 }
@@ -0,0 +1,88 @@
+"""
+In-memory cache for entity detail responses.
+
+Detail payloads combine the entity with counts and lists from related tables
+(a wing's racks/devices, a rack's devices, ...), so a write to any entity can
+change another entity's details. Entries are therefore short-lived
+(DETAIL_CACHE_TTL_SECONDS) and every create/update/delete clears the whole
+cache via invalidate_detail_cache().
+
+Payloads are shared, not copied (as the per-session memo in details_helper
+already does): treat anything passed to `set` or returned by `get` as
+read-only.
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.helpers.listing_types import ListingType
+
+DetailCacheKey = Tuple[ListingType, str]
+
+
+def _is_cache_enabled() -> bool:
+    return settings.DETAIL_CACHE_TTL_SECONDS > 0 and settings.DETAIL_CACHE_MAX_ENTRIES > 0
+
+
+def build_detail_cache_key(entity: ListingType, entity_name: str) -> DetailCacheKey:
+    # Names are matched case-insensitively, so "R1" and "r1" share an entry
+    return entity, entity_name.upper()
+
+
+class _DetailCache:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._store: "OrderedDict[DetailCacheKey, tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: DetailCacheKey) -> Optional[Dict[str, Any]]:
+        if not _is_cache_enabled():
+            return None
+
+        now = time.time()
+        with self._lock:
+            record = self._store.get(key)
+            if not record:
+                return None
+
+            expires_at, payload = record
+            if expires_at <= now:
+                self._store.pop(key, None)
+                return None
+
+            self._store.move_to_end(key)
+            return payload
+
+    def set(self, key: DetailCacheKey, payload: Dict[str, Any]) -> None:
+        if not _is_cache_enabled():
+            return
+
+        expires_at = time.time() + settings.DETAIL_CACHE_TTL_SECONDS
+
+        with self._lock:
+            self._store[key] = (expires_at, payload)
+            self._store.move_to_end(key)
+            while len(self._store) > settings.DETAIL_CACHE_MAX_ENTRIES:
+                self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
+
+_detail_cache = _DetailCache()
+
+
+def get_cached_detail(key: DetailCacheKey) -> Optional[Dict[str, Any]]:
+    return _detail_cache.get(key)
+
+
+def set_cached_detail(key: DetailCacheKey, payload: Dict[str, Any]) -> None:
+    _detail_cache.set(key, payload)
+
+
+def invalidate_detail_cache() -> None:
+    _detail_cache.clear()
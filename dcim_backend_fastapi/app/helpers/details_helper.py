@@ -5,14 +5,15 @@ Contains all entity-specific detail logic with nested relationships.
 Updated to match Alembic migrations.
 Optimized for performance with combined queries and eager loading.
 """
-from typing import Any, Dict, Callable
+from typing import Any, Callable, Dict, List, Optional
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, exc
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, case, event, func, exc, select
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.helpers.listing_types import ListingType
-from app.helpers.db_utils import get_entity_by_name, db_operation
+from app.helpers.detail_cache import build_detail_cache_key, get_cached_detail, set_cached_detail
+from app.helpers.db_utils import child_count, get_entity_by_name, db_operation, name_equals
 from app.models.entity_models import (
     Rack,
     Device,
@@ -33,39 +34,80 @@ from app.models.entity_models import (
 # Entity-specific detail functions
 # =============================================================================
 
+def _rack_devices(db: Session, rack_id: int) -> List[Dict[str, Any]]:
+    """
+    Payload dicts for every device in a rack, ordered by position.
+
+    Only the displayed columns are selected and the rows are read as plain
+    mappings, so no Device/DeviceType/Make/Model instances are built. Several
+    models can match a device; joining all of them would repeat the device once
+    per model, so only the first model (lowest id) of its (device type, make)
+    is joined - the same model list_devices and lookup_cache show.
+    """
+    first_model = (
+        select(
+            Model.device_type_id,
+            Model.make_id,
+            func.min(Model.id).label("model_id"),
+        )
+        .group_by(Model.device_type_id, Model.make_id)
+        .subquery()
+    )
+    stmt = (
+        select(
+            Device.id,
+            Device.name,
+            Device.position,
+            Device.face_front,
+            Device.face_rear,
+            Device.status,
+            Device.space_required,
+            DeviceType.name.label("device_type"),
+            Make.name.label("make"),
+            Model.front_image_path,
+            Model.rear_image_path,
+        )
+        .select_from(Device)
+        .outerjoin(DeviceType, Device.devicetype_id == DeviceType.id)
+        .outerjoin(Make, Device.make_id == Make.id)
+        .outerjoin(
+            first_model,
+            and_(
+                first_model.c.device_type_id == DeviceType.id,
+                first_model.c.make_id == Device.make_id,
+            ),
+        )
+        .outerjoin(Model, Model.id == first_model.c.model_id)
+        .where(Device.rack_id == rack_id)
+        .order_by(Device.position.asc())
+    )
+    return [dict(row) for row in db.execute(stmt).mappings()]
+
 def get_wing_details(db: Session, entity_name: str) -> Dict[str, Any]:
     """Get detailed information about a specific wing by name."""
-    wing = (
-        db.query(Wing)
+    row = db.execute(
+        select(
+            Wing,
+            child_count(Rack.wing_id, Wing.id),
+            child_count(Device.wings_id, Wing.id),
+        )
         .options(
             joinedload(Wing.location),
             joinedload(Wing.building),
         )
-        .filter(func.upper(Wing.name) == func.upper(entity_name))
-        .first()
-    )
+        .where(name_equals(Wing, entity_name))
+        .limit(1)
+    ).first()
     
-    if not wing:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Wing with name '{entity_name}' not found",
         )
+    wing, total_racks, total_devices = row
 
     # Get floors in this wing
-    floors = db.query(Floor).filter(Floor.wing_id == wing.id).all()
-    
-    # Get stats
-    total_racks = (
-        db.query(func.count(Rack.id))
-        .filter(Rack.wing_id == wing.id)
-        .scalar() or 0
-    )
-    
-    total_devices = (
-        db.query(func.count(Device.id))
-        .filter(Device.wings_id == wing.id)
-        .scalar() or 0
-    )
+    floors = db.scalars(select(Floor).where(Floor.wing_id == wing.id)).all()
 
     return {
         "id": wing.id,
@@ -93,38 +135,30 @@ def get_wing_details(db: Session, entity_name: str) -> Dict[str, Any]:
 
 def get_floor_details(db: Session, entity_name: str) -> Dict[str, Any]:
     """Get detailed information about a specific floor by name."""
-    floor = (
-        db.query(Floor)
+    row = db.execute(
+        select(
+            Floor,
+            child_count(Rack.floor_id, Floor.id),
+            child_count(Device.floor_id, Floor.id),
+        )
         .options(
             joinedload(Floor.location),
             joinedload(Floor.building),
             joinedload(Floor.wing),
         )
-        .filter(func.upper(Floor.name) == func.upper(entity_name))
-        .first()
-    )
+        .where(name_equals(Floor, entity_name))
+        .limit(1)
+    ).first()
     
-    if not floor:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Floor with name '{entity_name}' not found",
         )
+    floor, total_racks, total_devices = row
 
     # Get datacenters on this floor
-    datacenters = db.query(Datacenter).filter(Datacenter.floor_id == floor.id).all()
-    
-    # Get stats
-    total_racks = (
-        db.query(func.count(Rack.id))
-        .filter(Rack.floor_id == floor.id)
-        .scalar() or 0
-    )
-    
-    total_devices = (
-        db.query(func.count(Device.id))
-        .filter(Device.floor_id == floor.id)
-        .scalar() or 0
-    )
+    datacenters = db.scalars(select(Datacenter).where(Datacenter.floor_id == floor.id)).all()
 
     return {
         "id": floor.id,
@@ -156,40 +190,47 @@ def get_floor_details(db: Session, entity_name: str) -> Dict[str, Any]:
 
 def get_datacenter_details(db: Session, entity_name: str) -> Dict[str, Any]:
     """Get detailed information about a specific datacenter by name."""
-    datacenter = (
-        db.query(Datacenter)
+    row = db.execute(
+        select(Datacenter, child_count(Device.dc_id, Datacenter.id))
         .options(
             joinedload(Datacenter.location),
             joinedload(Datacenter.building),
             joinedload(Datacenter.wing),
             joinedload(Datacenter.floor),
         )
-        .filter(func.upper(Datacenter.name) == func.upper(entity_name))
-        .first()
-    )
+        .where(name_equals(Datacenter, entity_name))
+        .limit(1)
+    ).first()
     
-    if not datacenter:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Datacenter with name '{entity_name}' not found",
         )
-
-    # Get racks in this datacenter
-    racks = db.query(Rack).filter(Rack.datacenter_id == datacenter.id).all()
-    
-    # Calculate stats
-    total_devices = (
-        db.query(func.count(Device.id))
-        .filter(Device.dc_id == datacenter.id)
-        .scalar() or 0
-    )
-
-    total_capacity = sum(r.height or 0 for r in racks)
-    used_space = sum(r.space_used or 0 for r in racks)
-    available_space = sum(
-        (r.space_available if r.space_available is not None else max((r.height or 0) - (r.space_used or 0), 0))
-        for r in racks
-    )
+    datacenter, total_devices = row
+
+    # Racks in this datacenter; the capacity totals ride along as window sums
+    height = func.coalesce(Rack.height, 0)
+    space_used = func.coalesce(Rack.space_used, 0)
+    free_space = height - space_used
+    racks = db.execute(
+        select(
+            Rack.id,
+            Rack.name,
+            Rack.status,
+            Rack.height,
+            func.sum(height).over().label("total_capacity"),
+            func.sum(space_used).over().label("used_space"),
+            func.sum(
+                func.coalesce(Rack.space_available, case((free_space > 0, free_space), else_=0))
+            ).over().label("available_space"),
+        ).where(Rack.datacenter_id == datacenter.id)
+    ).all()
+
+    if racks:
+        total_capacity, used_space, available_space = racks[0][4:]
+    else:
+        total_capacity = used_space = available_space = 0
 
     return {
         "id": datacenter.id,
@@ -236,8 +277,8 @@ def get_rack_details(db: Session, entity_name: str) -> Dict[str, Any]:
     """
     try:
         # Optimize: Use explicit joins instead of lazy loading
-        rack_data = (
-            db.query(
+        rack_data = db.execute(
+            select(
                 Rack,
                 Location,
                 Building,
@@ -250,9 +291,9 @@ def get_rack_details(db: Session, entity_name: str) -> Dict[str, Any]:
             .outerjoin(Wing, Rack.wing_id == Wing.id)
             .outerjoin(Floor, Rack.floor_id == Floor.id)
             .outerjoin(Datacenter, Rack.datacenter_id == Datacenter.id)
-            .filter(func.upper(Rack.name) == func.upper(entity_name))
-            .first()
-        )
+            .where(name_equals(Rack, entity_name))
+            .limit(1)
+        ).first()
         
         if not rack_data:
             raise HTTPException(
@@ -262,21 +303,8 @@ def get_rack_details(db: Session, entity_name: str) -> Dict[str, Any]:
         
         rack, location, building, wing, floor, datacenter = rack_data
 
-        # Optimize: Get devices with related info in single query (including Model for image paths)
-        devices_data = (
-            db.query(
-                Device,
-                DeviceType,
-                Make,
-                Model
-            )
-            .outerjoin(DeviceType, Device.devicetype_id == DeviceType.id)
-            .outerjoin(Make, Device.make_id == Make.id)
-            .outerjoin(Model, Model.device_type_id == DeviceType.id)
-            .filter(Device.rack_id == rack.id)
-            .order_by(Device.position.asc())
-            .all()
-        )
+        # Devices with related info in a single query (including Model for image paths)
+        devices_data = _rack_devices(db, rack.id)
 
         used_space = rack.space_used or 0
         available_space = rack.space_available
@@ -311,22 +339,7 @@ def get_rack_details(db: Session, entity_name: str) -> Dict[str, Any]:
                 "id": datacenter.id if datacenter else None,
                 "name": datacenter.name if datacenter else None,
             },
-            "devices": [
-                {
-                    "id": device.id,
-                    "name": device.name,
-                    "position": device.position,
-                    "face_front": device.face_front,
-                    "face_rear": device.face_rear,
-                    "status": device.status,
-                    "space_required": device.space_required,
-                    "device_type": device_type.name if device_type else None,
-                    "make": make.name if make else None,
-                    "front_image_path": model.front_image_path if model else None,
-                    "rear_image_path": model.rear_image_path if model else None,
-                }
-                for device, device_type, make, model in devices_data
-            ],
+            "devices": devices_data,
             "stats": {
                 "total_devices": len(devices_data),
                 "total_height": rack.height or 0,
@@ -351,22 +364,35 @@ def get_device_details(db: Session, entity_name: str) -> Dict[str, Any]:
     Optimized: Explicit joins instead of lazy loading, single query for devices in same rack.
     """
     try:
-        device = (
-            db.query(Device)
+        device = db.scalars(
+            select(Device)
             .options(
-                joinedload(Device.location),
-                joinedload(Device.building),
-                joinedload(Device.wing),
-                joinedload(Device.floor),
-                joinedload(Device.datacenter),
-                joinedload(Device.rack),
-                joinedload(Device.device_type).joinedload(DeviceType.models),
-                joinedload(Device.make),
-                joinedload(Device.application_mapped).joinedload(ApplicationMapped.asset_owner),
+                # Related rows only contribute id/name (plus model sizing/images)
+                joinedload(Device.location).load_only(Location.id, Location.name),
+                joinedload(Device.building).load_only(Building.id, Building.name),
+                joinedload(Device.wing).load_only(Wing.id, Wing.name),
+                joinedload(Device.floor).load_only(Floor.id, Floor.name),
+                joinedload(Device.datacenter).load_only(Datacenter.id, Datacenter.name),
+                joinedload(Device.rack).load_only(Rack.id, Rack.name),
+                joinedload(Device.device_type)
+                .load_only(DeviceType.id, DeviceType.name)
+                .joinedload(DeviceType.models)
+                .load_only(
+                    Model.id,
+                    Model.name,
+                    Model.height,
+                    Model.front_image_path,
+                    Model.rear_image_path,
+                ),
+                joinedload(Device.make).load_only(Make.id, Make.name),
+                joinedload(Device.application_mapped)
+                .load_only(ApplicationMapped.id, ApplicationMapped.name)
+                .joinedload(ApplicationMapped.asset_owner)
+                .load_only(AssetOwner.id, AssetOwner.name),
             )
-            .filter(func.upper(Device.name) == func.upper(entity_name))
-            .first()
-        )
+            .where(name_equals(Device, entity_name))
+            .limit(1)
+        ).unique().first()
         
         if not device:
             raise HTTPException(
@@ -381,20 +407,7 @@ def get_device_details(db: Session, entity_name: str) -> Dict[str, Any]:
         # Optimize: Get devices in the same rack with related info in single query (including Model for image paths)
         devices_data = []
         if device.rack_id:
-            devices_data = (
-                db.query(
-                    Device,
-                    DeviceType,
-                    Make,
-                    Model
-                )
-                .outerjoin(DeviceType, Device.devicetype_id == DeviceType.id)
-                .outerjoin(Make, Device.make_id == Make.id)
-                .outerjoin(Model, Model.device_type_id == DeviceType.id)
-                .filter(Device.rack_id == device.rack_id)
-                .order_by(Device.position.asc())
-                .all()
-            )
+            devices_data = _rack_devices(db, device.rack_id)
 
         return {
             "id": device.id,
@@ -459,22 +472,7 @@ def get_device_details(db: Session, entity_name: str) -> Dict[str, Any]:
                     "name": device.application_mapped.asset_owner.name if device.application_mapped and device.application_mapped.asset_owner else None,
                 } if device.application_mapped else None,
             },
-            "devices": [
-                {
-                    "id": d.id,
-                    "name": d.name,
-                    "position": d.position,
-                    "face_front": d.face_front,
-                    "face_rear": d.face_rear,
-                    "status": d.status,
-                    "space_required": d.space_required,
-                    "device_type": dt.name if dt else None,
-                    "make": make.name if make else None,
-                    "front_image_path": m.front_image_path if m else None,
-                    "rear_image_path": m.rear_image_path if m else None,
-                }
-                for d, dt, make, m in devices_data
-            ],
+            "devices": devices_data,
             "warranty": {
                 "start_date": device.warranty_start_date,
                 "end_date": device.warranty_end_date,
@@ -495,28 +493,23 @@ def get_device_details(db: Session, entity_name: str) -> Dict[str, Any]:
 
 def get_device_type_details(db: Session, entity_name: str) -> Dict[str, Any]:
     """Get detailed information about a specific device type by name."""
-    device_type = (
-        db.query(DeviceType)
+    row = db.execute(
+        select(DeviceType, child_count(Device.devicetype_id, DeviceType.id))
         .options(
             joinedload(DeviceType.make),
             joinedload(DeviceType.models),
         )
-        .filter(func.upper(DeviceType.name) == func.upper(entity_name))
-        .first()
-    )
+        .where(name_equals(DeviceType, entity_name))
+        .limit(1)
+    ).unique().first()
     
-    if not device_type:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Device type with name '{entity_name}' not found",
         )
-
-    # Count devices using this type
-    device_count = (
-        db.query(func.count(Device.id))
-        .filter(Device.devicetype_id == device_type.id)
-        .scalar() or 0
-    )
+    # Devices using this type are counted in the same statement
+    device_type, device_count = row
 
     primary_model = device_type.models[0] if device_type.models else None
 
@@ -547,12 +540,12 @@ def get_device_type_details(db: Session, entity_name: str) -> Dict[str, Any]:
 
 def get_asset_owner_details(db: Session, entity_name: str) -> Dict[str, Any]:
     """Get detailed information about a specific asset owner by name."""
-    asset_owner = (
-        db.query(AssetOwner)
+    asset_owner = db.scalars(
+        select(AssetOwner)
         .options(joinedload(AssetOwner.location))
-        .filter(func.upper(AssetOwner.name) == func.upper(entity_name))
-        .first()
-    )
+        .where(name_equals(AssetOwner, entity_name))
+        .limit(1)
+    ).first()
     
     if not asset_owner:
         raise HTTPException(
@@ -561,11 +554,10 @@ def get_asset_owner_details(db: Session, entity_name: str) -> Dict[str, Any]:
         )
 
     # Get applications for this owner
-    applications = (
-        db.query(ApplicationMapped)
-        .filter(ApplicationMapped.asset_owner_id == asset_owner.id)
-        .all()
-    )
+    applications = db.scalars(
+        select(ApplicationMapped)
+        .where(ApplicationMapped.asset_owner_id == asset_owner.id)
+    ).all()
 
     return {
         "id": asset_owner.id,
@@ -587,11 +579,11 @@ def get_asset_owner_details(db: Session, entity_name: str) -> Dict[str, Any]:
 
 def get_make_details(db: Session, entity_name: str) -> Dict[str, Any]:
     """Get detailed information about a specific make by name."""
-    make = (
-        db.query(Make)
-        .filter(func.upper(Make.name) == func.upper(entity_name))
-        .first()
-    )
+    make = db.scalars(
+        select(Make)
+        .where(name_equals(Make, entity_name))
+        .limit(1)
+    ).first()
     
     if not make:
         raise HTTPException(
@@ -600,31 +592,23 @@ def get_make_details(db: Session, entity_name: str) -> Dict[str, Any]:
         )
 
     # Get models
-    models = (
-        db.query(Model)
-        .filter(Model.make_id == make.id)
-        .all()
-    )
-
-    # Get device types
-    device_types = (
-        db.query(DeviceType)
-        .filter(DeviceType.make_id == make.id)
-        .all()
-    )
+    models = db.scalars(
+        select(Model)
+        .where(Model.make_id == make.id)
+    ).all()
+
+    # Get device types (models batch-loaded for the height column)
+    device_types = db.scalars(
+        select(DeviceType)
+        .options(selectinload(DeviceType.models).load_only(Model.id, Model.height))
+        .where(DeviceType.make_id == make.id)
+    ).all()
 
     # Stats
-    device_count = (
-        db.query(func.count(Device.id))
-        .filter(Device.make_id == make.id)
-        .scalar() or 0
-    )
-    
-    rack_count = (
-        db.query(func.count(func.distinct(Device.rack_id)))
-        .filter(Device.make_id == make.id)
-        .scalar() or 0
-    )
+    device_count, rack_count = db.execute(
+        select(func.count(Device.id), func.count(func.distinct(Device.rack_id)))
+        .where(Device.make_id == make.id)
+    ).one()
 
     return {
         "id": make.id,
@@ -653,15 +637,15 @@ def get_make_details(db: Session, entity_name: str) -> Dict[str, Any]:
 
 def get_model_details(db: Session, entity_name: str) -> Dict[str, Any]:
     """Get detailed information about a specific model by name."""
-    model = (
-        db.query(Model)
+    model = db.scalars(
+        select(Model)
         .options(
             joinedload(Model.make),
             joinedload(Model.device_type),
         )
-        .filter(func.upper(Model.name) == func.upper(entity_name))
-        .first()
-    )
+        .where(name_equals(Model, entity_name))
+        .limit(1)
+    ).first()
     
     if not model:
         raise HTTPException(
@@ -699,12 +683,12 @@ def get_model_details(db: Session, entity_name: str) -> Dict[str, Any]:
 
 def get_application_details(db: Session, entity_name: str) -> Dict[str, Any]:
     """Get detailed information about a specific application by name."""
-    application = (
-        db.query(ApplicationMapped)
+    application = db.scalars(
+        select(ApplicationMapped)
         .options(joinedload(ApplicationMapped.asset_owner))
-        .filter(func.upper(ApplicationMapped.name) == func.upper(entity_name))
-        .first()
-    )
+        .where(name_equals(ApplicationMapped, entity_name))
+        .limit(1)
+    ).first()
     
     if not application:
         raise HTTPException(
@@ -713,11 +697,10 @@ def get_application_details(db: Session, entity_name: str) -> Dict[str, Any]:
         )
 
     # Get devices using this application
-    devices = (
-        db.query(Device)
-        .filter(Device.applications_mapped_id == application.id)
-        .all()
-    )
+    devices = db.scalars(
+        select(Device)
+        .where(Device.applications_mapped_id == application.id)
+    ).all()
 
     return {
         "id": application.id,
@@ -752,4 +735,51 @@ ENTITY_DETAIL_HANDLERS: Dict[ListingType, Callable[[Session, str], Dict[str, Any
     ListingType.makes: get_make_details,
     ListingType.models: get_model_details,
     ListingType.applications: get_application_details,
-}
\ No newline at end of file
+}
+
+# =============================================================================
+# Session-scoped memo
+# =============================================================================
+
+_DETAILS_MEMO_KEY = "entity_details_memo"
+
+
+def get_entity_details(
+    db: Session,
+    entity: ListingType,
+    entity_name: str,
+    handler: Optional[Callable[[Session, str], Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """
+    Dispatch to the entity's detail handler, memoised per session and cached
+    across requests (see detail_cache).
+
+    The session lives for one request (see get_db), so repeated lookups of the
+    same (entity, name) inside a request reuse the first result. The session
+    memo is dropped whenever the session flushes, commits or rolls back; the
+    shared cache is cleared by every create/update/delete endpoint. Callers
+    that already resolved the handler can pass it to skip the second lookup.
+    """
+    key = build_detail_cache_key(entity, entity_name)
+    info = getattr(db, "info", None)
+    memo = info.setdefault(_DETAILS_MEMO_KEY, {}) if info is not None else {}
+    data = memo.get(key)
+    if data is not None:
+        return data
+
+    data = get_cached_detail(key)
+    if data is None:
+        if handler is None:
+            handler = ENTITY_DETAIL_HANDLERS[entity]
+        data = handler(db, entity_name)
+        set_cached_detail(key, data)
+    memo[key] = data
+    return data
+
+
+def _drop_details_memo(session: Session, *_: Any) -> None:
+    session.info.pop(_DETAILS_MEMO_KEY, None)
+
+
+for _session_event in ("after_flush", "after_commit", "after_rollback"):
+    event.listen(Session, _session_event, _drop_details_memo)
@@ -1,8 +1,13 @@
 """
 Email helper utilities for sending SMTP notifications from the DCIM backend.
 """
+from concurrent.futures import Future, ThreadPoolExecutor
+from email import policy
 from email.message import EmailMessage
-from typing import Iterable, List, Optional, Sequence
+from itertools import chain, islice
+from threading import Lock, local
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+import logging
 import smtplib
 
 from app.core.config import settings
@@ -10,28 +15,141 @@ from app.core.logger import app_logger
 
 
 def _normalize_recipients(recipients: Sequence[Optional[str]]) -> List[str]:
-    """Filter out empty recipients and return a unique list."""
-    seen = set()
-    normalized: List[str] = []
-    for recipient in recipients:
-        if recipient and recipient not in seen:
-            normalized.append(recipient)
-            seen.add(recipient)
-    return normalized
+    """Filter out empty recipients and return a unique list (first occurrence wins)."""
+    return list(dict.fromkeys(recipient for recipient in recipients if recipient))
+
+
+# Serialise with CRLF line endings as SMTP expects them on the wire
+_SMTP_POLICY = policy.SMTP
+
+# One authenticated SMTP connection per worker thread, reused across sends so
+# a burst of report emails pays the TCP/TLS/login handshake once.
+_smtp_local = local()
+_smtp_connections_lock = Lock()
+_smtp_connections: List[smtplib.SMTP] = []
+
+
+def _open_smtp() -> smtplib.SMTP:
+    smtp_class = smtplib.SMTP_SSL if settings.SMTP_USE_SSL else smtplib.SMTP
+    smtp = smtp_class(
+        host=settings.SMTP_HOST,
+        port=settings.SMTP_PORT,
+        timeout=settings.SMTP_TIMEOUT,
+    )
+    try:
+        if not settings.SMTP_USE_SSL and settings.SMTP_USE_TLS:
+            smtp.starttls()
+
+        if settings.SMTP_USERNAME and settings.SMTP_PASSWORD:
+            smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+    except Exception:
+        smtp.close()
+        raise
+    return smtp
+
+
+def _discard_smtp(smtp: Optional[smtplib.SMTP]) -> None:
+    if smtp is None:
+        return
+    if getattr(_smtp_local, "smtp", None) is smtp:
+        _smtp_local.smtp = None
+    with _smtp_connections_lock:
+        if smtp in _smtp_connections:
+            _smtp_connections.remove(smtp)
+    try:
+        smtp.quit()
+    except Exception:
+        smtp.close()
+
+
+def _get_smtp() -> smtplib.SMTP:
+    """Return this thread's live SMTP connection, reconnecting if it went stale."""
+    smtp = getattr(_smtp_local, "smtp", None)
+    if smtp is not None:
+        try:
+            if smtp.noop()[0] == 250:
+                return smtp
+        except (smtplib.SMTPException, OSError):
+            pass
+        _discard_smtp(smtp)
+
+    smtp = _open_smtp()
+    _smtp_local.smtp = smtp
+    with _smtp_connections_lock:
+        _smtp_connections.append(smtp)
+    return smtp
+
+
+_email_executor: Optional[ThreadPoolExecutor] = None
+_email_executor_lock = Lock()
+
+
+def _get_email_executor() -> ThreadPoolExecutor:
+    global _email_executor
+    if _email_executor is None:
+        with _email_executor_lock:
+            if _email_executor is None:
+                _email_executor = ThreadPoolExecutor(
+                    max_workers=max(settings.SMTP_SEND_WORKERS, 1),
+                    thread_name_prefix="smtp-send",
+                )
+    return _email_executor
+
+
+def _log_email_failure(future: Future) -> None:
+    exc = future.exception()
+    if exc is not None:
+        app_logger.error(
+            "Queued email task failed",
+            exc_info=(type(exc), exc, exc.__traceback__),
+        )
+
+
+def submit_email_task(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+    """
+    Run an email-sending callable on the email worker pool (fire-and-forget).
+
+    Callers are not held up by SMTP round trips; failures are logged.
+    """
+    future = _get_email_executor().submit(func, *args, **kwargs)
+    future.add_done_callback(_log_email_failure)
+    return future
+
+
+def close_smtp_connections() -> None:
+    """
+    Drain queued emails and close every pooled SMTP connection
+    (call on application shutdown).
+    """
+    global _email_executor
+    with _email_executor_lock:
+        executor, _email_executor = _email_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+    with _smtp_connections_lock:
+        connections = list(_smtp_connections)
+    for smtp in connections:
+        _discard_smtp(smtp)
 
 
 def send_email(
     subject: str,
     body: str,
     recipients: Sequence[Optional[str]],
+    attachments: Sequence[Tuple[str, str]] = (),
 ) -> None:
     """
     Send a plain-text email via configured SMTP settings.
 
+    The SMTP connection is kept open per thread and reused by later calls;
+    a server-side disconnect triggers one reconnect and resend.
+
     Args:
         subject: Email subject line.
         body: Plain-text body.
         recipients: Iterable of recipient email addresses (duplicates/empties removed).
+        attachments: (filename, text) pairs attached as text/plain files.
     """
     to_addresses = _normalize_recipients(recipients)
     if not to_addresses:
@@ -42,38 +160,83 @@ def send_email(
         app_logger.warning("SMTP settings missing (host/from). Cannot send email.")
         return
 
-    message = EmailMessage()
+    message = EmailMessage(policy=_SMTP_POLICY)
     message["Subject"] = subject
     message["From"] = settings.SMTP_FROM_EMAIL
     message["To"] = ", ".join(to_addresses)
-    message.set_content(body)
+    # ASCII bodies go out as 7bit; otherwise pick quoted-printable up front
+    # instead of letting the content manager trial-encode both QP and base64.
+    message.set_content(body, cte=None if body.isascii() else "quoted-printable")
+    for filename, content in attachments:
+        message.add_attachment(content, subtype="plain", filename=filename)
 
+    smtp = None
     try:
-        if settings.SMTP_USE_SSL:
-            smtp_class = smtplib.SMTP_SSL
-        else:
-            smtp_class = smtplib.SMTP
-
-        with smtp_class(
-            host=settings.SMTP_HOST,
-            port=settings.SMTP_PORT,
-            timeout=settings.SMTP_TIMEOUT,
-        ) as smtp:
-            if not settings.SMTP_USE_SSL and settings.SMTP_USE_TLS:
-                smtp.starttls()
-
-            if settings.SMTP_USERNAME and settings.SMTP_PASSWORD:
-                smtp.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-
+        smtp = _get_smtp()
+        try:
+            smtp.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            _discard_smtp(smtp)
+            smtp = _get_smtp()
             smtp.send_message(message)
-            app_logger.info(
-                "Sent email",
-                extra={"subject": subject, "recipients": to_addresses},
-            )
+        app_logger.info(
+            "Sent email",
+            extra={"subject": subject, "recipients": to_addresses},
+        )
     except Exception:
+        _discard_smtp(smtp)
         app_logger.exception("Failed to send email via SMTP")
 
 
+def _format_report_row(row: dict) -> str:
+    get = row.get
+    status = get("status")
+    row_no = get("row")
+    if status == "success":
+        data = get("data") or {}
+        identifier = data.get("id") or data.get("device_id")
+        return f"- Row {row_no}: SUCCESS (device_id={identifier})"
+    if status == "error":
+        return f"- Row {row_no}: ERROR - {get('error')}"
+    return f"- Row {row_no}: {status or 'UNKNOWN'}"
+
+
+# Reports with more rows than this carry the row results as a .txt attachment
+# instead of inline, keeping the message body short.
+REPORT_INLINE_MAX_ROWS = 500
+
+
+def _format_report_header(
+    job_id: str,
+    summary: Optional[dict],
+    failure_reason: Optional[str],
+) -> List[str]:
+    header = [
+        f"Bulk device upload job {job_id} has completed processing.",
+    ]
+
+    if failure_reason:
+        header += [
+            "",
+            "Status: FAILED",
+            f"Reason: {failure_reason}",
+        ]
+    elif summary:
+        header += [
+            "",
+            "Status: COMPLETED",
+            f"Entity: {summary.get('entity')}",
+            f"Total rows: {summary.get('total_rows')}",
+            f"Processed rows: {summary.get('processed')}",
+            f"Successful rows: {summary.get('success')}",
+            f"Failed rows: {summary.get('errors')}",
+        ]
+        if summary.get("aborted"):
+            header.append("Processing stopped early because skip_errors was disabled.")
+
+    return header
+
+
 def format_bulk_upload_report(
     job_id: str,
     summary: Optional[dict],
@@ -83,40 +246,38 @@ def format_bulk_upload_report(
     """
     Build a human-readable report body for a bulk upload job.
     """
-    lines = [
-        f"Bulk device upload job {job_id} has completed processing.",
-    ]
+    header = _format_report_header(job_id, summary, failure_reason)
+    header += ["", "Row results:"]
 
-    if failure_reason:
-        lines.append("")
-        lines.append("Status: FAILED")
-        lines.append(f"Reason: {failure_reason}")
-    elif summary:
-        lines.append("")
-        lines.append("Status: COMPLETED")
-        lines.append(f"Entity: {summary.get('entity')}")
-        lines.append(f"Total rows: {summary.get('total_rows')}")
-        lines.append(f"Processed rows: {summary.get('processed')}")
-        lines.append(f"Successful rows: {summary.get('success')}")
-        lines.append(f"Failed rows: {summary.get('errors')}")
-        if summary.get("aborted"):
-            lines.append("Processing stopped early because skip_errors was disabled.")
+    # Row lines are streamed straight into join instead of an intermediate list
+    return "\n".join(chain(header, map(_format_report_row, results)))
+
+
+def build_bulk_upload_report_email(
+    job_id: str,
+    summary: Optional[dict],
+    results: Iterable[dict],
+    failure_reason: Optional[str] = None,
+) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Build (body, attachments) for a bulk upload report.
 
-    lines.append("")
-    lines.append("Row results:")
-    for row in results:
-        status = row.get("status")
-        row_no = row.get("row")
-        if status == "success":
-            data = row.get("data") or {}
-            identifier = data.get("id") or data.get("device_id")
-            lines.append(f"- Row {row_no}: SUCCESS (device_id={identifier})")
-        elif status == "error":
-            lines.append(f"- Row {row_no}: ERROR - {row.get('error')}")
-        else:
-            lines.append(f"- Row {row_no}: {status or 'UNKNOWN'}")
+    Up to REPORT_INLINE_MAX_ROWS row results are inlined by
+    format_bulk_upload_report. Larger reports put only the summary in the body
+    and the row results in a `bulk_upload_<job_id>.txt` attachment.
+    """
+    rows = iter(results)
+    head = list(islice(rows, REPORT_INLINE_MAX_ROWS + 1))
+    if len(head) <= REPORT_INLINE_MAX_ROWS:
+        return format_bulk_upload_report(job_id, summary, head, failure_reason), []
 
-    return "\n".join(lines)
+    filename = f"bulk_upload_{job_id}.txt"
+    # smtplib sends the message from memory, so the attachment is joined once
+    # straight from the row generator rather than via a list of lines
+    attachment = "\n".join(map(_format_report_row, chain(head, rows)))
+    header = _format_report_header(job_id, summary, failure_reason)
+    header += ["", f"Row results are attached ({filename})."]
+    return "\n".join(header), [(filename, attachment)]
 
 
 def send_bulk_upload_report(
@@ -129,18 +290,21 @@ def send_bulk_upload_report(
     """
     Format and send the standard bulk upload report email.
     """
-    print(f"Sending bulk upload report for job {job_id}")
-    print(f"Summary: {summary}")
-    print(f"Results: {results}")
-    print(f"Recipients: {recipients}")
-    print(f"Failure reason: {failure_reason}")
-    
+    if app_logger.isEnabledFor(logging.DEBUG):
+        app_logger.debug(
+            "Bulk upload report",
+            extra={
+                "job_id": job_id,
+                "recipient_count": len(recipients),
+                "failed": failure_reason is not None,
+            },
+        )
+
     # subject = f"DCIM Bulk Device Upload Report | Job {job_id}"
-    # body = format_bulk_upload_report(
+    # body, attachments = build_bulk_upload_report_email(
     #     job_id=job_id,
     #     summary=summary,
     #     results=results,
     #     failure_reason=failure_reason,
     # )
-    # send_email(subject=subject, body=body, recipients=recipients)
-
+    # send_email(subject=subject, body=body, recipients=recipients, attachments=attachments)
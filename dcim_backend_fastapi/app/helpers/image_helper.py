@@ -5,16 +5,32 @@ Handles saving, updating, and deleting model images (front and rear).
 Images are associated with models, not individual devices.
 """
 import os
-import uuid
+import re
+import secrets
+import shutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from fastapi import UploadFile, HTTPException, status
 
 from app.core.config import get_settings
 
+_ALLOWED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp"})
+_ALLOWED_EXTENSIONS_MSG = ", ".join(sorted(_ALLOWED_EXTENSIONS))
+_MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
+_IMAGE_CHUNK_SIZE = 1024 * 1024
+# Anything but alphanumerics (str.isalnum), '-' and '_'
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w-]")
 
+
+@lru_cache(maxsize=1)
 def get_device_image_storage_path() -> Path:
-    """Get the base path for storing model images."""
+    """
+    Get the base path for storing model images.
+
+    Resolved (and created) once per process; call `cache_clear()` on this
+    function after changing DEVICE_IMAGE_STORAGE_PATH.
+    """
     settings = get_settings()
     storage_path = Path(settings.DEVICE_IMAGE_STORAGE_PATH)
     storage_path.mkdir(parents=True, exist_ok=True)
@@ -36,41 +52,42 @@ def save_device_image(image_file: UploadFile, model_name: str) -> str:
         HTTPException: If the file is not a valid image or save fails
     """
     # Validate file type
-    allowed_extensions = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
     file_extension = Path(image_file.filename or "").suffix.lower()
     
-    if file_extension not in allowed_extensions:
+    if file_extension not in _ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid image format. Allowed formats: {', '.join(allowed_extensions)}",
+            detail=f"Invalid image format. Allowed formats: {_ALLOWED_EXTENSIONS_MSG}",
         )
     
     # Generate unique filename
     # Sanitize model name for filename
-    safe_model_name = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in model_name)
-    unique_id = str(uuid.uuid4())[:8]
+    safe_model_name = _UNSAFE_FILENAME_CHARS.sub("_", model_name)
+    unique_id = secrets.token_hex(4)
     filename = f"{safe_model_name}_{unique_id}{file_extension}"
     
     # Get storage path
     storage_path = get_device_image_storage_path()
     file_path = storage_path / filename
     
+    # Validate file size (max 10MB) before touching the disk. Starlette sets
+    # `size` for multipart uploads; otherwise measure the spooled file.
+    upload = image_file.file
+    file_size = image_file.size
+    if file_size is None:
+        upload.seek(0, os.SEEK_END)
+        file_size = upload.tell()
+    if file_size > _MAX_IMAGE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Image file size exceeds maximum allowed size of 10MB",
+        )
+
     # Save the file
     try:
-        # Read file content
-        file_content = image_file.file.read()
-        
-        # Validate file size (max 10MB)
-        max_size = 10 * 1024 * 1024  # 10MB
-        if len(file_content) > max_size:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Image file size exceeds maximum allowed size of 10MB",
-            )
-        
-        # Write file
+        upload.seek(0)
         with open(file_path, "wb") as f:
-            f.write(file_content)
+            shutil.copyfileobj(upload, f, _IMAGE_CHUNK_SIZE)
         
         # Return relative path (relative to storage base path)
         return str(file_path)
@@ -4,30 +4,133 @@ Simple in-memory cache for listing responses.
 Intended to reduce load for high-frequency dropdown/listing calls that often
 reuse the same parameters. The cache layer is deliberately lightweight so it
 can be replaced with Redis or another backend later if needed.
+
+When orjson is installed payloads are stored as serialised JSON bytes, so
+every `get` returns a fresh, freely mutable copy (with JSON types: dates and
+enums come back as strings) and entries are ready to move to an external
+store. The bytes are laid out like the app's default (pretty-printed)
+response, so `get_entry`/`set` entries can be sent as the response body
+as-is. Without orjson payloads are shared, not copied: treat anything passed
+to `set` or returned by `get`/`get_entry` as read-only.
 """
 from __future__ import annotations
 
-import json
 import time
-from copy import deepcopy
+from collections import OrderedDict
 from datetime import date
-from hashlib import sha256
-from threading import RLock
+from decimal import Decimal
+from hashlib import blake2b
+from threading import Lock, local
 from typing import Any, Dict, Optional, Set
 
 from app.core.config import settings
 from app.helpers.listing_types import ListingType
 
+try:  # xxhash is optional; blake2b is the stdlib fallback
+    import xxhash
+except ImportError:  # pragma: no cover - depends on the deployment image
+    xxhash = None
+
+try:  # orjson is optional; without it payloads are cached by reference
+    import orjson
+except ImportError:  # pragma: no cover - depends on the deployment image
+    orjson = None
+
+
+# Fresh blake2b state to copy from (copying is cheaper than constructing)
+_BLAKE2B_SEED = blake2b(digest_size=8)
+# Per-thread scratch buffer the key fields are assembled into
+_key_buffers = local()
+
+
+def _key_digest(data: bytearray) -> bytes:
+    """
+    Raw 8-byte digest of an in-process cache key (no hex formatting).
+
+    Keys never leave the process, so SHA-256 is unnecessary: xxh3_64 is used
+    through its one-shot function (no hasher object), or an 8-byte blake2b
+    copied from a pre-built seed state when xxhash is not installed.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64_digest(data)
+    hasher = _BLAKE2B_SEED.copy()
+    hasher.update(data)
+    return hasher.digest()
+
+
+def _key_buffer() -> bytearray:
+    buffer = getattr(_key_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _key_buffers.buffer = bytearray()
+    else:
+        buffer.clear()
+    return buffer
+
+
+def _json_default(value: Any) -> Any:
+    # Same Decimal handling as FastAPI's jsonable_encoder
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
 
-def _is_cache_enabled() -> bool:
+
+def _encode_payload(value: Dict[str, Any]) -> Any:
+    if orjson is None:
+        return value
+    return orjson.dumps(value, default=_json_default, option=orjson.OPT_INDENT_2)
+
+
+def _decode_payload(entry: Any) -> Dict[str, Any]:
+    if orjson is None:
+        return entry
+    return orjson.loads(entry)
+
+
+def _compute_cache_enabled() -> bool:
     return settings.LISTING_CACHE_TTL_SECONDS > 0 and settings.LISTING_CACHE_MAX_ENTRIES > 0
 
 
+# Settings are read once at import; call refresh_cache_enabled() after changing them
+_CACHE_ENABLED = _compute_cache_enabled()
+
+
+def refresh_cache_enabled() -> bool:
+    """Re-read the listing cache settings (e.g. after a test overrides them)."""
+    global _CACHE_ENABLED
+    _CACHE_ENABLED = _compute_cache_enabled()
+    return _CACHE_ENABLED
+
+
+# Number of independently locked stripes the listing cache is split into
+_SHARD_COUNT = 16
+
+
+class _CacheShard:
+    __slots__ = ("lock", "store")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        # Ordered oldest -> most recently used (LRU)
+        self.store: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+
+
 class _ListingResponseCache:
+    """
+    Listing cache striped across `_SHARD_COUNT` shards.
+
+    Each key lives in the shard picked by its hash, and every shard has its
+    own lock, LRU order and share of `LISTING_CACHE_MAX_ENTRIES`, so requests
+    for different keys rarely contend. The entity index has its own lock,
+    which may be taken while a shard lock is held but never the other way
+    round.
+    """
+
     def __init__(self) -> None:
-        self._lock = RLock()
-        self._store: Dict[str, tuple[float, Dict[str, Any]]] = {}
-        self._entity_index: Dict[str, Set[str]] = {}
+        self._shards = tuple(_CacheShard() for _ in range(_SHARD_COUNT))
+        self._index_lock = Lock()
+        self._entity_index: Dict[str, Set[bytes]] = {}
+        # Reverse of _entity_index so a key can be unindexed without a scan
+        self._key_to_entity: Dict[bytes, str] = {}
 
     @staticmethod
     def _normalize_entity(entity: ListingType | str | None) -> Optional[str]:
@@ -37,77 +140,129 @@ class _ListingResponseCache:
             return entity.value
         return str(entity)
 
-    def get(self, key: str) -> Optional[Dict[str, Any]]:
+    def _shard(self, key: bytes) -> _CacheShard:
+        return self._shards[hash(key) % _SHARD_COUNT]
+
+    @staticmethod
+    def _shard_capacity() -> int:
+        return max(1, -(-settings.LISTING_CACHE_MAX_ENTRIES // _SHARD_COUNT))
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
         """Get cached payload if available and not expired."""
-        if not _is_cache_enabled():
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+        # Decoded outside the shard lock
+        return _decode_payload(entry)
+
+    def get_entry(self, key: bytes) -> Any:
+        """
+        The stored entry without decoding: JSON bytes with orjson, otherwise
+        the shared payload dict. None when missing or expired.
+        """
+        if not _CACHE_ENABLED:
             return None
 
         now = time.time()
-        with self._lock:
-            record = self._store.get(key)
+        shard = self._shard(key)
+        with shard.lock:
+            record = shard.store.get(key)
             if not record:
                 return None
 
-            expires_at, payload = record
-            if expires_at <= now:
-                # Expired - use evict_key to properly clean up both store and index
-                self._evict_key(key)
-                return None
+            expires_at, entry = record
+            if expires_at > now:
+                shard.store.move_to_end(key)
+            else:
+                # Expired - drop it from the store here and from the index below
+                del shard.store[key]
+                entry = None
 
-            return deepcopy(payload)
+        if entry is None:
+            self._unindex_key(key)
+        return entry
 
-    def set(self, key: str, value: Dict[str, Any], *, entity: ListingType | str | None) -> None:
-        """Set cached payload with expiration and entity indexing."""
-        if not _is_cache_enabled():
-            return
+    def set(self, key: bytes, value: Dict[str, Any], *, entity: ListingType | str | None) -> Any:
+        """
+        Set cached payload with expiration and entity indexing.
+
+        Returns the entry as `get_entry` would (encoded even when caching is
+        disabled), or None if the payload is not JSON serialisable.
+        """
+        try:
+            entry = _encode_payload(value)
+        except TypeError:
+            # Not JSON serialisable - serve it uncached rather than fail the request
+            return None
+
+        if not _CACHE_ENABLED:
+            return entry
 
         expires_at = time.time() + settings.LISTING_CACHE_TTL_SECONDS
-        entry = deepcopy(value)
         entity_key = self._normalize_entity(entity)
+        capacity = self._shard_capacity()
 
-        with self._lock:
-            # Evict oldest entry if cache is full (FIFO eviction)
-            if len(self._store) >= settings.LISTING_CACHE_MAX_ENTRIES:
-                oldest_key = next(iter(self._store))
-                self._evict_key(oldest_key)
+        shard = self._shard(key)
+        with shard.lock:
+            if key in shard.store:
+                shard.store.move_to_end(key)
+            elif len(shard.store) >= capacity:
+                # Evict the shard's least recently used entry
+                evicted_key, _ = shard.store.popitem(last=False)
+                self._unindex_key(evicted_key)
 
             # Store the entry
-            self._store[key] = (expires_at, entry)
-            
+            shard.store[key] = (expires_at, entry)
+
             # Index by entity for efficient invalidation
             if entity_key:
-                self._entity_index.setdefault(entity_key, set()).add(key)
+                with self._index_lock:
+                    if self._key_to_entity.get(key, entity_key) != entity_key:
+                        self._unindex_key_locked(key)
+                    self._entity_index.setdefault(entity_key, set()).add(key)
+                    self._key_to_entity[key] = entity_key
+        return entry
+
+    def _evict_key(self, cache_key: bytes) -> None:
+        shard = self._shard(cache_key)
+        with shard.lock:
+            record = shard.store.pop(cache_key, None)
+        if record:
+            self._unindex_key(cache_key)
 
-    def _evict_key(self, cache_key: str) -> None:
-        record = self._store.pop(cache_key, None)
-        if not record:
+    def _unindex_key(self, cache_key: bytes) -> None:
+        with self._index_lock:
+            self._unindex_key_locked(cache_key)
+
+    def _unindex_key_locked(self, cache_key: bytes) -> None:
+        entity_key = self._key_to_entity.pop(cache_key, None)
+        if entity_key is None:
             return
-        for entity_key, key_set in list(self._entity_index.items()):
-            if cache_key in key_set:
-                key_set.discard(cache_key)
-                if not key_set:
-                    self._entity_index.pop(entity_key, None)
-
-    def clear_prefix(self, prefix: str) -> None:
-        with self._lock:
-            keys_to_delete = [cache_key for cache_key in self._store if cache_key.startswith(prefix)]
-            for cache_key in keys_to_delete:
-                self._evict_key(cache_key)
+        key_set = self._entity_index.get(entity_key)
+        if key_set is not None:
+            key_set.discard(cache_key)
+            if not key_set:
+                self._entity_index.pop(entity_key, None)
 
     def invalidate_entity(self, entity: ListingType | str) -> None:
         entity_key = self._normalize_entity(entity)
         if not entity_key:
             return
 
-        with self._lock:
-            keys = list(self._entity_index.get(entity_key, []))
+        with self._index_lock:
+            keys = self._entity_index.pop(entity_key, set())
             for cache_key in keys:
-                self._evict_key(cache_key)
+                self._key_to_entity.pop(cache_key, None)
+        for cache_key in keys:
+            self._evict_key(cache_key)
 
     def invalidate_all(self) -> None:
-        with self._lock:
-            self._store.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.store.clear()
+        with self._index_lock:
             self._entity_index.clear()
+            self._key_to_entity.clear()
 
 
 listing_cache = _ListingResponseCache()
@@ -121,38 +276,36 @@ def build_listing_cache_key(
     user_id: Optional[int],
     access_level: Optional[str],
     **filters: Any,
-) -> str:
+) -> bytes:
     """
     Build a deterministic cache key for listing responses.
     Includes all filter parameters in the cache key.
-    Optimized to skip None values and handle dates efficiently.
+
+    Fields are appended to a reused per-thread buffer as
+    `name<US>repr(value)` records separated by <RS> (no intermediate dict or
+    JSON encoding) and hashed once. None values and empty strings are
+    skipped; dates are keyed by their ISO format.
     """
-    fingerprint_payload = {
-        "entity": entity.value if hasattr(entity, "value") else str(entity),
-        "offset": offset,
-        "page_size": page_size,
-    }
-    
+    buffer = _key_buffer()
+
+    entity_value = entity.value if hasattr(entity, "value") else str(entity)
+    buffer += f"{entity_value!r}\x1f{offset!r}\x1f{page_size!r}".encode("utf-8")
+
     # Only include non-None values to reduce key size and improve cache efficiency
     if user_id is not None:
-        fingerprint_payload["user_id"] = user_id
+        buffer += f"\x1euser_id\x1f{user_id!r}".encode("utf-8")
     if access_level is not None:
-        fingerprint_payload["access_level"] = access_level
-    
-    # Add all filter parameters (skip None values and empty strings for efficiency)
+        buffer += f"\x1eaccess_level\x1f{access_level!r}".encode("utf-8")
+
+    # Sorted so the key does not depend on keyword order
     for key, value in sorted(filters.items()):
         if value is None or value == "":
-            continue  # Skip None values and empty strings to reduce cache key size
-        
-        # Convert date objects to strings for consistent hashing
+            continue
         if isinstance(value, date):
-            fingerprint_payload[key] = value.isoformat()
-        else:
-            fingerprint_payload[key] = value
-    
-    # Use sort_keys=True for deterministic ordering
-    fingerprint_json = json.dumps(fingerprint_payload, sort_keys=True, default=str)
-    return sha256(fingerprint_json.encode("utf-8")).hexdigest()
+            value = value.isoformat()
+        buffer += f"\x1e{key}\x1f{value!r}".encode("utf-8")
+
+    return _key_digest(buffer)
 
 
 def invalidate_listing_cache_for_entity(entity: ListingType | str) -> None:
@@ -5,11 +5,13 @@ Contains all entity-specific listing logic with filters and aggregation.
 Updated to match Alembic migrations.
 Optimized for performance with combined queries and eager loading.
 """
+import operator
 from datetime import date
+from functools import lru_cache, wraps
 from typing import Any, Dict, List, Optional, Set, Tuple, Callable
 
-from sqlalchemy import func, exc, and_
-from sqlalchemy.orm import Session, Query as SQLQuery, joinedload, selectinload
+from sqlalchemy import Float, and_, case, exc, func, or_, select, true
+from sqlalchemy.orm import Session, Query as SQLQuery, aliased
 
 from app.models.entity_models import (
     Rack,
@@ -25,8 +27,15 @@ from app.models.entity_models import (
     Model,
     ApplicationMapped,
 )
-from app.helpers.db_utils import db_operation
+from app.helpers.db_utils import (
+    child_count,
+    db_operation,
+    name_equals,
+    optimize_count_query,
+    upper_value,
+)
 from app.helpers.listing_types import ListingType
+from app.helpers.lookup_cache import get_lookup_tables
 
 
 # =============================================================================
@@ -34,60 +43,161 @@ from app.helpers.listing_types import ListingType
 # =============================================================================
 
 
+# Oracle rejects IN lists longer than 1000 expressions (ORA-01795)
+_IN_LIST_LIMIT = 1000
+
+
 def _restrict_to_locations(query, column, allowed_location_ids: Optional[Set[int]]):
+    """
+    Keep rows whose location is in the caller's scope (None = unrestricted).
+
+    Large scopes are split into OR'ed IN lists of at most 1000 ids, and each
+    list is padded (by repeating its last id) to a power-of-two length so
+    scopes of different sizes share a handful of statement texts instead of
+    one hard-parsed statement per size.
+    """
     if allowed_location_ids is None:
         return query
-    return query.filter(column.in_(allowed_location_ids))
+    ids = sorted(allowed_location_ids)
+    if len(ids) <= 1:
+        return query.filter(column.in_(ids))
 
-def apply_filters(
-    query: SQLQuery,
-    filters: Dict[str, Any],
-    filter_config: Dict[str, Tuple[Any, str]],
-) -> SQLQuery:
+    clauses = []
+    for start in range(0, len(ids), _IN_LIST_LIMIT):
+        chunk = ids[start:start + _IN_LIST_LIMIT]
+        padded_len = min(1 << (len(chunk) - 1).bit_length(), _IN_LIST_LIMIT)
+        chunk.extend(chunk[-1:] * (padded_len - len(chunk)))
+        clauses.append(column.in_(chunk))
+    return query.filter(or_(*clauses))
+
+
+# Rows buffered per cursor fetch when building a list_devices page
+_DEVICE_FETCH_BATCH = 200
+
+# Model of a device: the first (lowest id) model matching both its device
+# type and its make. Several models can match, and joining all of them would
+# repeat the device once per model (and break pagination).
+_device_model = aliased(Model)
+_DEVICE_MODEL_JOIN = Model.id == (
+    select(func.min(_device_model.id))
+    .where(
+        _device_model.device_type_id == Device.devicetype_id,
+        _device_model.make_id == Device.make_id,
+    )
+    .correlate(Device)
+    .scalar_subquery()
+)
+
+
+@lru_cache(maxsize=None)
+def _grouped_count(child_fk, label: str):
     """
-    Apply filters to a query dynamically based on filter configuration.
-    
+    `(SELECT fk, COUNT(*) AS label FROM child GROUP BY fk)` subquery.
+
+    It does not depend on the request, so it is built once per process and
+    shared by every call instead of being reassembled through the session on
+    each listing request.
+    """
+    return (
+        select(child_fk, func.count().label(label))
+        .group_by(child_fk)
+        .subquery()
+    )
+
+
+def _page_counts(db: Session, child_fk, parent_ids: List[int]) -> Dict[int, int]:
+    """
+    `{fk: count}` from `SELECT fk, COUNT(*) FROM child WHERE fk IN (:ids)
+    GROUP BY fk` - children of the given (page's) parents only. Parents
+    without children are absent.
+    """
+    if not parent_ids:
+        return {}
+    return dict(
+        db.execute(
+            select(child_fk, func.count())
+            .where(child_fk.in_(parent_ids))
+            .group_by(child_fk)
+        ).all()
+    )
+
+
+@lru_cache(maxsize=1)
+def _floor_rack_counts():
+    """
+    `(SELECT dc.floor_id, COUNT(rack.id) FROM datacenter dc JOIN rack ...
+    GROUP BY dc.floor_id)` - racks per floor, linked via their datacenter
+    (built once per process, like `_grouped_count`).
+    """
+    return (
+        select(Datacenter.floor_id, func.count(Rack.id).label("rack_count"))
+        .join(Rack, Datacenter.id == Rack.datacenter_id)
+        .group_by(Datacenter.floor_id)
+        .subquery()
+    )
+
+
+def _semi_join_exists(query, child_model, join_condition, child_condition):
+    """
+    Keep parents that have at least one matching child, as
+    `WHERE EXISTS (SELECT 1 FROM child WHERE join AND cond)`.
+
+    Replaces join + DISTINCT: the parent rows are never multiplied, so no
+    wide-row de-duplication is needed.
+    """
+    child_rows = (
+        select(1)
+        .where(join_condition, child_condition)
+        .correlate_except(child_model)
+    )
+    return query.filter(child_rows.exists())
+
+def _exact(column, value):
+    # Case-insensitive exact match, kept on UPPER(column) so the UPPER(name)
+    # function-based indexes (migration 024) apply. A NULL column never matches.
+    return func.upper(column) == upper_value(value)
+
+
+def _contains(column, value):
+    # Case-insensitive contains match
+    return func.upper(column).contains(upper_value(value))
+
+
+FilterSpec = Tuple[Tuple[str, Any, Callable[[Any, Any], Any]], ...]
+
+
+def apply_filters(query: SQLQuery, spec: FilterSpec, **values: Any) -> SQLQuery:
+    """
+    Apply the filters in `spec` whose value was given.
+
     Args:
         query: SQLAlchemy query object
-        filters: Dictionary of filter name -> filter value
-        filter_config: Dictionary mapping filter names to (model_attribute, filter_type)
-            filter_type can be:
-            - 'exact': Exact match (case-insensitive for strings)
-            - 'contains': Contains match (case-insensitive for strings)
-            - 'exact_int': Exact match for integers
-            - 'exact_date': Exact match for dates
-    
+        spec: (filter name, column, op) triples; op(column, value) returns the
+            predicate - _exact / _contains for strings, operator.eq for
+            integers and dates
+        **values: filter name -> filter value
+
     Returns:
         Query with filters applied
     """
-    for filter_name, filter_value in filters.items():
+    # Collect the predicates and apply them with a single filter() call
+    clauses = []
+    for filter_name, column, op in spec:
+        filter_value = values.get(filter_name)
         # Skip None values, empty strings, and whitespace-only strings
         # (FastAPI converts empty query params to "")
         if filter_value is None:
             continue
-        if isinstance(filter_value, str) and (filter_value == "" or not filter_value.strip()):
+        if isinstance(filter_value, str) and not filter_value.strip():
             continue
-        
-        if filter_name not in filter_config:
-            continue
-        
-        model_attr, filter_type = filter_config[filter_name]
-        
-        if filter_type == 'exact':
-            # Case-insensitive exact match for strings
-            # Handle NULL values properly - if model_attr is NULL, the comparison will be NULL (falsy)
-            query = query.filter(func.upper(model_attr) == func.upper(filter_value))
-        elif filter_type == 'contains':
-            # Case-insensitive contains match for strings
-            query = query.filter(func.upper(model_attr).contains(func.upper(filter_value)))
-        elif filter_type == 'exact_int':
-            # Exact match for integers
-            query = query.filter(model_attr == filter_value)
-        elif filter_type == 'exact_date':
-            # Exact match for dates
-            query = query.filter(model_attr == filter_value)
-    
-    return query
+        clauses.append(op(column, filter_value))
+
+    return query.filter(*clauses) if clauses else query
+
+
+def _table_count(db: Session, model: Any) -> int:
+    """Row count of a whole table - a primary key index scan, no joins."""
+    return db.execute(select(func.count()).select_from(model)).scalar_one()
 
 
 def get_paginated_results(
@@ -95,7 +205,9 @@ def get_paginated_results(
     offset: int,
     page_size: int,
     order_by_column: Any,
-) -> Tuple[int, List[Any]]:
+    include_total: bool = True,
+    after_id: Optional[int] = None,
+) -> Tuple[Optional[int], List[Any]]:
     """
     Get paginated results with total count in a single database query using window function.
     This avoids making two separate queries (one for count, one for data).
@@ -105,13 +217,54 @@ def get_paginated_results(
         offset: Offset for pagination
         page_size: Number of results per page
         order_by_column: Column to order by (e.g., Device.id)
+        include_total: When False the caller already knows the total, so the
+            COUNT(*) OVER() window is skipped and None is returned for it
+        after_id: Keyset cursor - when given, rows with order_by_column
+            greater than it are returned and offset is ignored
     
     Returns:
         Tuple of (total_count, list of results)
     """
+    if include_total and query.whereclause is None:
+        # Nothing filters the rows and every inner join in the listings
+        # follows a NOT NULL foreign key, so the total is the table's row
+        # count. Counting the table alone lets the page query stop after
+        # offset + page_size rows instead of windowing over all of them.
+        total = _table_count(query.session, order_by_column.class_)
+        if not total:
+            return total, []
+        _, data = get_paginated_results(
+            query, offset, page_size, order_by_column,
+            include_total=False, after_id=after_id,
+        )
+        return total, data
+
+    if after_id is not None:
+        # Keyset page: seek past the cursor on the ordering index instead of
+        # reading and discarding offset rows. A window count here would only
+        # cover rows after the cursor, so the total is counted separately.
+        total = optimize_count_query(query.session, query) if include_total else None
+        _, data = get_paginated_results(
+            query.filter(order_by_column > after_id),
+            0,
+            page_size,
+            order_by_column,
+            include_total=False,
+        )
+        return total, data
+
     # Apply ordering - this will replace any existing ordering
     # Filters are already applied to the query before this function is called
     query = query.order_by(order_by_column.asc())
+
+    if not include_total:
+        # No window function: the database can stop after offset + page_size rows
+        paged = query.offset(offset).limit(page_size)
+        results = query.session.execute(paged.statement).all()
+        if len(query.column_descriptions) == 1:
+            # Unwrapped like the single-column case below
+            return None, [row[0] for row in results]
+        return None, [tuple(row) for row in results]
     
     # Use window function to get total count in the same query
     # This adds COUNT(*) OVER() which gives us the total without a separate query
@@ -139,37 +292,67 @@ def get_paginated_results(
         # Extract total count (last element)
         total = first_result[-1] if len(first_result) > 0 else 0
         
-        # Remove the count column from results (it's always the last element)
-        # Convert Row objects to tuples and slice to remove the count column
+        # Remove the count column from results (it's always the last element).
+        # Every row has the same shape, so pick the conversion once.
+        if num_columns == 1:
+            # Single column result
+            data = [row[0] for row in results]
+        else:
+            # Multi-column result - return tuple without the count
+            data = [row[:num_columns] for row in results]
+    elif offset == 0:
+        # No rows on the first page means nothing matched the filters
+        total = 0
         data = []
-        for row in results:
-            # Convert to tuple if it's a Row object, otherwise use as-is
-            if hasattr(row, '_asdict'):
-                # SQLAlchemy Row object - convert to tuple
-                row_tuple = tuple(row)
-            else:
-                row_tuple = tuple(row) if isinstance(row, (tuple, list)) else (row,)
-            
-            # Remove the last element (the count) and keep the rest
-            if num_columns == 1:
-                # Single column result
-                data.append(row_tuple[0])
-            else:
-                # Multi-column result - return tuple without the count
-                data.append(row_tuple[:num_columns])
     else:
-        # No results - need to get count separately for accuracy
-        # This is a fallback when window function returns no rows
-        total = query.count()
+        # Page past the end - the window function returned no rows, so the
+        # total has to be counted separately (flat COUNT(*) over the FROM/
+        # WHERE, not a subquery over the full select list)
+        total = optimize_count_query(query.session, query)
         data = []
     
     return total, data
 
 
+class ListingDatabaseError(Exception):
+    """A listing query failed; the SQLAlchemy error is kept as __cause__."""
+
+    def __init__(self, handler_name: str) -> None:
+        super().__init__(handler_name)
+        self.handler_name = handler_name
+
+    def __str__(self) -> str:
+        # Rendered on demand - a DBAPIError's text includes the full SQL
+        return f"Database error in {self.handler_name}: {self.__cause__}"
+
+
+def _db_errors(handler: Callable[..., Any]) -> Callable[..., Any]:
+    """Re-raise SQLAlchemy errors from a list_* handler as ListingDatabaseError."""
+    @wraps(handler)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return handler(*args, **kwargs)
+        except exc.SQLAlchemyError as e:
+            raise ListingDatabaseError(handler.__name__) from e
+
+    return wrapper
+
+
 # =============================================================================
 # Entity-specific listing functions
+#
+# Each *_FILTERS spec lists (filter name, column, op) for apply_filters.
+# They only reference mapped columns, so they are built once
+# at import instead of on every request.
 # =============================================================================
 
+_LOCATION_FILTERS = (
+    ('location_name', Location.name, _exact),
+    ('location_description', Location.description, _contains),
+)
+
+
+@_db_errors
 def list_locations(
     db: Session,
     offset: int,
@@ -178,75 +361,70 @@ def list_locations(
     location_description: Optional[str] = None,
     building_name: Optional[str] = None,
     allowed_location_ids: Optional[Set[int]] = None,
+    include_total: bool = True,
+    after_id: Optional[int] = None,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List locations with building counts.
     Returns: (total_count, list of location dicts)
     Optimized: Single query for counts, efficient pagination.
     """
-    try:
-        # Optimize: Get building counts in a single query for all locations
-        # This is more efficient than querying all and filtering
-        building_counts_subq = (
-            db.query(
-                Building.location_id,
-                func.count(Building.id).label('count')
-            )
-            .group_by(Building.location_id)
-            .subquery()
+    # Building counts are correlated per location, so only the
+    # locations on the returned page are counted
+    base_q = (
+        db.query(
+            Location,
+            child_count(Building.location_id, Location.id).label('building_count')
         )
-        
-        # Main query with left join for counts
-        base_q = (
-            db.query(
-                Location,
-                func.coalesce(building_counts_subq.c.count, 0).label('building_count')
-            )
-            .outerjoin(
-                building_counts_subq,
-                Location.id == building_counts_subq.c.location_id
-            )
-            .order_by(Location.id.asc())
+        .order_by(Location.id.asc())
+    )
+    base_q = _restrict_to_locations(base_q, Location.id, allowed_location_ids)
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _LOCATION_FILTERS,
+        location_name=location_name,
+        location_description=location_description,
+    )
+    
+    if building_name and building_name.strip():
+        base_q = _semi_join_exists(
+            base_q,
+            Building,
+            Location.id == Building.location_id,
+            name_equals(Building, building_name),
         )
-        base_q = _restrict_to_locations(base_q, Location.id, allowed_location_ids)
-        
-        # Apply filters dynamically
-        filter_config = {
-            'location_name': (Location.name, 'exact'),
-            'location_description': (Location.description, 'contains'),
-        }
-        filters = {
-            'location_name': location_name,
-            'location_description': location_description,
+    
+    # Use optimized pagination that gets count and data in single query
+    total, rows = get_paginated_results(
+        base_q, offset, page_size, Location.id,
+        include_total=include_total, after_id=after_id,
+    )
+
+    data = [
+        {
+            "id": loc.id,
+            "name": loc.name,
+            "description": loc.description,
+            "buildings": building_count,
         }
-        base_q = apply_filters(base_q, filters, filter_config)
-        
-        if building_name and building_name.strip():
-            base_q = (
-                base_q.join(Building, Location.id == Building.location_id)
-                .filter(func.upper(Building.name) == func.upper(building_name))
-                .distinct()
-            )
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, Location.id)
-
-        data = [
-            {
-                "id": loc.id,
-                "name": loc.name,
-                "description": loc.description,
-                "buildings": int(building_count),
-            }
-            for loc, building_count in rows
-        ]
+        for loc, building_count in rows
+    ]
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_locations: {str(e)}")
+    return total, data
 
 
+_BUILDING_FILTERS = (
+    ('location_name', Location.name, _exact),
+    ('building_name', Building.name, _exact),
+    ('building_status', Building.status, _exact),
+    ('building_description', Building.description, _contains),
+)
+
+
+@_db_errors
 def list_buildings(
     db: Session,
     offset: int,
@@ -258,94 +436,108 @@ def list_buildings(
     rack_name: Optional[str] = None,
     device_name: Optional[str] = None,
     allowed_location_ids: Optional[Set[int]] = None,
+    include_total: bool = True,
+    after_id: Optional[int] = None,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List buildings with rack/device counts.
     Optimized: Combined count queries, eager loading, single query for stats.
     """
-    try:
-        # Optimize: Get all counts in a single query using subqueries
-        rack_counts_subq = (
-            db.query(
-                Rack.building_id,
-                func.count(Rack.id).label('rack_count')
-            )
-            .group_by(Rack.building_id)
-            .subquery()
+    # Rack/device counts are correlated per building, so only the
+    # buildings on the returned page are counted
+    base_q = (
+        db.query(
+            Building,
+            Location,
+            child_count(Rack.building_id, Building.id).label('rack_count'),
+            child_count(Device.building_id, Building.id).label('device_count')
         )
-        device_counts_subq = (
-            db.query(
-                Device.building_id,
-                func.count(Device.id).label('device_count')
-            )
-            .group_by(Device.building_id)
-            .subquery()
+        .join(Location, Building.location_id == Location.id)
+        .order_by(Building.id.asc())
+    )
+    base_q = _restrict_to_locations(base_q, Building.location_id, allowed_location_ids)
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _BUILDING_FILTERS,
+        location_name=location_name,
+        building_name=building_name,
+        building_status=building_status,
+        building_description=building_description,
+    )
+    
+    if rack_name and rack_name.strip():
+        base_q = _semi_join_exists(
+            base_q,
+            Rack,
+            Building.id == Rack.building_id,
+            name_equals(Rack, rack_name),
         )
-        
-        base_q = (
-            db.query(
-                Building,
-                Location,
-                func.coalesce(rack_counts_subq.c.rack_count, 0).label('rack_count'),
-                func.coalesce(device_counts_subq.c.device_count, 0).label('device_count')
-            )
-            .join(Location, Building.location_id == Location.id)
-            .outerjoin(rack_counts_subq, Building.id == rack_counts_subq.c.building_id)
-            .outerjoin(device_counts_subq, Building.id == device_counts_subq.c.building_id)
-            .order_by(Building.id.asc())
+    if device_name and device_name.strip():
+        base_q = _semi_join_exists(
+            base_q,
+            Device,
+            Building.id == Device.building_id,
+            name_equals(Device, device_name),
         )
-        base_q = _restrict_to_locations(base_q, Building.location_id, allowed_location_ids)
-        
-        # Apply filters dynamically
-        filter_config = {
-            'location_name': (Location.name, 'exact'),
-            'building_name': (Building.name, 'exact'),
-            'building_status': (Building.status, 'exact'),
-            'building_description': (Building.description, 'contains'),
-        }
-        filters = {
-            'location_name': location_name,
-            'building_name': building_name,
-            'building_status': building_status,
-            'building_description': building_description,
+    
+    # Use optimized pagination that gets count and data in single query
+    total, rows = get_paginated_results(
+        base_q, offset, page_size, Building.id,
+        include_total=include_total, after_id=after_id,
+    )
+
+    data = [
+        {
+            "id": building.id,
+            "name": building.name,
+            "status": building.status,
+            "description": building.description,
+            "location_name": location.name if location else None,
+            "devices": device_count,
+            "racks": rack_count,
         }
-        base_q = apply_filters(base_q, filters, filter_config)
-        
-        if rack_name and rack_name.strip():
-            base_q = (
-                base_q.join(Rack, Building.id == Rack.building_id)
-                .filter(func.upper(Rack.name) == func.upper(rack_name))
-                .distinct()
-            )
-        if device_name and device_name.strip():
-            base_q = (
-                base_q.join(Device, Building.id == Device.building_id)
-                .filter(func.upper(Device.name) == func.upper(device_name))
-                .distinct()
-            )
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, Building.id)
-
-        data = [
-            {
-                "id": building.id,
-                "name": building.name,
-                "status": building.status,
-                "description": building.description,
-                "location_name": location.name if location else None,
-                "devices": int(device_count),
-                "racks": int(rack_count),
-            }
-            for building, location, rack_count, device_count in rows
-        ]
+        for building, location, rack_count, device_count in rows
+    ]
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_buildings: {str(e)}")
+    return total, data
 
 
+_RACK_FILTERS = (
+    ('location_name', Location.name, _exact),
+    ('building_name', Building.name, _exact),
+    ('wing_name', Wing.name, _exact),
+    ('floor_name', Floor.name, _exact),
+    ('rack_name', Rack.name, _exact),
+    ('rack_status', Rack.status, _exact),
+    ('rack_height', Rack.height, operator.eq),
+    ('rack_description', Rack.description, _contains),
+    ('datacenter_name', Datacenter.name, _exact),
+)
+
+
+# Remaining rack space, clamped at zero: space_available when set, otherwise
+# height - space_used. A portable CASE rather than GREATEST (missing on SQLite
+# and NULL on Oracle whenever an argument is NULL).
+_rack_available = func.coalesce(
+    Rack.space_available,
+    func.coalesce(Rack.height, 0) - func.coalesce(Rack.space_used, 0),
+)
+_RACK_REMAINING_SPACE = case((_rack_available > 0, _rack_available), else_=0)
+# Share of the rack still free, in percent to two decimals; NULL without a
+# positive height. Integer "/" is rendered as true division on every dialect.
+_RACK_AVAILABLE_PERCENT = case(
+    (
+        Rack.height > 0,
+        func.round(_RACK_REMAINING_SPACE * 100 / Rack.height, 2, type_=Float),
+    ),
+    else_=None,
+)
+
+
+@_db_errors
 def list_racks(
     db: Session,
     offset: int,
@@ -361,114 +553,125 @@ def list_racks(
     datacenter_name: Optional[str] = None,
     device_name: Optional[str] = None,
     allowed_location_ids: Optional[Set[int]] = None,
+    include_total: bool = True,
+    after_id: Optional[int] = None,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List racks with device counts and remaining space.
     Optimized: Combined query with device counts, eager loading.
     """
-    try:
-        # Optimize: Get device counts in a single subquery
-        device_counts_subq = (
-            db.query(
-                Device.rack_id,
-                func.count(Device.id).label("device_count")
-            )
-            .group_by(Device.rack_id)
-            .subquery()
+    # Device counts are correlated per rack, so only the racks on the
+    # returned page are counted. Plain columns rather than six mapped
+    # entities per row - only these fields reach the payload.
+    base_q = (
+        db.query(
+            Rack.id,
+            Rack.name,
+            Location.name,
+            Building.name,
+            Wing.name,
+            Floor.name,
+            Datacenter.name,
+            Rack.status,
+            Rack.height,
+            Rack.description,
+            Rack.space_used,
+            _RACK_REMAINING_SPACE.label("remaining_space"),
+            _RACK_AVAILABLE_PERCENT.label("available_space_percent"),
+            child_count(Device.rack_id, Rack.id).label("device_count")
         )
-        
-        base_q = (
-            db.query(
-                Rack,
-                Location,
-                Building,
-                Wing,
-                Floor,
-                Datacenter,
-                func.coalesce(device_counts_subq.c.device_count, 0).label("device_count")
-            )
-            .join(Location, Rack.location_id == Location.id)
-            .join(Building, Rack.building_id == Building.id)
-            .outerjoin(Wing, Rack.wing_id == Wing.id)
-            .outerjoin(Floor, Rack.floor_id == Floor.id)
-            .outerjoin(Datacenter, Rack.datacenter_id == Datacenter.id)
-            .outerjoin(device_counts_subq, Rack.id == device_counts_subq.c.rack_id)
-            .order_by(Rack.id.asc())
+        .join(Location, Rack.location_id == Location.id)
+        .join(Building, Rack.building_id == Building.id)
+        .outerjoin(Wing, Rack.wing_id == Wing.id)
+        .outerjoin(Floor, Rack.floor_id == Floor.id)
+        .outerjoin(Datacenter, Rack.datacenter_id == Datacenter.id)
+        .order_by(Rack.id.asc())
+    )
+    base_q = _restrict_to_locations(base_q, Rack.location_id, allowed_location_ids)
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _RACK_FILTERS,
+        location_name=location_name,
+        building_name=building_name,
+        wing_name=wing_name,
+        floor_name=floor_name,
+        rack_name=rack_name,
+        rack_status=rack_status,
+        rack_height=rack_height,
+        rack_description=rack_description,
+        datacenter_name=datacenter_name,
+    )
+    
+    if device_name and device_name.strip():
+        base_q = _semi_join_exists(
+            base_q,
+            Device,
+            Rack.id == Device.rack_id,
+            name_equals(Device, device_name),
         )
-        base_q = _restrict_to_locations(base_q, Rack.location_id, allowed_location_ids)
-        
-        # Apply filters dynamically
-        filter_config = {
-            'location_name': (Location.name, 'exact'),
-            'building_name': (Building.name, 'exact'),
-            'wing_name': (Wing.name, 'exact'),
-            'floor_name': (Floor.name, 'exact'),
-            'rack_name': (Rack.name, 'exact'),
-            'rack_status': (Rack.status, 'exact'),
-            'rack_height': (Rack.height, 'exact_int'),
-            'rack_description': (Rack.description, 'contains'),
-            'datacenter_name': (Datacenter.name, 'exact'),
-        }
-        filters = {
-            'location_name': location_name,
-            'building_name': building_name,
-            'wing_name': wing_name,
-            'floor_name': floor_name,
-            'rack_name': rack_name,
-            'rack_status': rack_status,
-            'rack_height': rack_height,
-            'rack_description': rack_description,
-            'datacenter_name': datacenter_name,
-        }
-        base_q = apply_filters(base_q, filters, filter_config)
-        
-        if device_name and device_name.strip():
-            base_q = (
-                base_q.join(Device, Rack.id == Device.rack_id)
-                .filter(func.upper(Device.name) == func.upper(device_name))
-                .distinct()
-            )
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, Rack.id)
+    
+    # Use optimized pagination that gets count and data in single query
+    total, rows = get_paginated_results(
+        base_q, offset, page_size, Rack.id,
+        include_total=include_total, after_id=after_id,
+    )
 
-        data = []
-        for rack, location, building, wing, floor, datacenter, devices_count in rows:
-            rack_height = rack.height or 0
-            used_space = rack.space_used or 0
-            available_space = rack.space_available
-            if available_space is None:
-                available_space = max(rack_height - used_space, 0)
-            remaining_space = max(available_space, 0)
-            
-            # Calculate available space percentage
-            available_space_percent = None
-            if rack_height > 0:
-                available_space_percent = round((remaining_space / rack_height) * 100, 2)
-
-            data.append({
-                "id": rack.id,
-                "name": rack.name,
-                "location_name": location.name if location else None,
-                "building_name": building.name if building else None,
-                "wing_name": wing.name if wing else None,
-                "floor_name": floor.name if floor else None,
-                "datacenter_name": datacenter.name if datacenter else None,
-                "status": rack.status,
-                "height": rack.height,
-                "description": rack.description,
-                "devices": int(devices_count),
-                "used_space": used_space,
-                "available_space": remaining_space,
-                "available_space_percent": available_space_percent,
-            })
+    data = []
+    for (rack_id, name, location_name, building_name, wing_name, floor_name,
+         datacenter_name, status, height, description, space_used,
+         remaining_space, available_space_percent, devices_count) in rows:
+        data.append({
+            "id": rack_id,
+            "name": name,
+            "location_name": location_name,
+            "building_name": building_name,
+            "wing_name": wing_name,
+            "floor_name": floor_name,
+            "datacenter_name": datacenter_name,
+            "status": status,
+            "height": height,
+            "description": description,
+            "devices": devices_count,
+            "used_space": space_used or 0,
+            "available_space": remaining_space,
+            "available_space_percent": available_space_percent,
+        })
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_racks: {str(e)}")
+    return total, data
 
 
+_DEVICE_FILTERS = (
+    ('location_name', Location.name, _exact),
+    ('building_name', Building.name, _exact),
+    ('wing_name', Wing.name, _exact),
+    ('floor_name', Floor.name, _exact),
+    ('rack_name', Rack.name, _exact),
+    ('device_name', Device.name, _exact),
+    ('device_status', Device.status, _exact),
+    ('device_position', Device.position, operator.eq),
+    # 'device_face' filter removed; face is now derived from face_front/face_rear
+    ('device_description', Device.description, _contains),
+    ('serial_number', Device.serial_no, _exact),
+    ('ip_address', Device.ip, _exact),
+    ('po_number', Device.po_number, _exact),
+    ('asset_user', Device.asset_user, _exact),
+    ('asset_owner', AssetOwner.name, _exact),
+    ('applications_mapped_name', ApplicationMapped.name, _exact),
+    ('warranty_start_date', Device.warranty_start_date, operator.eq),
+    ('warranty_end_date', Device.warranty_end_date, operator.eq),
+    ('amc_start_date', Device.amc_start_date, operator.eq),
+    ('amc_end_date', Device.amc_end_date, operator.eq),
+    ('device_type', DeviceType.name, _exact),
+    ('make_name', Make.name, _exact),
+    ('model_name', Model.name, _exact),
+    ('datacenter_name', Datacenter.name, _exact),
+)
+
+
+@_db_errors
 def list_devices(
     db: Session,
     offset: int,
@@ -498,209 +701,186 @@ def list_devices(
     model_name: Optional[str] = None,
     datacenter_name: Optional[str] = None,
     allowed_location_ids: Optional[Set[int]] = None,
+    include_total: bool = True,
+    after_id: Optional[int] = None,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List devices with all related information.
     Optimized: Explicit joins instead of lazy loading, efficient filtering.
     """
-    try:
-        # Determine which joins should be inner joins based on filters
-        # If filtering by a column from an outerjoined table, use inner join to ensure filter works correctly
-        use_inner_join_device_type = (device_type is not None and device_type.strip() != "") or (model_name is not None and model_name.strip() != "")
-        use_inner_join_make = make_name is not None and make_name.strip() != ""
-        use_inner_join_model = model_name is not None and model_name.strip() != ""
-        use_inner_join_location = location_name is not None and location_name.strip() != ""
-        use_inner_join_building = building_name is not None and building_name.strip() != ""
-        use_inner_join_rack = rack_name is not None and rack_name.strip() != ""
-        use_inner_join_datacenter = datacenter_name is not None and datacenter_name.strip() != ""
-        use_inner_join_application = applications_mapped_name is not None and applications_mapped_name.strip() != ""
-        use_inner_join_asset_owner = asset_owner is not None and asset_owner.strip() != ""
-        
-        # Use explicit joins for better performance and control
-        base_q = (
-            db.query(
-                Device,
-                Location,
-                Building,
-                Wing,
-                Floor,
-                Datacenter,
-                Rack,
-                Make,
-                DeviceType,
-                Model,
-                ApplicationMapped,
-                AssetOwner
-            )
+    def _is_set(value: Optional[str]) -> bool:
+        return value is not None and value.strip() != ""
+
+    # Step 1: filter, count and paginate on device ids only. Related
+    # tables are joined only when an active filter references them
+    # (inner joins - an equality filter never matches NULL anyway).
+    id_joins = (
+        (_is_set(location_name), Location, Device.location_id == Location.id),
+        (_is_set(building_name), Building, Device.building_id == Building.id),
+        (_is_set(wing_name), Wing, Device.wings_id == Wing.id),
+        (_is_set(floor_name), Floor, Device.floor_id == Floor.id),
+        (_is_set(datacenter_name), Datacenter, Device.dc_id == Datacenter.id),
+        (_is_set(rack_name), Rack, Device.rack_id == Rack.id),
+        (_is_set(make_name), Make, Device.make_id == Make.id),
+        (_is_set(device_type), DeviceType, Device.devicetype_id == DeviceType.id),
+        (_is_set(model_name), Model, _DEVICE_MODEL_JOIN),
+        (
+            _is_set(applications_mapped_name) or _is_set(asset_owner),
+            ApplicationMapped,
+            Device.applications_mapped_id == ApplicationMapped.id,
+        ),
+        (_is_set(asset_owner), AssetOwner, ApplicationMapped.asset_owner_id == AssetOwner.id),
+    )
+    base_q = db.query(Device.id)
+    for needed, target, onclause in id_joins:
+        if needed:
+            base_q = base_q.join(target, onclause)
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _DEVICE_FILTERS,
+        location_name=location_name,
+        building_name=building_name,
+        wing_name=wing_name,
+        floor_name=floor_name,
+        rack_name=rack_name,
+        device_name=device_name,
+        device_status=device_status,
+        device_position=device_position,
+        # device_face removed; see note above
+        device_description=device_description,
+        serial_number=serial_number,
+        ip_address=ip_address,
+        po_number=po_number,
+        asset_user=asset_user,
+        asset_owner=asset_owner,
+        applications_mapped_name=applications_mapped_name,
+        warranty_start_date=warranty_start_date,
+        warranty_end_date=warranty_end_date,
+        amc_start_date=amc_start_date,
+        amc_end_date=amc_end_date,
+        device_type=device_type,
+        make_name=make_name,
+        model_name=model_name,
+        datacenter_name=datacenter_name,
+    )
+
+    base_q = _restrict_to_locations(base_q, Device.location_id, allowed_location_ids)
+    
+    # Use optimized pagination that gets count and data in single query
+    total, device_ids = get_paginated_results(
+        base_q, offset, page_size, Device.id,
+        include_total=include_total, after_id=after_id,
+    )
+    if not device_ids:
+        return total, []
+
+    # Step 2: the payload columns for the page's devices only. Names from
+    # the rarely edited lookup tables are resolved in-process (see
+    # lookup_cache) rather than joined; the rest are joined per device.
+    # Explicit "= true()" so pre-23c Oracle (no native boolean) gets "= 1"
+    face_front = Device.face_front == true()
+    face_rear = Device.face_rear == true()
+    face = case(
+        (and_(face_front, face_rear), "both"),
+        (face_front, "front"),
+        (face_rear, "rear"),
+        else_=None,
+    )
+    stmt = (
+        select(
+            Device.id,
+            Device.name,
+            Device.position,
+            face,
+            Device.status,
+            Device.description,
+            Device.building_id,
+            Device.location_id,
+            Wing.name,
+            Floor.name,
+            Device.dc_id,
+            Rack.name,
+            Device.make_id,
+            Device.devicetype_id,
+            Device.ip,
+            Device.po_number,
+            AssetOwner.name,
+            Device.asset_user,
+            ApplicationMapped.name,
+            Device.warranty_start_date,
+            Device.warranty_end_date,
+            Device.amc_start_date,
+            Device.amc_end_date,
+            Device.serial_no,
         )
-        
-        # Apply joins - use inner join if filtering by that table's columns, otherwise outer join
-        if use_inner_join_location:
-            base_q = base_q.join(Location, Device.location_id == Location.id)
-        else:
-            base_q = base_q.outerjoin(Location, Device.location_id == Location.id)
-            
-        if use_inner_join_building:
-            base_q = base_q.join(Building, Device.building_id == Building.id)
-        else:
-            base_q = base_q.outerjoin(Building, Device.building_id == Building.id)
-            
-        base_q = base_q.outerjoin(Wing, Device.wings_id == Wing.id)
-        base_q = base_q.outerjoin(Floor, Device.floor_id == Floor.id)
-        
-        if use_inner_join_datacenter:
-            base_q = base_q.join(Datacenter, Device.dc_id == Datacenter.id)
-        else:
-            base_q = base_q.outerjoin(Datacenter, Device.dc_id == Datacenter.id)
-            
-        if use_inner_join_rack:
-            base_q = base_q.join(Rack, Device.rack_id == Rack.id)
-        else:
-            base_q = base_q.outerjoin(Rack, Device.rack_id == Rack.id)
-            
-        if use_inner_join_make:
-            base_q = base_q.join(Make, Device.make_id == Make.id)
-        else:
-            base_q = base_q.outerjoin(Make, Device.make_id == Make.id)
-            
-        if use_inner_join_device_type:
-            base_q = base_q.join(DeviceType, Device.devicetype_id == DeviceType.id)
-        else:
-            base_q = base_q.outerjoin(DeviceType, Device.devicetype_id == DeviceType.id)
-            
-        # Join Model by matching both device_type_id AND make_id to get the correct model
-        if use_inner_join_model:
-            base_q = base_q.join(Model, and_(
-                DeviceType.id == Model.device_type_id,
-                Device.make_id == Model.make_id
-            ))
-        else:
-            base_q = base_q.outerjoin(Model, and_(
-                DeviceType.id == Model.device_type_id,
-                Device.make_id == Model.make_id
-            ))
-            
-        if use_inner_join_application:
-            base_q = base_q.join(ApplicationMapped, Device.applications_mapped_id == ApplicationMapped.id)
-        else:
-            base_q = base_q.outerjoin(ApplicationMapped, Device.applications_mapped_id == ApplicationMapped.id)
-            
-        if use_inner_join_asset_owner:
-            base_q = base_q.join(AssetOwner, ApplicationMapped.asset_owner_id == AssetOwner.id)
-        else:
-            base_q = base_q.outerjoin(AssetOwner, ApplicationMapped.asset_owner_id == AssetOwner.id)
-        
-        # Apply filters dynamically
-        filter_config = {
-            'location_name': (Location.name, 'exact'),
-            'building_name': (Building.name, 'exact'),
-            'wing_name': (Wing.name, 'exact'),
-            'floor_name': (Floor.name, 'exact'),
-            'rack_name': (Rack.name, 'exact'),
-            'device_name': (Device.name, 'exact'),
-            'device_status': (Device.status, 'exact'),
-            'device_position': (Device.position, 'exact_int'),
-            # 'device_face' filter removed; face is now derived from face_front/face_rear
-            'device_description': (Device.description, 'contains'),
-            'serial_number': (Device.serial_no, 'exact'),
-            'ip_address': (Device.ip, 'exact'),
-            'po_number': (Device.po_number, 'exact'),
-            'asset_user': (Device.asset_user, 'exact'),
-            'asset_owner': (AssetOwner.name, 'exact'),
-            'applications_mapped_name': (ApplicationMapped.name, 'exact'),
-            'warranty_start_date': (Device.warranty_start_date, 'exact_date'),
-            'warranty_end_date': (Device.warranty_end_date, 'exact_date'),
-            'amc_start_date': (Device.amc_start_date, 'exact_date'),
-            'amc_end_date': (Device.amc_end_date, 'exact_date'),
-            'device_type': (DeviceType.name, 'exact'),
-            'make_name': (Make.name, 'exact'),
-            'model_name': (Model.name, 'exact'),
-            'datacenter_name': (Datacenter.name, 'exact'),
-        }
-        
-        filters = {
-            'location_name': location_name,
-            'building_name': building_name,
-            'wing_name': wing_name,
-            'floor_name': floor_name,
-            'rack_name': rack_name,
-            'device_name': device_name,
-            'device_status': device_status,
-            'device_position': device_position,
-            # 'device_face': device_face,  # removed; see note above
-            'device_description': device_description,
-            'serial_number': serial_number,
-            'ip_address': ip_address,
-            'po_number': po_number,
-            'asset_user': asset_user,
-            'asset_owner': asset_owner,
-            'applications_mapped_name': applications_mapped_name,
-            'warranty_start_date': warranty_start_date,
-            'warranty_end_date': warranty_end_date,
-            'amc_start_date': amc_start_date,
-            'amc_end_date': amc_end_date,
-            'device_type': device_type,
-            'make_name': make_name,
-            'model_name': model_name,
-            'datacenter_name': datacenter_name,
-        }
-        
-        base_q = apply_filters(base_q, filters, filter_config)
+        .outerjoin(Wing, Device.wings_id == Wing.id)
+        .outerjoin(Floor, Device.floor_id == Floor.id)
+        .outerjoin(Rack, Device.rack_id == Rack.id)
+        .outerjoin(ApplicationMapped, Device.applications_mapped_id == ApplicationMapped.id)
+        .outerjoin(AssetOwner, ApplicationMapped.asset_owner_id == AssetOwner.id)
+        .where(Device.id.in_(device_ids))
+        .order_by(Device.id.asc())
+    )
+    lookups = get_lookup_tables(db)
+    no_model = (None, None, None, None)
 
-        base_q = _restrict_to_locations(base_q, Device.location_id, allowed_location_ids)
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, Device.id)
+    data = []
+    # Fetched in bounded batches (export pages are larger than API pages)
+    for (
+        device_id, name, position, face_value, status, description,
+        building_id, location_id, wing, floor, dc_id, rack,
+        make_id, devicetype_id, ip, po_number, owner, asset_user,
+        application, warranty_start, warranty_end, amc_start, amc_end,
+        serial_no,
+    ) in db.execute(stmt.execution_options(yield_per=_DEVICE_FETCH_BATCH)):
+        height, model_name_value, front_image, rear_image = lookups.models.get(
+            (devicetype_id, make_id), no_model
+        )
+        data.append({
+            "id": device_id,
+            "name": name,
+            "position": position,
+            "face": face_value,
+            "status": status,
+            "description": description,
+            "building_name": lookups.buildings.get(building_id),
+            "location_name": lookups.locations.get(location_id),
+            "wing_name": wing,
+            "floor_name": floor,
+            "datacenter_name": lookups.datacenters.get(dc_id),
+            "rack_name": rack,
+            "height": height,
+            "make": lookups.makes.get(make_id),
+            "model_name": model_name_value,
+            "device_type": lookups.device_types.get(devicetype_id),
+            "ip_address": ip,
+            "po_number": po_number,
+            "asset_owner": owner,
+            "asset_user": asset_user,
+            "applications_mapped_name": application,
+            "warranty_start_date": warranty_start,
+            "warranty_end_date": warranty_end,
+            "amc_start_date": amc_start,
+            "amc_end_date": amc_end,
+            "serial_number": serial_no,
+            "front_image_path": front_image,
+            "rear_image_path": rear_image,
+        })
 
-        data = []
-        for (device, location, building, wing, floor, datacenter, rack,
-             make, device_type_obj, model, application, asset_owner) in rows:
-            # Derive human-readable face from boolean flags
-            if device.face_front and device.face_rear:
-                face_value = "both"
-            elif device.face_front:
-                face_value = "front"
-            elif device.face_rear:
-                face_value = "rear"
-            else:
-                face_value = None
-            data.append({
-                "id": device.id,
-                "name": device.name,
-                "position": device.position,
-                "face": face_value,
-                "status": device.status,
-                "description": device.description,
-                "building_name": building.name if building else None,
-                "location_name": location.name if location else None,
-                "wing_name": wing.name if wing else None,
-                "floor_name": floor.name if floor else None,
-                "datacenter_name": datacenter.name if datacenter else None,
-                "rack_name": rack.name if rack else None,
-                "height": model.height if model else None,
-                "make": make.name if make else None,
-                "model_name": model.name if model else None,
-                "device_type": device_type_obj.name if device_type_obj else None,
-                "ip_address": device.ip,
-                "po_number": device.po_number,
-                "asset_owner": asset_owner.name if asset_owner else None,
-                "asset_user": device.asset_user,
-                "applications_mapped_name": application.name if application else None,
-                "warranty_start_date": device.warranty_start_date,
-                "warranty_end_date": device.warranty_end_date,
-                "amc_start_date": device.amc_start_date,
-                "amc_end_date": device.amc_end_date,
-                "serial_number": device.serial_no,
-                "front_image_path": model.front_image_path if model else None,
-                "rear_image_path": model.rear_image_path if model else None,
-            })
+    return total, data
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_devices: {str(e)}")
 
+_DEVICE_TYPE_FILTERS = (
+    ('device_type', DeviceType.name, _exact),
+    ('device_type_description', DeviceType.description, _contains),
+    ('make_name', Make.name, _exact),
+)
 
+
+@_db_errors
 def list_device_types(
     db: Session,
     offset: int,
@@ -708,97 +888,81 @@ def list_device_types(
     device_type: Optional[str] = None,
     device_type_description: Optional[str] = None,
     make_name: Optional[str] = None,
+    include_total: bool = True,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List device types with make info and instance counts.
     Optimized: Combined query with device counts, explicit joins.
     """
-    try:
-        # Optimize: Get device counts in subquery
-        device_counts_subq = (
-            db.query(
-                Device.devicetype_id,
-                func.count(Device.id).label('device_count')
-            )
-            .group_by(Device.devicetype_id)
-            .subquery()
+    # Counts are correlated per device type, so only the types on the
+    # returned page are counted
+    base_q = (
+        db.query(
+            DeviceType,
+            Make,
+            child_count(Device.devicetype_id, DeviceType.id).label('device_count'),
+            child_count(Model.device_type_id, DeviceType.id).label('models_count'),
         )
-        
-        # Get model counts per device type
-        model_counts_subq = (
-            db.query(
-                Model.device_type_id,
-                func.count(Model.id).label('models_count')
-            )
-            .group_by(Model.device_type_id)
-            .subquery()
-        )
-        
-        # Get first model per device type (simplified approach)
-        first_model_subq = (
-            db.query(
-                Model.device_type_id,
-                func.min(Model.id).label('first_model_id')
-            )
+        .join(Make, DeviceType.make_id == Make.id)
+        .order_by(DeviceType.id.asc())
+    )
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _DEVICE_TYPE_FILTERS,
+        device_type=device_type,
+        device_type_description=device_type_description,
+        make_name=make_name,
+    )
+    
+    # Use optimized pagination that gets count and data in single query
+    total, rows = get_paginated_results(
+        base_q, offset, page_size, DeviceType.id, include_total=include_total
+    )
+
+    # First (lowest id) model of each device type on the page only
+    first_models: Dict[int, Tuple[str, int]] = {}
+    if rows:
+        first_model_ids = (
+            select(func.min(Model.id))
+            .where(Model.device_type_id.in_([dt.id for dt, *_ in rows]))
             .group_by(Model.device_type_id)
-            .subquery()
         )
-        
-        base_q = (
-            db.query(
-                DeviceType,
-                Make,
-                func.coalesce(device_counts_subq.c.device_count, 0).label('device_count'),
-                func.coalesce(model_counts_subq.c.models_count, 0).label('models_count'),
-                Model.id.label('model_id'),
-                Model.name.label('model_name'),
-                Model.height.label('model_height')
+        first_models = {
+            device_type_id: (name, height)
+            for device_type_id, name, height in db.execute(
+                select(Model.device_type_id, Model.name, Model.height)
+                .where(Model.id.in_(first_model_ids))
             )
-            .join(Make, DeviceType.make_id == Make.id)
-            .outerjoin(device_counts_subq, DeviceType.id == device_counts_subq.c.devicetype_id)
-            .outerjoin(model_counts_subq, DeviceType.id == model_counts_subq.c.device_type_id)
-            .outerjoin(first_model_subq, DeviceType.id == first_model_subq.c.device_type_id)
-            .outerjoin(Model, Model.id == first_model_subq.c.first_model_id)
-            .order_by(DeviceType.id.asc())
-        )
-        
-        # Apply filters dynamically
-        filter_config = {
-            'device_type': (DeviceType.name, 'exact'),
-            'device_type_description': (DeviceType.description, 'contains'),
-            'make_name': (Make.name, 'exact'),
         }
-        filters = {
-            'device_type': device_type,
-            'device_type_description': device_type_description,
-            'make_name': make_name,
-        }
-        base_q = apply_filters(base_q, filters, filter_config)
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, DeviceType.id)
 
-        data = []
-        for (dt, make, device_count, models_count, model_id, model_name, model_height) in rows:
-            data.append({
-                "id": dt.id,
-                "name": dt.name,
-                "description": dt.description,
-                "make": make.name if make else None,
-                "u_height": int(model_height) if model_height else None,
-                "devices": int(device_count),
-                # "model_id": int(model_id) if model_id else None,
-                "model_name": model_name if model_name else None,
-                "model_height": int(model_height) if model_height else None,
-                "models_count": int(models_count),
-            })
+    data = []
+    for (dt, make, device_count, models_count) in rows:
+        model_name, model_height = first_models.get(dt.id, (None, None))
+        data.append({
+            "id": dt.id,
+            "name": dt.name,
+            "description": dt.description,
+            "make": make.name if make else None,
+            "u_height": model_height or None,
+            "devices": device_count,
+            "model_name": model_name if model_name else None,
+            "model_height": model_height or None,
+            "models_count": models_count,
+        })
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_device_types: {str(e)}")
+    return total, data
+
+
+_MAKE_FILTERS = (
+    ('make_name', Make.name, _exact),
+    ('make_description', Make.description, _contains),
+)
 
 
+@_db_errors
 def list_makes(
     db: Session,
     offset: int,
@@ -807,89 +971,85 @@ def list_makes(
     make_description: Optional[str] = None,
     device_type: Optional[str] = None,
     model_name: Optional[str] = None,
+    include_total: bool = True,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List makes with rack, device, and model counts.
     Optimized: Combined query with all stats in single query.
     """
-    try:
-        # Optimize: Get all stats in subqueries
-        device_stats_subq = (
-            db.query(
-                Device.make_id,
-                func.count(Device.id).label("device_count"),
-                func.count(func.distinct(Device.rack_id)).label("rack_count")
-            )
-            .group_by(Device.make_id)
-            .subquery()
+    # Counts are correlated per make, so only the makes on the returned
+    # page are counted; the distinct-rack count no longer deduplicates
+    # rack ids across every device of every make
+    rack_count = (
+        select(func.count(func.distinct(Device.rack_id)))
+        .where(Device.make_id == Make.id)
+        .correlate_except(Device)
+        .scalar_subquery()
+    )
+    base_q = (
+        db.query(
+            Make,
+            child_count(Device.make_id, Make.id).label("device_count"),
+            rack_count.label("rack_count"),
+            child_count(Model.make_id, Make.id).label("model_count"),
         )
-        
-        model_counts_subq = (
-            db.query(
-                Model.make_id,
-                func.count(Model.id).label("model_count")
-            )
-            .group_by(Model.make_id)
-            .subquery()
+        .order_by(Make.id.asc())
+    )
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _MAKE_FILTERS,
+        make_name=make_name,
+        make_description=make_description,
+    )
+    
+    if device_type and device_type.strip():
+        base_q = _semi_join_exists(
+            base_q,
+            DeviceType,
+            Make.id == DeviceType.make_id,
+            name_equals(DeviceType, device_type),
         )
-        
-        base_q = (
-            db.query(
-                Make,
-                func.coalesce(device_stats_subq.c.device_count, 0).label("device_count"),
-                func.coalesce(device_stats_subq.c.rack_count, 0).label("rack_count"),
-                func.coalesce(model_counts_subq.c.model_count, 0).label("model_count")
-            )
-            .outerjoin(device_stats_subq, Make.id == device_stats_subq.c.make_id)
-            .outerjoin(model_counts_subq, Make.id == model_counts_subq.c.make_id)
-            .order_by(Make.id.asc())
+    if model_name and model_name.strip():
+        base_q = _semi_join_exists(
+            base_q,
+            Model,
+            Make.id == Model.make_id,
+            name_equals(Model, model_name),
         )
-        
-        # Apply filters dynamically
-        filter_config = {
-            'make_name': (Make.name, 'exact'),
-            'make_description': (Make.description, 'contains'),
-        }
-        filters = {
-            'make_name': make_name,
-            'make_description': make_description,
+    
+    # Use optimized pagination that gets count and data in single query
+    total, rows = get_paginated_results(
+        base_q, offset, page_size, Make.id, include_total=include_total
+    )
+
+    data = [
+        {
+            "id": make.id,
+            "name": make.name,
+            "description": make.description,
+            "racks": rack_count,
+            "devices": device_count,
+            "models": model_count,
         }
-        base_q = apply_filters(base_q, filters, filter_config)
-        
-        if device_type and device_type.strip():
-            base_q = (
-                base_q.join(DeviceType, Make.id == DeviceType.make_id)
-                .filter(func.upper(DeviceType.name) == func.upper(device_type))
-                .distinct()
-            )
-        if model_name and model_name.strip():
-            base_q = (
-                base_q.join(Model, Make.id == Model.make_id)
-                .filter(func.upper(Model.name) == func.upper(model_name))
-                .distinct()
-            )
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, Make.id)
-
-        data = [
-            {
-                "id": make.id,
-                "name": make.name,
-                "description": make.description,
-                "racks": int(rack_count),
-                "devices": int(device_count),
-                "models": int(model_count),
-            }
-            for make, device_count, rack_count, model_count in rows
-        ]
+        for make, device_count, rack_count, model_count in rows
+    ]
+
+    return total, data
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_makes: {str(e)}")
+
+_MODEL_FILTERS = (
+    ('model_name', Model.name, _exact),
+    ('model_description', Model.description, _contains),
+    ('model_height', Model.height, operator.eq),
+    ('make_name', Make.name, _exact),
+    ('device_type', DeviceType.name, _exact),
+)
 
 
+@_db_errors
 def list_models(
     db: Session,
     offset: int,
@@ -899,64 +1059,69 @@ def list_models(
     model_height: Optional[int] = None,
     make_name: Optional[str] = None,
     device_type: Optional[str] = None,
+    include_total: bool = True,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List models with make names.
     Optimized: Explicit joins instead of lazy loading.
     """
-    try:
-        base_q = (
-            db.query(
-                Model,
-                Make,
-                DeviceType
-            )
-            .join(Make, Model.make_id == Make.id)
-            .join(DeviceType, Model.device_type_id == DeviceType.id)
-            .order_by(Model.id.asc())
+    base_q = (
+        db.query(
+            Model,
+            Make,
+            DeviceType
         )
-        
-        # Apply filters dynamically
-        filter_config = {
-            'model_name': (Model.name, 'exact'),
-            'model_description': (Model.description, 'contains'),
-            'model_height': (Model.height, 'exact_int'),
-            'make_name': (Make.name, 'exact'),
-            'device_type': (DeviceType.name, 'exact'),
-        }
-        filters = {
-            'model_name': model_name,
-            'model_description': model_description,
-            'model_height': model_height,
-            'make_name': make_name,
-            'device_type': device_type,
+        .join(Make, Model.make_id == Make.id)
+        .join(DeviceType, Model.device_type_id == DeviceType.id)
+        .order_by(Model.id.asc())
+    )
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _MODEL_FILTERS,
+        model_name=model_name,
+        model_description=model_description,
+        model_height=model_height,
+        make_name=make_name,
+        device_type=device_type,
+    )
+    
+    # Use optimized pagination that gets count and data in single query
+    total, rows = get_paginated_results(
+        base_q, offset, page_size, Model.id, include_total=include_total
+    )
+
+    data = [
+        {
+            "id": model.id,
+            "name": model.name,
+            "description": model.description,
+            "make_name": make.name if make else None,
+            # "device_type_id": device_type.id if device_type else None,
+            "device_type": device_type.name if device_type else None,
+            "height": model.height,
+            "front_image_path": model.front_image_path,
+            "rear_image_path": model.rear_image_path,
         }
-        base_q = apply_filters(base_q, filters, filter_config)
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, Model.id)
-
-        data = [
-            {
-                "id": model.id,
-                "name": model.name,
-                "description": model.description,
-                "make_name": make.name if make else None,
-                # "device_type_id": device_type.id if device_type else None,
-                "device_type": device_type.name if device_type else None,
-                "height": model.height,
-                "front_image_path": model.front_image_path,
-                "rear_image_path": model.rear_image_path,
-            }
-            for model, make, device_type in rows
-        ]
+        for model, make, device_type in rows
+    ]
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_models: {str(e)}")
+    return total, data
+
+
+_DATACENTER_FILTERS = (
+    ('location_name', Location.name, _exact),
+    ('building_name', Building.name, _exact),
+    ('wing_name', Wing.name, _exact),
+    ('floor_name', Floor.name, _exact),
+    ('datacenter_name', Datacenter.name, _exact),
+    ('datacenter_description', Datacenter.description, _contains),
+)
 
 
+@_db_errors
 def list_datacenters(
     db: Session,
     offset: int,
@@ -970,107 +1135,101 @@ def list_datacenters(
     rack_name: Optional[str] = None,
     device_name: Optional[str] = None,
     allowed_location_ids: Optional[Set[int]] = None,
+    include_total: bool = True,
+    after_id: Optional[int] = None,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List datacenters with related information and counts.
     Optimized: Combined query with rack/device counts, explicit joins.
     """
-    try:
-        # Optimize: Get rack and device counts in subqueries
-        rack_counts_subq = (
-            db.query(
-                Rack.datacenter_id,
-                func.count(Rack.id).label("rack_count")
-            )
-            .group_by(Rack.datacenter_id)
-            .subquery()
+    # Plain columns rather than five mapped entities per row - only these
+    # fields reach the payload, so nothing is added to the identity map and
+    # there are no relationships left to lazy-load
+    base_q = (
+        db.query(
+            Datacenter.id,
+            Datacenter.name,
+            Datacenter.description,
+            Location.name,
+            Building.name,
+            Wing.name,
+            Floor.name,
         )
-        
-        device_counts_subq = (
-            db.query(
-                Device.dc_id,
-                func.count(Device.id).label("device_count")
-            )
-            .group_by(Device.dc_id)
-            .subquery()
+        .join(Location, Datacenter.location_id == Location.id)
+        .join(Building, Datacenter.building_id == Building.id)
+        .outerjoin(Wing, Datacenter.wing_id == Wing.id)
+        .outerjoin(Floor, Datacenter.floor_id == Floor.id)
+        .order_by(Datacenter.id.asc())
+    )
+    base_q = _restrict_to_locations(base_q, Datacenter.location_id, allowed_location_ids)
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _DATACENTER_FILTERS,
+        location_name=location_name,
+        building_name=building_name,
+        wing_name=wing_name,
+        floor_name=floor_name,
+        datacenter_name=datacenter_name,
+        datacenter_description=datacenter_description,
+    )
+    
+    if rack_name and rack_name.strip():
+        base_q = _semi_join_exists(
+            base_q,
+            Rack,
+            Datacenter.id == Rack.datacenter_id,
+            name_equals(Rack, rack_name),
         )
-        
-        base_q = (
-            db.query(
-                Datacenter,
-                Location,
-                Building,
-                Wing,
-                Floor,
-                func.coalesce(rack_counts_subq.c.rack_count, 0).label("rack_count"),
-                func.coalesce(device_counts_subq.c.device_count, 0).label("device_count")
-            )
-            .join(Location, Datacenter.location_id == Location.id)
-            .join(Building, Datacenter.building_id == Building.id)
-            .outerjoin(Wing, Datacenter.wing_id == Wing.id)
-            .outerjoin(Floor, Datacenter.floor_id == Floor.id)
-            .outerjoin(rack_counts_subq, Datacenter.id == rack_counts_subq.c.datacenter_id)
-            .outerjoin(device_counts_subq, Datacenter.id == device_counts_subq.c.dc_id)
-            .order_by(Datacenter.id.asc())
+    if device_name and device_name.strip():
+        base_q = _semi_join_exists(
+            base_q,
+            Device,
+            Datacenter.id == Device.dc_id,
+            name_equals(Device, device_name),
         )
-        base_q = _restrict_to_locations(base_q, Datacenter.location_id, allowed_location_ids)
-        
-        # Apply filters dynamically
-        filter_config = {
-            'location_name': (Location.name, 'exact'),
-            'building_name': (Building.name, 'exact'),
-            'wing_name': (Wing.name, 'exact'),
-            'floor_name': (Floor.name, 'exact'),
-            'datacenter_name': (Datacenter.name, 'exact'),
-            'datacenter_description': (Datacenter.description, 'contains'),
-        }
-        filters = {
-            'location_name': location_name,
-            'building_name': building_name,
-            'wing_name': wing_name,
-            'floor_name': floor_name,
-            'datacenter_name': datacenter_name,
-            'datacenter_description': datacenter_description,
+    
+    # Use optimized pagination that gets count and data in single query
+    total, rows = get_paginated_results(
+        base_q, offset, page_size, Datacenter.id,
+        include_total=include_total, after_id=after_id,
+    )
+
+    # Rack/device counts for the page's datacenters only, merged below
+    dc_ids = [row[0] for row in rows]
+    rack_counts = _page_counts(db, Rack.datacenter_id, dc_ids)
+    device_counts = _page_counts(db, Device.dc_id, dc_ids)
+
+    data = [
+        {
+            "id": dc_id,
+            "name": name,
+            "description": description,
+            "location_name": location_name,
+            "building_name": building_name,
+            "wing_name": wing_name,
+            "floor_name": floor_name,
+            "racks": rack_counts.get(dc_id, 0),
+            "devices": device_counts.get(dc_id, 0),
         }
-        base_q = apply_filters(base_q, filters, filter_config)
-        
-        if rack_name and rack_name.strip():
-            base_q = (
-                base_q.join(Rack, Datacenter.id == Rack.datacenter_id)
-                .filter(func.upper(Rack.name) == func.upper(rack_name))
-                .distinct()
-            )
-        if device_name and device_name.strip():
-            base_q = (
-                base_q.join(Device, Datacenter.id == Device.dc_id)
-                .filter(func.upper(Device.name) == func.upper(device_name))
-                .distinct()
-            )
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, Datacenter.id)
-
-        data = [
-            {
-                "id": datacenter.id,
-                "name": datacenter.name,
-                "description": datacenter.description,
-                "location_name": location.name if location else None,
-                "building_name": building.name if building else None,
-                "wing_name": wing.name if wing else None,
-                "floor_name": floor.name if floor else None,
-                "racks": int(rack_count),
-                "devices": int(device_count),
-            }
-            for datacenter, location, building, wing, floor, rack_count, device_count in rows
-        ]
+        for (dc_id, name, description, location_name, building_name,
+             wing_name, floor_name) in rows
+    ]
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_datacenters: {str(e)}")
+    return total, data
 
 
+_WING_FILTERS = (
+    ('location_name', Location.name, _exact),
+    ('building_name', Building.name, _exact),
+    ('wing_name', Wing.name, _exact),
+    ('wing_description', Wing.description, _contains),
+)
+
+
+@_db_errors
 def list_wings(
     db: Session,
     offset: int,
@@ -1080,83 +1239,72 @@ def list_wings(
     wing_name: Optional[str] = None,
     wing_description: Optional[str] = None,
     allowed_location_ids: Optional[Set[int]] = None,
+    include_total: bool = True,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List wings with floor/datacenter counts.
     """
-    try:
-        # Subquery for floor counts
-        floor_counts_subq = (
-            db.query(
-                Floor.wing_id,
-                func.count(Floor.id).label('floor_count')
-            )
-            .group_by(Floor.wing_id)
-            .subquery()
-        )
-        # Subquery for datacenter counts
-        datacenter_counts_subq = (
-            db.query(
-                Datacenter.wing_id,
-                func.count(Datacenter.id).label('datacenter_count')
-            )
-            .group_by(Datacenter.wing_id)
-            .subquery()
-        )
-        
-        base_q = (
-            db.query(
-                Wing,
-                Location,
-                Building,
-                func.coalesce(floor_counts_subq.c.floor_count, 0).label('floor_count'),
-                func.coalesce(datacenter_counts_subq.c.datacenter_count, 0).label('datacenter_count')
-            )
-            .join(Location, Wing.location_id == Location.id)
-            .join(Building, Wing.building_id == Building.id)
-            .outerjoin(floor_counts_subq, Wing.id == floor_counts_subq.c.wing_id)
-            .outerjoin(datacenter_counts_subq, Wing.id == datacenter_counts_subq.c.wing_id)
-            .order_by(Wing.id.asc())
+    # Subquery for floor counts
+    floor_counts_subq = _grouped_count(Floor.wing_id, "floor_count")
+    # Subquery for datacenter counts
+    datacenter_counts_subq = _grouped_count(Datacenter.wing_id, "datacenter_count")
+    
+    base_q = (
+        db.query(
+            Wing,
+            Location,
+            Building,
+            func.coalesce(floor_counts_subq.c.floor_count, 0).label('floor_count'),
+            func.coalesce(datacenter_counts_subq.c.datacenter_count, 0).label('datacenter_count')
         )
-        base_q = _restrict_to_locations(base_q, Wing.location_id, allowed_location_ids)
-        
-        # Apply filters dynamically
-        filter_config = {
-            'location_name': (Location.name, 'exact'),
-            'building_name': (Building.name, 'exact'),
-            'wing_name': (Wing.name, 'exact'),
-            'wing_description': (Wing.description, 'contains'),
-        }
-        filters = {
-            'location_name': location_name,
-            'building_name': building_name,
-            'wing_name': wing_name,
-            'wing_description': wing_description,
+        .join(Location, Wing.location_id == Location.id)
+        .join(Building, Wing.building_id == Building.id)
+        .outerjoin(floor_counts_subq, Wing.id == floor_counts_subq.c.wing_id)
+        .outerjoin(datacenter_counts_subq, Wing.id == datacenter_counts_subq.c.wing_id)
+        .order_by(Wing.id.asc())
+    )
+    base_q = _restrict_to_locations(base_q, Wing.location_id, allowed_location_ids)
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _WING_FILTERS,
+        location_name=location_name,
+        building_name=building_name,
+        wing_name=wing_name,
+        wing_description=wing_description,
+    )
+    
+    # Use optimized pagination that gets count and data in single query
+    total, rows = get_paginated_results(
+        base_q, offset, page_size, Wing.id, include_total=include_total
+    )
+
+    data = [
+        {
+            "id": wing.id,
+            "name": wing.name,
+            "description": wing.description,
+            "location_name": location.name if location else None,
+            "building_name": building.name if building else None,
+            "floors": floor_count,
+            "datacenters": datacenter_count,
         }
-        base_q = apply_filters(base_q, filters, filter_config)
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, Wing.id)
-
-        data = [
-            {
-                "id": wing.id,
-                "name": wing.name,
-                "description": wing.description,
-                "location_name": location.name if location else None,
-                "building_name": building.name if building else None,
-                "floors": int(floor_count),
-                "datacenters": int(datacenter_count),
-            }
-            for wing, location, building, floor_count, datacenter_count in rows
-        ]
+        for wing, location, building, floor_count, datacenter_count in rows
+    ]
+
+    return total, data
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_wings: {str(e)}")
+
+_ASSET_OWNER_FILTERS = (
+    ('asset_owner_name', AssetOwner.name, _exact),
+    ('asset_owner_description', AssetOwner.description, _contains),
+    ('location_name', Location.name, _exact),
+)
 
 
+@_db_errors
 def list_asset_owners(
     db: Session,
     offset: int,
@@ -1166,74 +1314,72 @@ def list_asset_owners(
     location_name: Optional[str] = None,
     application_name: Optional[str] = None,
     allowed_location_ids: Optional[Set[int]] = None,
+    include_total: bool = True,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List asset owners with application counts.
     Returns: (total_count, list of asset owner dicts)
     """
-    try:
-        # Subquery for application counts
-        app_counts_subq = (
-            db.query(
-                ApplicationMapped.asset_owner_id,
-                func.count(ApplicationMapped.id).label('app_count')
-            )
-            .group_by(ApplicationMapped.asset_owner_id)
-            .subquery()
+    # Subquery for application counts
+    app_counts_subq = _grouped_count(ApplicationMapped.asset_owner_id, "app_count")
+    
+    base_q = (
+        db.query(
+            AssetOwner,
+            Location,
+            func.coalesce(app_counts_subq.c.app_count, 0).label('app_count')
         )
-        
-        base_q = (
-            db.query(
-                AssetOwner,
-                Location,
-                func.coalesce(app_counts_subq.c.app_count, 0).label('app_count')
-            )
-            .outerjoin(Location, AssetOwner.location_id == Location.id)
-            .outerjoin(app_counts_subq, AssetOwner.id == app_counts_subq.c.asset_owner_id)
-            .order_by(AssetOwner.id.asc())
+        .outerjoin(Location, AssetOwner.location_id == Location.id)
+        .outerjoin(app_counts_subq, AssetOwner.id == app_counts_subq.c.asset_owner_id)
+        .order_by(AssetOwner.id.asc())
+    )
+    base_q = _restrict_to_locations(base_q, AssetOwner.location_id, allowed_location_ids)
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _ASSET_OWNER_FILTERS,
+        asset_owner_name=asset_owner_name,
+        asset_owner_description=asset_owner_description,
+        location_name=location_name,
+    )
+    
+    if application_name and application_name.strip():
+        base_q = _semi_join_exists(
+            base_q,
+            ApplicationMapped,
+            AssetOwner.id == ApplicationMapped.asset_owner_id,
+            name_equals(ApplicationMapped, application_name),
         )
-        base_q = _restrict_to_locations(base_q, AssetOwner.location_id, allowed_location_ids)
-        
-        # Apply filters dynamically
-        filter_config = {
-            'asset_owner_name': (AssetOwner.name, 'exact'),
-            'asset_owner_description': (AssetOwner.description, 'contains'),
-            'location_name': (Location.name, 'exact'),
-        }
-        filters = {
-            'asset_owner_name': asset_owner_name,
-            'asset_owner_description': asset_owner_description,
-            'location_name': location_name,
+    
+    # Use optimized pagination that gets count and data in single query
+    total, rows = get_paginated_results(
+        base_q, offset, page_size, AssetOwner.id, include_total=include_total
+    )
+
+    data = [
+        {
+            "id": asset_owner.id,
+            "name": asset_owner.name,
+            "description": asset_owner.description,
+            "location_name": location.name if location else None,
+            "applications": app_count,
         }
-        base_q = apply_filters(base_q, filters, filter_config)
-        
-        if application_name and application_name.strip():
-            base_q = (
-                base_q.join(ApplicationMapped, AssetOwner.id == ApplicationMapped.asset_owner_id)
-                .filter(func.upper(ApplicationMapped.name) == func.upper(application_name))
-                .distinct()
-            )
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, AssetOwner.id)
-
-        data = [
-            {
-                "id": asset_owner.id,
-                "name": asset_owner.name,
-                "description": asset_owner.description,
-                "location_name": location.name if location else None,
-                "applications": int(app_count),
-            }
-            for asset_owner, location, app_count in rows
-        ]
+        for asset_owner, location, app_count in rows
+    ]
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_asset_owners: {str(e)}")
+    return total, data
 
 
+_APPLICATION_FILTERS = (
+    ('application_name', ApplicationMapped.name, _exact),
+    ('application_description', ApplicationMapped.description, _contains),
+    ('asset_owner_name', AssetOwner.name, _exact),
+)
+
+
+@_db_errors
 def list_applications(
     db: Session,
     offset: int,
@@ -1243,77 +1389,76 @@ def list_applications(
     asset_owner_name: Optional[str] = None,
     device_name: Optional[str] = None,
     allowed_location_ids: Optional[Set[int]] = None,
+    include_total: bool = True,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List applications with device counts.
     Returns: (total_count, list of application dicts)
     """
-    try:
-        # Subquery for device counts
-        device_counts_subq = (
-            db.query(
-                Device.applications_mapped_id,
-                func.count(Device.id).label('device_count')
-            )
-            .group_by(Device.applications_mapped_id)
-            .subquery()
+    # Subquery for device counts
+    device_counts_subq = _grouped_count(Device.applications_mapped_id, "device_count")
+    
+    base_q = (
+        db.query(
+            ApplicationMapped,
+            AssetOwner,
+            func.coalesce(device_counts_subq.c.device_count, 0).label('device_count')
         )
-        
-        base_q = (
-            db.query(
-                ApplicationMapped,
-                AssetOwner,
-                func.coalesce(device_counts_subq.c.device_count, 0).label('device_count')
-            )
-            .outerjoin(AssetOwner, ApplicationMapped.asset_owner_id == AssetOwner.id)
-            .outerjoin(device_counts_subq, ApplicationMapped.id == device_counts_subq.c.applications_mapped_id)
-            .order_by(ApplicationMapped.id.asc())
+        .outerjoin(AssetOwner, ApplicationMapped.asset_owner_id == AssetOwner.id)
+        .outerjoin(device_counts_subq, ApplicationMapped.id == device_counts_subq.c.applications_mapped_id)
+        .order_by(ApplicationMapped.id.asc())
+    )
+    
+    # Apply location restriction via asset_owner -> location
+    base_q = _restrict_to_locations(base_q, AssetOwner.location_id, allowed_location_ids)
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _APPLICATION_FILTERS,
+        application_name=application_name,
+        application_description=application_description,
+        asset_owner_name=asset_owner_name,
+    )
+    
+    if device_name and device_name.strip():
+        base_q = _semi_join_exists(
+            base_q,
+            Device,
+            ApplicationMapped.id == Device.applications_mapped_id,
+            name_equals(Device, device_name),
         )
-        
-        # Apply location restriction via asset_owner -> location
-        if allowed_location_ids is not None:
-            base_q = base_q.filter(AssetOwner.location_id.in_(allowed_location_ids))
-        
-        # Apply filters dynamically
-        filter_config = {
-            'application_name': (ApplicationMapped.name, 'exact'),
-            'application_description': (ApplicationMapped.description, 'contains'),
-            'asset_owner_name': (AssetOwner.name, 'exact'),
-        }
-        filters = {
-            'application_name': application_name,
-            'application_description': application_description,
-            'asset_owner_name': asset_owner_name,
+    
+    # Use optimized pagination that gets count and data in single query
+    total, rows = get_paginated_results(
+        base_q, offset, page_size, ApplicationMapped.id, include_total=include_total
+    )
+
+    data = [
+        {
+            "id": application.id,
+            "name": application.name,
+            "description": application.description,
+            "asset_owner_name": asset_owner.name if asset_owner else None,
+            "devices": device_count,
         }
-        base_q = apply_filters(base_q, filters, filter_config)
-        
-        if device_name and device_name.strip():
-            base_q = (
-                base_q.join(Device, ApplicationMapped.id == Device.applications_mapped_id)
-                .filter(func.upper(Device.name) == func.upper(device_name))
-                .distinct()
-            )
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, ApplicationMapped.id)
-
-        data = [
-            {
-                "id": application.id,
-                "name": application.name,
-                "description": application.description,
-                "asset_owner_name": asset_owner.name if asset_owner else None,
-                "devices": int(device_count),
-            }
-            for application, asset_owner, device_count in rows
-        ]
+        for application, asset_owner, device_count in rows
+    ]
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_applications: {str(e)}")
+    return total, data
 
 
+_FLOOR_FILTERS = (
+    ('location_name', Location.name, _exact),
+    ('building_name', Building.name, _exact),
+    ('wing_name', Wing.name, _exact),
+    ('floor_name', Floor.name, _exact),
+    ('floor_description', Floor.description, _contains),
+)
+
+
+@_db_errors
 def list_floors(
     db: Session,
     offset: int,
@@ -1324,93 +1469,81 @@ def list_floors(
     floor_name: Optional[str] = None,
     floor_description: Optional[str] = None,
     allowed_location_ids: Optional[Set[int]] = None,
+    include_total: bool = True,
     **kwargs,
-) -> Tuple[int, List[Dict[str, Any]]]:
+) -> Tuple[Optional[int], List[Dict[str, Any]]]:
     """
     List floors with datacenter/rack counts.
     """
-    try:
-        # Subquery for datacenter counts
-        datacenter_counts_subq = (
-            db.query(
-                Datacenter.floor_id,
-                func.count(Datacenter.id).label('datacenter_count')
-            )
-            .group_by(Datacenter.floor_id)
-            .subquery()
-        )
-        # Subquery for rack counts (racks linked via datacenter)
-        rack_counts_subq = (
-            db.query(
-                Datacenter.floor_id,
-                func.count(Rack.id).label('rack_count')
-            )
-            .join(Rack, Datacenter.id == Rack.datacenter_id)
-            .group_by(Datacenter.floor_id)
-            .subquery()
-        )
-        
-        base_q = (
-            db.query(
-                Floor,
-                Location,
-                Building,
-                Wing,
-                func.coalesce(datacenter_counts_subq.c.datacenter_count, 0).label('datacenter_count'),
-                func.coalesce(rack_counts_subq.c.rack_count, 0).label('rack_count')
-            )
-            .join(Location, Floor.location_id == Location.id)
-            .join(Building, Floor.building_id == Building.id)
-            .join(Wing, Floor.wing_id == Wing.id)
-            .outerjoin(datacenter_counts_subq, Floor.id == datacenter_counts_subq.c.floor_id)
-            .outerjoin(rack_counts_subq, Floor.id == rack_counts_subq.c.floor_id)
-            .order_by(Floor.id.asc())
+    # Subquery for datacenter counts
+    datacenter_counts_subq = _grouped_count(Datacenter.floor_id, "datacenter_count")
+    # Subquery for rack counts (racks linked via datacenter)
+    rack_counts_subq = _floor_rack_counts()
+    
+    base_q = (
+        db.query(
+            Floor,
+            Location,
+            Building,
+            Wing,
+            func.coalesce(datacenter_counts_subq.c.datacenter_count, 0).label('datacenter_count'),
+            func.coalesce(rack_counts_subq.c.rack_count, 0).label('rack_count')
         )
-        base_q = _restrict_to_locations(base_q, Floor.location_id, allowed_location_ids)
-        
-        # Apply filters dynamically
-        filter_config = {
-            'location_name': (Location.name, 'exact'),
-            'building_name': (Building.name, 'exact'),
-            'wing_name': (Wing.name, 'exact'),
-            'floor_name': (Floor.name, 'exact'),
-            'floor_description': (Floor.description, 'contains'),
-        }
-        filters = {
-            'location_name': location_name,
-            'building_name': building_name,
-            'wing_name': wing_name,
-            'floor_name': floor_name,
-            'floor_description': floor_description,
+        .join(Location, Floor.location_id == Location.id)
+        .join(Building, Floor.building_id == Building.id)
+        .join(Wing, Floor.wing_id == Wing.id)
+        .outerjoin(datacenter_counts_subq, Floor.id == datacenter_counts_subq.c.floor_id)
+        .outerjoin(rack_counts_subq, Floor.id == rack_counts_subq.c.floor_id)
+        .order_by(Floor.id.asc())
+    )
+    base_q = _restrict_to_locations(base_q, Floor.location_id, allowed_location_ids)
+    
+    # Apply filters dynamically
+    base_q = apply_filters(
+        base_q,
+        _FLOOR_FILTERS,
+        location_name=location_name,
+        building_name=building_name,
+        wing_name=wing_name,
+        floor_name=floor_name,
+        floor_description=floor_description,
+    )
+    
+    # Use optimized pagination that gets count and data in single query
+    total, rows = get_paginated_results(
+        base_q, offset, page_size, Floor.id, include_total=include_total
+    )
+
+    data = [
+        {
+            "id": floor.id,
+            "name": floor.name,
+            "description": floor.description,
+            "location_name": location.name if location else None,
+            "building_name": building.name if building else None,
+            "wing_name": wing.name if wing else None,
+            "datacenters": datacenter_count,
+            "racks": rack_count,
         }
-        base_q = apply_filters(base_q, filters, filter_config)
-        
-        # Use optimized pagination that gets count and data in single query
-        total, rows = get_paginated_results(base_q, offset, page_size, Floor.id)
-
-        data = [
-            {
-                "id": floor.id,
-                "name": floor.name,
-                "description": floor.description,
-                "location_name": location.name if location else None,
-                "building_name": building.name if building else None,
-                "wing_name": wing.name if wing else None,
-                "datacenters": int(datacenter_count),
-                "racks": int(rack_count),
-            }
-            for floor, location, building, wing, datacenter_count, rack_count in rows
-        ]
+        for floor, location, building, wing, datacenter_count, rack_count in rows
+    ]
 
-        return total, data
-    except exc.SQLAlchemyError as e:
-        raise Exception(f"Database error in list_floors: {str(e)}")
+    return total, data
 
 
 # =============================================================================
 # Entity handler mapping
 # =============================================================================
 
+# Handlers ordered by id that accept an after_id keyset cursor
+KEYSET_LIST_ENTITIES = frozenset({
+    ListingType.locations,
+    ListingType.buildings,
+    ListingType.racks,
+    ListingType.devices,
+    ListingType.datacenters,
+})
+
 ENTITY_LIST_HANDLERS: Dict[ListingType, Callable[..., Tuple[int, List[Dict[str, Any]]]]] = {
     ListingType.locations: list_locations,
     ListingType.buildings: list_buildings,
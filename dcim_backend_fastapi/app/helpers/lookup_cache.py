@@ -0,0 +1,149 @@
+"""
+In-process snapshot of the DCIM lookup tables used to label device listings.
+
+Locations, buildings, datacenters, makes, device types and models are small
+and rarely edited, so list_devices selects their foreign keys and resolves the
+names here instead of joining six tables on every request.
+
+The snapshot is dropped after any commit that inserted, updated or deleted one
+of those rows in this process. LOOKUP_CACHE_TTL_SECONDS bounds staleness from
+writes made by other workers; 0 disables caching (reloaded per call).
+"""
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.entity_models import (
+    Building,
+    Datacenter,
+    DeviceType,
+    Location,
+    Make,
+    Model,
+)
+
+_CACHED_MODELS = (Location, Building, Datacenter, Make, DeviceType, Model)
+
+# (height, name, front_image_path, rear_image_path)
+ModelInfo = Tuple[Optional[int], Optional[str], Optional[str], Optional[str]]
+
+
+class LookupTables(NamedTuple):
+    """id -> name maps; models are keyed by (device_type_id, make_id)."""
+
+    locations: Dict[int, str]
+    buildings: Dict[int, str]
+    datacenters: Dict[int, str]
+    makes: Dict[int, str]
+    device_types: Dict[int, str]
+    models: Dict[Tuple[int, int], ModelInfo]
+
+
+def _names(db: Session, model: Any) -> Dict[int, str]:
+    return dict(db.execute(select(model.id, model.name)).all())
+
+
+def _load_lookup_tables(db: Session) -> LookupTables:
+    models: Dict[Tuple[int, int], ModelInfo] = {}
+    rows = db.execute(
+        select(
+            Model.device_type_id,
+            Model.make_id,
+            Model.height,
+            Model.name,
+            Model.front_image_path,
+            Model.rear_image_path,
+        ).order_by(Model.id.asc())
+    )
+    for device_type_id, make_id, *info in rows:
+        # A device shows the lowest-id model of its (device type, make)
+        models.setdefault((device_type_id, make_id), tuple(info))
+
+    return LookupTables(
+        locations=_names(db, Location),
+        buildings=_names(db, Building),
+        datacenters=_names(db, Datacenter),
+        makes=_names(db, Make),
+        device_types=_names(db, DeviceType),
+        models=models,
+    )
+
+
+class _LookupCache:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._tables: Optional[LookupTables] = None
+        self._expires_at: float = 0.0
+        # Bumped on every clear so a load that raced a write is not stored
+        self._generation = 0
+
+    def get(self, db: Session) -> LookupTables:
+        with self._lock:
+            if self._tables is not None and self._expires_at > time.time():
+                return self._tables
+            generation = self._generation
+
+        tables = _load_lookup_tables(db)
+
+        ttl = settings.LOOKUP_CACHE_TTL_SECONDS
+        if ttl > 0:
+            with self._lock:
+                if generation == self._generation:
+                    self._tables = tables
+                    self._expires_at = time.time() + ttl
+        return tables
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables = None
+            self._expires_at = 0.0
+            self._generation += 1
+
+
+_lookup_cache = _LookupCache()
+
+
+def get_lookup_tables(db: Session) -> LookupTables:
+    """The cached snapshot, loaded with `db` when missing or expired."""
+    return _lookup_cache.get(db)
+
+
+def invalidate_lookup_cache() -> None:
+    _lookup_cache.clear()
+
+
+# =============================================================================
+# Invalidation on ORM writes
+# =============================================================================
+
+_LOOKUP_DIRTY_KEY = "lookup_tables_dirty"
+
+
+def _mark_lookup_writes(session: Session, _flush_context: Any) -> None:
+    # new/dirty/deleted still hold the flushed objects in after_flush
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, _CACHED_MODELS):
+            session.info[_LOOKUP_DIRTY_KEY] = True
+            return
+
+
+def _clear_after_commit(session: Session) -> None:
+    # Cleared only once the write is visible to other sessions, so a
+    # concurrent reload cannot cache the pre-commit rows
+    if session.info.pop(_LOOKUP_DIRTY_KEY, False):
+        _lookup_cache.clear()
+
+
+def _forget_rolled_back_writes(session: Session) -> None:
+    session.info.pop(_LOOKUP_DIRTY_KEY, None)
+
+
+event.listen(Session, "after_flush", _mark_lookup_writes)
+event.listen(Session, "after_commit", _clear_after_commit)
+event.listen(Session, "after_rollback", _forget_rolled_back_writes)
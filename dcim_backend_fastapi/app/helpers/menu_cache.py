@@ -0,0 +1,85 @@
+"""
+In-memory cache for per-user RBAC menus.
+
+Menus only change when menu/sub-menu/role-access rows are edited, which
+happens far less often than logins and token refreshes. Entries are keyed by
+the caller (see auth_helper.build_menu_for_user) and expire after
+MENU_CACHE_TTL_SECONDS.
+
+Nothing in the application edits menus, sub-menus or role access (they are
+maintained directly in the database), so nothing calls
+invalidate_menu_cache(): such edits show up only once the cached entries
+expire, i.e. up to MENU_CACHE_TTL_SECONDS later. A change to a user's active
+roles takes effect at once, since the role codes are read on every build and
+are part of the key.
+
+Cached values must be immutable (nested tuples); they are handed out as-is
+without copying, and callers build the response dicts from them.
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from threading import RLock
+from typing import Hashable, Optional, Tuple
+
+from app.core.config import settings
+
+
+def _is_cache_enabled() -> bool:
+    return settings.MENU_CACHE_TTL_SECONDS > 0 and settings.MENU_CACHE_MAX_ENTRIES > 0
+
+
+class _MenuCache:
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._store: "OrderedDict[Hashable, tuple[float, Tuple]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Tuple]:
+        if not _is_cache_enabled():
+            return None
+
+        now = time.time()
+        with self._lock:
+            record = self._store.get(key)
+            if not record:
+                return None
+
+            expires_at, payload = record
+            if expires_at <= now:
+                self._store.pop(key, None)
+                return None
+
+            self._store.move_to_end(key)
+            return payload
+
+    def set(self, key: Hashable, payload: Tuple) -> None:
+        if not _is_cache_enabled():
+            return
+
+        expires_at = time.time() + settings.MENU_CACHE_TTL_SECONDS
+
+        with self._lock:
+            self._store[key] = (expires_at, payload)
+            self._store.move_to_end(key)
+            while len(self._store) > settings.MENU_CACHE_MAX_ENTRIES:
+                self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
+
+_menu_cache = _MenuCache()
+
+
+def get_cached_menu(key: Hashable) -> Optional[Tuple]:
+    return _menu_cache.get(key)
+
+
+def set_cached_menu(key: Hashable, payload: Tuple) -> None:
+    _menu_cache.set(key, payload)
+
+
+def invalidate_menu_cache() -> None:
+    _menu_cache.clear()
@@ -3,6 +3,7 @@ Utilities for tracking rack capacity (space used/available).
 """
 from typing import Optional
 from fastapi import HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.entity_models import Rack, Device
@@ -97,40 +98,34 @@ def ensure_continuous_space(
             ),
         )
     
-    # Query all devices in the rack (excluding the device being updated if specified)
-    query = db.query(Device).filter(Device.rack_id == rack.id)
+    # Existing devices whose range overlaps [position, end_position]: two
+    # inclusive ranges overlap unless one ends before the other starts.
+    # Devices without space_required (or 0) occupy one unit. Checked in SQL
+    # on the (rack_id, position) index; only the lowest offender is loaded.
+    device_space = func.coalesce(func.nullif(Device.space_required, 0), 1)
+    query = db.query(Device.name, Device.position, device_space).filter(
+        Device.rack_id == rack.id,
+        Device.position.isnot(None),
+        Device.position <= end_position,
+        Device.position + device_space - 1 >= position,
+    )
     if exclude_device_id is not None:
         query = query.filter(Device.id != exclude_device_id)
     
-    existing_devices = query.filter(Device.position.isnot(None)).all()
-    
-    # Check for overlaps with existing devices
-    requested_positions = set(range(position, end_position + 1))
-    
-    for device in existing_devices:
-        if device.position is None:
-            continue
-        
-        device_space = device.space_required or 1
-        device_start = device.position
+    offender = query.order_by(Device.position.asc()).first()
+    if offender is not None:
+        device_name, device_start, device_space = offender
         device_end = device_start + device_space - 1
-        
-        # Calculate occupied positions for this device
-        occupied_positions = set(range(device_start, device_end + 1))
-        
-        # Check for overlap
-        overlap = requested_positions & occupied_positions
-        if overlap:
-            overlap_list = sorted(list(overlap))
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=(
-                    f"Cannot place device at position {position} (requires {space_required}U, "
-                    f"positions {position}-{end_position}). "
-                    f"Positions {overlap_list[0]}-{overlap_list[-1]} are already occupied by "
-                    f"device '{device.name}' (position {device_start}, {device_space}U)"
-                ),
-            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Cannot place device at position {position} (requires {space_required}U, "
+                f"positions {position}-{end_position}). "
+                f"Positions {max(position, device_start)}-{min(end_position, device_end)} "
+                f"are already occupied by "
+                f"device '{device_name}' (position {device_start}, {device_space}U)"
+            ),
+        )
 
 
 def reserve_rack_capacity(rack: Rack, space_required: int) -> None:
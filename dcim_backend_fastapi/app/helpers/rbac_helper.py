@@ -8,7 +8,7 @@ from typing import Dict, Optional, Set
 
 from fastapi import Depends, Header, HTTPException, status
 
-from app.helpers.auth_helper import decode_access_token, _get_token_from_header
+from app.helpers.auth_helper import derive_from_access_token, _get_token_from_header
 
 
 class AccessLevel(str, Enum):
@@ -36,19 +36,8 @@ def _access_level_from_roles(roles: Set[str]) -> AccessLevel:
     return AccessLevel.viewer
 
 
-def get_access_level(
-    authorization: Optional[str] = Header(None, alias="Authorization"),
-) -> AccessLevel:
-    """
-    FastAPI dependency to compute the user's AccessLevel (admin/editor/viewer).
-
-    This uses the roles embedded in the JWT access token to avoid extra DB
-    queries. The JWT is expected to contain a `roles` claim with active role
-    codes (e.g., ["ADMIN", "EDITOR", "VIEWER"]).
-    """
-    token_str = _get_token_from_header(authorization)
-    payload: Dict[str, object] = decode_access_token(token_str)
-
+def _access_level_from_claims(payload: Dict[str, object]) -> AccessLevel:
+    """Resolve the AccessLevel from verified JWT claims."""
     raw_roles = payload.get("roles") or []
     if isinstance(raw_roles, str):
         roles_set: Set[str] = {raw_roles.upper()}
@@ -66,6 +55,22 @@ def get_access_level(
     return _access_level_from_roles(roles_set)
 
 
+def get_access_level(
+    authorization: Optional[str] = Header(None, alias="Authorization"),
+) -> AccessLevel:
+    """
+    FastAPI dependency to compute the user's AccessLevel (admin/editor/viewer).
+
+    This uses the roles embedded in the JWT access token to avoid extra DB
+    queries. The JWT is expected to contain a `roles` claim with active role
+    codes (e.g., ["ADMIN", "EDITOR", "VIEWER"]). The level is kept on the
+    token's decode-cache entry, so repeat requests skip the payload copy and
+    role parsing; expiry is still checked on every call.
+    """
+    token_str = _get_token_from_header(authorization)
+    return derive_from_access_token(token_str, "access_level", _access_level_from_claims)
+
+
 def require_at_least_viewer(
     access_level: AccessLevel = Depends(get_access_level),
 ) -> AccessLevel:
@@ -1,60 +1,82 @@
 """
 In-memory cache utilities for summary endpoints.
 Currently only used for location summaries but can be extended later.
+
+Payloads are cached as the JSON response body (bytes, laid out like the app's
+default pretty-printed response), so hits need no copy and no re-encoding:
+routes send the bytes as-is.
 """
 from __future__ import annotations
 
+import json
 import time
-from copy import deepcopy
 from threading import RLock
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from app.core.config import settings
 
+try:  # orjson is optional; the stdlib encoder produces the same bytes
+    import orjson
+except ImportError:  # pragma: no cover - depends on the deployment image
+    orjson = None
+
+
+def _encode_summary(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    # Same options as main.PrettyJSONResponse
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=2,
+        separators=(",", ": "),
+    ).encode("utf-8")
+
 
 class _SummaryCache:
     def __init__(self) -> None:
         self._lock = RLock()
-        self._payload: Optional[Dict[str, Any]] = None
-        self._expires_at: float = 0.0
+        # (expires_at, body) swapped as one reference so get() needs no lock
+        self._entry: Optional[Tuple[float, bytes]] = None
 
-    def get(self) -> Optional[Dict[str, Any]]:
+    def get(self) -> Optional[bytes]:
         ttl = settings.SUMMARY_CACHE_TTL_SECONDS
         if ttl <= 0:
             return None
 
-        now = time.time()
-        with self._lock:
-            if self._payload is None or self._expires_at <= now:
-                return None
-            return deepcopy(self._payload)
+        entry = self._entry
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry[1]
 
-    def set(self, payload: Dict[str, Any]) -> None:
+    def set(self, payload: Dict[str, Any]) -> bytes:
+        blob = _encode_summary(payload)
         ttl = settings.SUMMARY_CACHE_TTL_SECONDS
         if ttl <= 0:
-            return
+            return blob
 
         with self._lock:
-            self._payload = deepcopy(payload)
-            self._expires_at = time.time() + ttl
+            self._entry = (time.time() + ttl, blob)
+        return blob
 
     def clear(self) -> None:
         with self._lock:
-            self._payload = None
-            self._expires_at = 0.0
+            self._entry = None
 
 
 _location_summary_cache = _SummaryCache()
 
 
-def get_cached_location_summary() -> Optional[Dict[str, Any]]:
+def get_cached_location_summary() -> Optional[bytes]:
+    """The cached summary response body (JSON bytes), if fresh."""
     return _location_summary_cache.get()
 
 
-def set_cached_location_summary(payload: Dict[str, Any]) -> None:
-    _location_summary_cache.set(payload)
+def set_cached_location_summary(payload: Dict[str, Any]) -> bytes:
+    """Cache the summary and return its encoded response body."""
+    return _location_summary_cache.set(payload)
 
 
 def invalidate_location_summary_cache() -> None:
     _location_summary_cache.clear()
-
@@ -12,7 +12,7 @@ from sqlalchemy import func, exc
 from sqlalchemy.orm import Session
 
 from app.helpers.listing_types import ListingType
-from app.helpers.db_utils import get_entity_by_name, check_entity_exists, db_operation
+from app.helpers.db_utils import get_entity_by_name, check_entity_exists, db_operation, name_equals
 from app.helpers.rack_capacity_helper import (
     ensure_continuous_space,
     reserve_rack_capacity,
@@ -67,7 +67,7 @@ def update_location(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict
 
 def update_building(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing building by name."""
-    building = db.query(Building).filter(func.upper(Building.name) == func.upper(entity_name)).first()
+    building = db.query(Building).filter(name_equals(Building, entity_name)).first()
     if not building:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -76,7 +76,7 @@ def update_building(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict
     
     # Check if new name conflicts with existing building (case-insensitive)
     if "name" in data and func.upper(data["name"]) != func.upper(building.name):
-        existing = db.query(Building).filter(func.upper(Building.name) == func.upper(data["name"])).first()
+        existing = db.query(Building).filter(name_equals(Building, data["name"])).first()
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -86,7 +86,7 @@ def update_building(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict
     
     # Verify location exists if updating
     if "location_name" in data:
-        location = db.query(Location).filter(func.upper(Location.name) == func.upper(data["location_name"])).first()
+        location = db.query(Location).filter(name_equals(Location, data["location_name"])).first()
         if not location:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -112,7 +112,7 @@ def update_building(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict
 
 def update_wing(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing wing by name."""
-    wing = db.query(Wing).filter(func.upper(Wing.name) == func.upper(entity_name)).first()
+    wing = db.query(Wing).filter(name_equals(Wing, entity_name)).first()
     if not wing:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -122,12 +122,12 @@ def update_wing(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str
     if "name" in data:
         wing.name = data["name"]
     if "location_name" in data:
-        location = db.query(Location).filter(func.upper(Location.name) == func.upper(data["location_name"])).first()
+        location = db.query(Location).filter(name_equals(Location, data["location_name"])).first()
         if not location:
             raise HTTPException(status_code=404, detail=f"Location '{data['location_name']}' not found")
         wing.location_id = location.id
     if "building_name" in data:
-        building = db.query(Building).filter(func.upper(Building.name) == func.upper(data["building_name"])).first()
+        building = db.query(Building).filter(name_equals(Building, data["building_name"])).first()
         if not building:
             raise HTTPException(status_code=404, detail=f"Building '{data['building_name']}' not found")
         wing.building_id = building.id
@@ -142,24 +142,24 @@ def update_wing(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str
 
 def update_floor(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing floor by name."""
-    floor = db.query(Floor).filter(func.upper(Floor.name) == func.upper(entity_name)).first()
+    floor = db.query(Floor).filter(name_equals(Floor, entity_name)).first()
     if not floor:
         raise HTTPException(status_code=404, detail=f"Floor with name '{entity_name}' not found")
     
     if "name" in data:
         floor.name = data["name"]
     if "location_name" in data:
-        location = db.query(Location).filter(func.upper(Location.name) == func.upper(data["location_name"])).first()
+        location = db.query(Location).filter(name_equals(Location, data["location_name"])).first()
         if not location:
             raise HTTPException(status_code=404, detail=f"Location '{data['location_name']}' not found")
         floor.location_id = location.id
     if "building_name" in data:
-        building = db.query(Building).filter(func.upper(Building.name) == func.upper(data["building_name"])).first()
+        building = db.query(Building).filter(name_equals(Building, data["building_name"])).first()
         if not building:
             raise HTTPException(status_code=404, detail=f"Building '{data['building_name']}' not found")
         floor.building_id = building.id
     if "wing_name" in data:
-        wing = db.query(Wing).filter(func.upper(Wing.name) == func.upper(data["wing_name"])).first()
+        wing = db.query(Wing).filter(name_equals(Wing, data["wing_name"])).first()
         if not wing:
             raise HTTPException(status_code=404, detail=f"Wing '{data['wing_name']}' not found")
         floor.wing_id = wing.id
@@ -174,29 +174,29 @@ def update_floor(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[st
 
 def update_datacenter(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing datacenter by name."""
-    datacenter = db.query(Datacenter).filter(func.upper(Datacenter.name) == func.upper(entity_name)).first()
+    datacenter = db.query(Datacenter).filter(name_equals(Datacenter, entity_name)).first()
     if not datacenter:
         raise HTTPException(status_code=404, detail=f"Datacenter with name '{entity_name}' not found")
     
     if "name" in data:
         datacenter.name = data["name"]
     if "location_name" in data:
-        location = db.query(Location).filter(func.upper(Location.name) == func.upper(data["location_name"])).first()
+        location = db.query(Location).filter(name_equals(Location, data["location_name"])).first()
         if not location:
             raise HTTPException(status_code=404, detail=f"Location '{data['location_name']}' not found")
         datacenter.location_id = location.id
     if "building_name" in data:
-        building = db.query(Building).filter(func.upper(Building.name) == func.upper(data["building_name"])).first()
+        building = db.query(Building).filter(name_equals(Building, data["building_name"])).first()
         if not building:
             raise HTTPException(status_code=404, detail=f"Building '{data['building_name']}' not found")
         datacenter.building_id = building.id
     if "wing_name" in data:
-        wing = db.query(Wing).filter(func.upper(Wing.name) == func.upper(data["wing_name"])).first()
+        wing = db.query(Wing).filter(name_equals(Wing, data["wing_name"])).first()
         if not wing:
             raise HTTPException(status_code=404, detail=f"Wing '{data['wing_name']}' not found")
         datacenter.wing_id = wing.id
     if "floor_name" in data:
-        floor = db.query(Floor).filter(func.upper(Floor.name) == func.upper(data["floor_name"])).first()
+        floor = db.query(Floor).filter(name_equals(Floor, data["floor_name"])).first()
         if not floor:
             raise HTTPException(status_code=404, detail=f"Floor '{data['floor_name']}' not found")
         datacenter.floor_id = floor.id
@@ -211,7 +211,7 @@ def update_datacenter(db: Session, entity_name: str, data: Dict[str, Any]) -> Di
 
 def update_rack(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing rack by name."""
-    rack = db.query(Rack).filter(func.upper(Rack.name) == func.upper(entity_name)).first()
+    rack = db.query(Rack).filter(name_equals(Rack, entity_name)).first()
     if not rack:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -220,7 +220,7 @@ def update_rack(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str
     
     # Check if new name conflicts with existing rack (case-insensitive)
     if "name" in data and func.upper(data["name"]) != func.upper(rack.name):
-        existing = db.query(Rack).filter(func.upper(Rack.name) == func.upper(data["name"])).first()
+        existing = db.query(Rack).filter(name_equals(Rack, data["name"])).first()
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -229,7 +229,7 @@ def update_rack(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str
     
     # Verify building exists if updating
     if "building_name" in data:
-        building = db.query(Building).filter(func.upper(Building.name) == func.upper(data["building_name"])).first()
+        building = db.query(Building).filter(name_equals(Building, data["building_name"])).first()
         if not building:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -239,7 +239,7 @@ def update_rack(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str
     
     # Verify location exists if updating
     if "location_name" in data:
-        location = db.query(Location).filter(func.upper(Location.name) == func.upper(data["location_name"])).first()
+        location = db.query(Location).filter(name_equals(Location, data["location_name"])).first()
         if not location:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -249,21 +249,21 @@ def update_rack(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str
     
     # Verify wing exists if updating
     if "wing_name" in data:
-        wing = db.query(Wing).filter(func.upper(Wing.name) == func.upper(data["wing_name"])).first()
+        wing = db.query(Wing).filter(name_equals(Wing, data["wing_name"])).first()
         if not wing:
             raise HTTPException(status_code=404, detail=f"Wing '{data['wing_name']}' not found")
         rack.wing_id = wing.id
     
     # Verify floor exists if updating
     if "floor_name" in data:
-        floor = db.query(Floor).filter(func.upper(Floor.name) == func.upper(data["floor_name"])).first()
+        floor = db.query(Floor).filter(name_equals(Floor, data["floor_name"])).first()
         if not floor:
             raise HTTPException(status_code=404, detail=f"Floor '{data['floor_name']}' not found")
         rack.floor_id = floor.id
     
     # Verify datacenter exists if updating
     if "datacenter_name" in data:
-        datacenter = db.query(Datacenter).filter(func.upper(Datacenter.name) == func.upper(data["datacenter_name"])).first()
+        datacenter = db.query(Datacenter).filter(name_equals(Datacenter, data["datacenter_name"])).first()
         if not datacenter:
             raise HTTPException(status_code=404, detail=f"Datacenter '{data['datacenter_name']}' not found")
         rack.datacenter_id = datacenter.id
@@ -475,7 +475,7 @@ def update_device(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[s
 
 def update_device_type(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing device type by name."""
-    device_type = db.query(DeviceType).filter(func.upper(DeviceType.name) == func.upper(entity_name)).first()
+    device_type = db.query(DeviceType).filter(name_equals(DeviceType, entity_name)).first()
     if not device_type:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -484,7 +484,7 @@ def update_device_type(db: Session, entity_name: str, data: Dict[str, Any]) -> D
     
     # Check if new name conflicts with existing device type (case-insensitive)
     if "name" in data and func.upper(data["name"]) != func.upper(device_type.name):
-        existing = db.query(DeviceType).filter(func.upper(DeviceType.name) == func.upper(data["name"])).first()
+        existing = db.query(DeviceType).filter(name_equals(DeviceType, data["name"])).first()
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -493,7 +493,7 @@ def update_device_type(db: Session, entity_name: str, data: Dict[str, Any]) -> D
     
     # Verify make exists if updating
     if "make_name" in data:
-        make = db.query(Make).filter(func.upper(Make.name) == func.upper(data["make_name"])).first()
+        make = db.query(Make).filter(name_equals(Make, data["make_name"])).first()
         if not make:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -518,7 +518,7 @@ def update_device_type(db: Session, entity_name: str, data: Dict[str, Any]) -> D
 
 def update_asset_owner(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing asset owner by name."""
-    asset_owner = db.query(AssetOwner).filter(func.upper(AssetOwner.name) == func.upper(entity_name)).first()
+    asset_owner = db.query(AssetOwner).filter(name_equals(AssetOwner, entity_name)).first()
     if not asset_owner:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -527,7 +527,7 @@ def update_asset_owner(db: Session, entity_name: str, data: Dict[str, Any]) -> D
     
     # Verify location exists if updating
     if "location_name" in data:
-        location = db.query(Location).filter(func.upper(Location.name) == func.upper(data["location_name"])).first()
+        location = db.query(Location).filter(name_equals(Location, data["location_name"])).first()
         if not location:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -552,7 +552,7 @@ def update_asset_owner(db: Session, entity_name: str, data: Dict[str, Any]) -> D
 
 def update_make(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing make by name."""
-    make = db.query(Make).filter(func.upper(Make.name) == func.upper(entity_name)).first()
+    make = db.query(Make).filter(name_equals(Make, entity_name)).first()
     if not make:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -561,7 +561,7 @@ def update_make(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str
     
     # Check if new name conflicts with existing make (case-insensitive)
     if "name" in data and func.upper(data["name"]) != func.upper(make.name):
-        existing = db.query(Make).filter(func.upper(Make.name) == func.upper(data["name"])).first()
+        existing = db.query(Make).filter(name_equals(Make, data["name"])).first()
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -584,7 +584,7 @@ def update_make(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str
 
 def update_model(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing model by name."""
-    model = db.query(Model).filter(func.upper(Model.name) == func.upper(entity_name)).first()
+    model = db.query(Model).filter(name_equals(Model, entity_name)).first()
     if not model:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -593,7 +593,7 @@ def update_model(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[st
     
     # Check if new name conflicts with existing model (case-insensitive)
     if "name" in data and func.upper(data["name"]) != func.upper(model.name):
-        existing = db.query(Model).filter(func.upper(Model.name) == func.upper(data["name"])).first()
+        existing = db.query(Model).filter(name_equals(Model, data["name"])).first()
         if existing:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -602,7 +602,7 @@ def update_model(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[st
     
     # Verify make exists if updating
     if "make_name" in data:
-        make = db.query(Make).filter(func.upper(Make.name) == func.upper(data["make_name"])).first()
+        make = db.query(Make).filter(name_equals(Make, data["make_name"])).first()
         if not make:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -611,7 +611,7 @@ def update_model(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[st
         model.make_id = make.id
     
     if "devicetype_name" in data:
-        device_type = db.query(DeviceType).filter(func.upper(DeviceType.name) == func.upper(data["devicetype_name"])).first()
+        device_type = db.query(DeviceType).filter(name_equals(DeviceType, data["devicetype_name"])).first()
         if not device_type:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -649,14 +649,14 @@ def update_model(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[st
 
 def update_application(db: Session, entity_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing application by name."""
-    application = db.query(ApplicationMapped).filter(func.upper(ApplicationMapped.name) == func.upper(entity_name)).first()
+    application = db.query(ApplicationMapped).filter(name_equals(ApplicationMapped, entity_name)).first()
     if not application:
         raise HTTPException(status_code=404, detail=f"Application with name '{entity_name}' not found")
     
     if "name" in data:
         application.name = data["name"]
     if "asset_owner_name" in data:
-        asset_owner = db.query(AssetOwner).filter(func.upper(AssetOwner.name) == func.upper(data["asset_owner_name"])).first()
+        asset_owner = db.query(AssetOwner).filter(name_equals(AssetOwner, data["asset_owner_name"])).first()
         if not asset_owner:
             raise HTTPException(status_code=404, detail=f"Asset owner '{data['asset_owner_name']}' not found")
         application.asset_owner_id = asset_owner.id
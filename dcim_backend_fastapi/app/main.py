@@ -162,6 +162,9 @@ async def lifespan(app: FastAPI):
 
     # Ensure the DB warm-up task finished and log shutdown
     await asyncio.gather(db_task, deferred_task)
+    from app.helpers.email_helper import close_smtp_connections
+
+    close_smtp_connections()
     app_logger.info("DCIM FastAPI application shutting down")
 
 
@@ -5,6 +5,12 @@ from fastapi.testclient import TestClient
 from app.main import app
 from app.db.session import get_db
 from app.helpers.auth_helper import get_current_user
+from app.helpers.detail_cache import (
+    build_detail_cache_key,
+    get_cached_detail,
+    set_cached_detail,
+)
+from app.helpers.listing_types import ListingType
 from app.helpers.rbac_helper import require_editor_or_admin, require_admin
 
 
@@ -46,6 +52,10 @@ def client(monkeypatch):
         return None
 
     main_module._prewarm_database = _noop_prewarm  # type: ignore[assignment]
+    # add/update/delete are deferred routers loaded in the background after
+    # startup; load them up front so the first request cannot race them
+    monkeypatch.setattr(main_module, "CRITICAL_ROUTER_MODULES", main_module.ALL_ROUTER_MODULES)
+    monkeypatch.setattr(main_module, "DEFERRED_ROUTER_MODULES", ())
 
     class DummyDB:
         def __init__(self) -> None:
@@ -155,7 +165,7 @@ def client(monkeypatch):
         {listing_types.ListingType.locations: LocationUpdate},
     )
 
-    listing_cache.listing_cache.cache.clear()
+    listing_cache.listing_cache.invalidate_all()
 
     with TestClient(app) as c:
         yield c
@@ -163,12 +173,22 @@ def client(monkeypatch):
     app.dependency_overrides.clear()
 
 
+def _cache_rack_detail():
+    """Put a (different entity's) detail payload in the shared detail cache."""
+    key = build_detail_cache_key(ListingType.racks, "R1")
+    set_cached_detail(key, {"id": 7, "name": "R1"})
+    assert get_cached_detail(key) is not None
+    return key
+
+
 def test_add_entity_location_success(client):
     payload = {
         "name": "Loc1",
         "description": "Test Location",
     }
 
+    detail_key = _cache_rack_detail()
+
     response = client.post(
         "/api/dcim/add",
         params={"entity": "locations"},
@@ -180,10 +200,13 @@ def test_add_entity_location_success(client):
     assert data["entity"] == "locations"
     assert data["data"]["name"] == "Loc1"
     assert data["change_log_id"] == 1
+    # Any write can change other entities' details, so the whole cache is dropped
+    assert get_cached_detail(detail_key) is None
 
 
 def test_update_entity_location_success(client):
     payload = {"description": "Updated"}
+    detail_key = _cache_rack_detail()
 
     response = client.put(
         "/api/dcim/update/Loc1",
@@ -197,9 +220,12 @@ def test_update_entity_location_success(client):
     assert body["entity_name"] == "Loc1"
     assert body["data"]["description"] == "Updated"
     assert body["change_log_id"] == 2
+    assert get_cached_detail(detail_key) is None
 
 
 def test_delete_entity_location_success(client):
+    detail_key = _cache_rack_detail()
+
     response = client.delete(
         "/api/dcim/delete/Loc1",
         params={"entity": "locations"},
@@ -210,5 +236,6 @@ def test_delete_entity_location_success(client):
     assert body["entity"] == "locations"
     assert body["data"]["name"] == "Loc1"
     assert body["change_log_id"] == 3
+    assert get_cached_detail(detail_key) is None
 
 
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
 
 import jwt
 import pytest
@@ -129,3 +130,102 @@ def test_decode_access_token_invalid_signature_raises_401():
     assert "invalid" in exc_info.value.detail.lower()
 
 
+
+
+def test_decode_access_token_reuses_cached_payload(monkeypatch):
+    token = auth_helper.create_access_token_for_user(user=DummyUser(user_id=11))
+    first = auth_helper.decode_access_token(token)
+
+    def _fail_decode(*_, **__):  # pragma: no cover - must not be reached
+        raise AssertionError("jwt.decode should not run for a cached token")
+
+    monkeypatch.setattr(auth_helper.jwt, "decode", _fail_decode)
+
+    second = auth_helper.decode_access_token(token)
+
+    assert second == first
+    assert second is not first
+
+
+def test_decode_access_token_cached_payload_rechecks_expiry(monkeypatch):
+    token = auth_helper.create_access_token_for_user(user=DummyUser(user_id=12))
+    payload = auth_helper.decode_access_token(token)
+
+    monkeypatch.setattr(auth_helper.time, "time", lambda: payload["exp"] + 1)
+
+    with pytest.raises(HTTPException) as exc_info:
+        auth_helper.decode_access_token(token)
+
+    assert exc_info.value.status_code == 419
+
+
+class _MenuQuery:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def join(self, *_, **__):
+        return self
+
+    def filter(self, *_, **__):
+        return self
+
+    def order_by(self, *_, **__):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _MenuDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = 0
+
+    def query(self, *_):
+        self.queries += 1
+        return _MenuQuery(self.rows)
+
+
+def test_build_menu_for_user_groups_rows_and_caches_per_role_set():
+    from app.helpers.menu_cache import invalidate_menu_cache
+
+    invalidate_menu_cache()
+    user = DummyUser(user_id=21, roles=[DummyUserRole(DummyRole("viewer"))])
+    db = _MenuDB(
+        [
+            (1, "Assets", "box", "Racks", "/racks", "rack"),
+            (1, "Assets", "box", "Devices", "/devices", "server"),
+            (2, "Admin", "cog", "Users", "/users", None),
+        ]
+    )
+
+    menu = auth_helper.build_menu_for_user(db, user.id, user=user)
+
+    assert [m["MenuHeaderName"] for m in menu["menuList"]] == ["Assets", "Admin"]
+    assert [s["page_url"] for s in menu["menuList"][0]["sub_menu_details"]] == [
+        "/racks",
+        "/devices",
+    ]
+
+    queries_after_first_build = db.queries
+    assert auth_helper.build_menu_for_user(db, user.id, user=user) == menu
+    assert db.queries == queries_after_first_build
+
+
+def test_build_menu_for_user_without_user_reads_role_codes_only():
+    from app.helpers.menu_cache import invalidate_menu_cache
+
+    invalidate_menu_cache()
+
+    class _RoleCodesDB(_MenuDB):
+        def scalars(self, *_):
+            self.queries += 1
+            return SimpleNamespace(all=lambda: ["ADMIN"])
+
+    db = _RoleCodesDB([(1, "Admin", "cog", "Users", "/users", None)])
+
+    menu = auth_helper.build_menu_for_user(db, 5)
+
+    assert menu["menuList"][0]["MenuHeaderName"] == "Admin"
+    # One role-code query plus the menu query; the user entity is never loaded
+    assert db.queries == 2
@@ -0,0 +1,75 @@
+import pytest
+
+from app.dcim.routers import bulk_upload_router
+from app.helpers.detail_cache import (
+    build_detail_cache_key,
+    get_cached_detail,
+    set_cached_detail,
+)
+from app.helpers.listing_types import ListingType
+
+
+class DummyDB:
+    def get(self, model, ident):
+        return None
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def job(monkeypatch):
+    reports = []
+    monkeypatch.setattr(bulk_upload_router, "SessionLocal", DummyDB)
+    monkeypatch.setattr(
+        bulk_upload_router, "build_audit_context", lambda **_: {"ctx": "dummy"}
+    )
+    monkeypatch.setattr(
+        bulk_upload_router,
+        "submit_email_task",
+        lambda func, **kwargs: reports.append(kwargs),
+    )
+
+    def run():
+        bulk_upload_router._process_bulk_upload_job(
+            job_id="job-1",
+            file_bytes=b"",
+            skip_errors=True,
+            current_user_id=1,
+            current_user_email="ops@example.com",
+            entity_type=bulk_upload_router.BulkUploadEntityType.devices,
+        )
+        return reports
+
+    return run
+
+
+def test_failed_job_still_clears_detail_cache(job, monkeypatch):
+    def fail_after_committing_rows(**_):
+        raise RuntimeError("row 3 blew up")
+
+    monkeypatch.setattr(
+        bulk_upload_router, "_process_single_entity_rows", fail_after_committing_rows
+    )
+    key = build_detail_cache_key(ListingType.racks, "R1")
+    set_cached_detail(key, {"id": 1, "devices": []})
+
+    [report] = job()
+
+    assert report["failure_reason"] == "row 3 blew up"
+    assert get_cached_detail(key) is None
+
+
+def test_completed_job_clears_detail_cache(job, monkeypatch):
+    monkeypatch.setattr(
+        bulk_upload_router,
+        "_process_single_entity_rows",
+        lambda **_: ({"success": 0, "errors": 1}, []),
+    )
+    key = build_detail_cache_key(ListingType.racks, "R1")
+    set_cached_detail(key, {"id": 1, "devices": []})
+
+    [report] = job()
+
+    assert report["failure_reason"] is None
+    assert get_cached_detail(key) is None
@@ -0,0 +1,41 @@
+from app.core.config import settings
+from app.helpers import detail_cache
+from app.helpers.listing_types import ListingType
+
+
+def test_detail_cache_shares_payload_and_matches_names_case_insensitively():
+    cache = detail_cache._DetailCache()  # type: ignore[attr-defined]
+    payload = {"id": 1, "name": "R1"}
+
+    cache.set(detail_cache.build_detail_cache_key(ListingType.racks, "R1"), payload)
+    cached = cache.get(detail_cache.build_detail_cache_key(ListingType.racks, "r1"))
+
+    assert cached is payload
+
+
+def test_detail_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(settings, "DETAIL_CACHE_MAX_ENTRIES", 2)
+    cache = detail_cache._DetailCache()  # type: ignore[attr-defined]
+    first, second, third = (
+        detail_cache.build_detail_cache_key(ListingType.racks, name)
+        for name in ("R1", "R2", "R3")
+    )
+    cache.set(first, {"id": 1})
+    cache.set(second, {"id": 2})
+    cache.get(first)
+
+    cache.set(third, {"id": 3})
+
+    assert cache.get(second) is None
+    assert cache.get(first) == {"id": 1}
+    assert cache.get(third) == {"id": 3}
+
+
+def test_detail_cache_disabled_with_zero_ttl(monkeypatch):
+    monkeypatch.setattr(settings, "DETAIL_CACHE_TTL_SECONDS", 0)
+    cache = detail_cache._DetailCache()  # type: ignore[attr-defined]
+    key = detail_cache.build_detail_cache_key(ListingType.racks, "R1")
+
+    cache.set(key, {"id": 1})
+
+    assert cache.get(key) is None
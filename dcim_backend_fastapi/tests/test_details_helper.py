@@ -0,0 +1,82 @@
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.helpers import details_helper
+from app.models import auth_models  # noqa: F401 - registers the auth tables
+from app.models.entity_models import (
+    Building,
+    Datacenter,
+    Device,
+    DeviceType,
+    Floor,
+    Location,
+    Make,
+    Model,
+    Rack,
+    Wing,
+)
+
+
+def _session() -> Session:
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def _attach_dcim_schema(dbapi_connection, _):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS dcim")
+
+    Base.metadata.create_all(engine)
+    return Session(engine)
+
+
+def test_rack_devices_use_first_model_of_device_type_and_make():
+    db = _session()
+    location = Location(name="L1")
+    db.add(location)
+    db.flush()
+    building = Building(name="B1", location_id=location.id)
+    db.add(building)
+    db.flush()
+    scope = {"location_id": location.id, "building_id": building.id}
+    wing = Wing(name="W1", **scope)
+    db.add(wing)
+    db.flush()
+    floor = Floor(name="F1", wing_id=wing.id, **scope)
+    db.add(floor)
+    db.flush()
+    datacenter = Datacenter(name="DC1", wing_id=wing.id, floor_id=floor.id, **scope)
+    db.add(datacenter)
+    db.flush()
+    rack = Rack(
+        name="R1", wing_id=wing.id, floor_id=floor.id, datacenter_id=datacenter.id, **scope
+    )
+    dell, hpe = Make(name="Dell"), Make(name="HPE")
+    db.add_all([rack, dell, hpe])
+    db.flush()
+    server = DeviceType(name="Server", make_id=dell.id)
+    db.add(server)
+    db.flush()
+    # HPE's model has the lowest id for the device type overall
+    db.add(Model(name="HPE-1", make_id=hpe.id, device_type_id=server.id, height=1, front_image_path="hpe.png"))
+    db.flush()
+    db.add(Model(name="Dell-1", make_id=dell.id, device_type_id=server.id, height=1, front_image_path="dell.png"))
+    db.add(
+        Device(
+            name="D1",
+            position=1,
+            rack_id=rack.id,
+            wings_id=wing.id,
+            floor_id=floor.id,
+            dc_id=datacenter.id,
+            make_id=dell.id,
+            devicetype_id=server.id,
+            **scope,
+        )
+    )
+    db.commit()
+
+    [device] = details_helper._rack_devices(db, rack.id)  # type: ignore[attr-defined]
+
+    assert device["make"] == "Dell"
+    assert device["front_image_path"] == "dell.png"
+    db.close()
@@ -0,0 +1,213 @@
+import threading
+
+import pytest
+
+from app.core.config import settings
+from app.helpers import email_helper
+
+
+def _rows(count: int) -> list[dict]:
+    return [
+        {"row": index, "status": "success", "data": {"id": index}}
+        for index in range(1, count + 1)
+    ]
+
+
+SUMMARY = {
+    "entity": "devices",
+    "total_rows": 2,
+    "processed": 2,
+    "success": 2,
+    "errors": 0,
+}
+
+
+def test_build_report_inlines_small_reports():
+    body, attachments = email_helper.build_bulk_upload_report_email(
+        job_id="job-1",
+        summary=SUMMARY,
+        results=iter(_rows(email_helper.REPORT_INLINE_MAX_ROWS)),
+    )
+
+    assert attachments == []
+    assert body == email_helper.format_bulk_upload_report(
+        "job-1", SUMMARY, _rows(email_helper.REPORT_INLINE_MAX_ROWS)
+    )
+
+
+def test_build_report_attaches_rows_past_inline_limit():
+    row_count = email_helper.REPORT_INLINE_MAX_ROWS + 1
+
+    body, attachments = email_helper.build_bulk_upload_report_email(
+        job_id="job-2",
+        summary=SUMMARY,
+        results=iter(_rows(row_count)),
+    )
+
+    assert "Row results are attached (bulk_upload_job-2.txt)." in body
+    assert "- Row 1:" not in body
+    [(filename, content)] = attachments
+    assert filename == "bulk_upload_job-2.txt"
+    lines = content.split("\n")
+    assert len(lines) == row_count
+    assert lines[0] == "- Row 1: SUCCESS (device_id=1)"
+    assert lines[-1] == f"- Row {row_count}: SUCCESS (device_id={row_count})"
+
+
+def test_send_bulk_upload_report_does_not_send(monkeypatch):
+    # Delivery of the report is switched off (see send_bulk_upload_report)
+    sent = []
+    monkeypatch.setattr(email_helper, "send_email", lambda **kwargs: sent.append(kwargs))
+
+    email_helper.send_bulk_upload_report(
+        job_id="job-3",
+        summary=SUMMARY,
+        results=_rows(2),
+        recipients=["ops@example.com"],
+    )
+
+    assert sent == []
+
+
+class FakeSMTP:
+    def __init__(self, noop_code: int = 250) -> None:
+        self.noop_code = noop_code
+        self.sent = []
+        self.disconnect_next_send = False
+        self.closed = False
+
+    def noop(self):
+        if self.noop_code is None:
+            raise email_helper.smtplib.SMTPServerDisconnected("gone")
+        return (self.noop_code, b"OK")
+
+    def send_message(self, message):
+        if self.disconnect_next_send:
+            self.disconnect_next_send = False
+            raise email_helper.smtplib.SMTPServerDisconnected("gone")
+        self.sent.append(message)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def smtp_connections(monkeypatch):
+    opened: list[FakeSMTP] = []
+
+    def _open():
+        smtp = FakeSMTP()
+        opened.append(smtp)
+        return smtp
+
+    monkeypatch.setattr(email_helper, "_open_smtp", _open)
+    monkeypatch.setattr(settings, "SMTP_HOST", "smtp.example.com")
+    monkeypatch.setattr(settings, "SMTP_FROM_EMAIL", "dcim@example.com")
+    email_helper.close_smtp_connections()
+    yield opened
+    email_helper.close_smtp_connections()
+
+
+def test_get_smtp_reuses_live_connection(smtp_connections):
+    first = email_helper._get_smtp()  # type: ignore[attr-defined]
+    second = email_helper._get_smtp()  # type: ignore[attr-defined]
+
+    assert first is second
+    assert len(smtp_connections) == 1
+
+
+@pytest.mark.parametrize("noop_code", [None, 421])
+def test_get_smtp_reconnects_stale_connection(smtp_connections, noop_code):
+    stale = email_helper._get_smtp()  # type: ignore[attr-defined]
+    stale.noop_code = noop_code
+
+    fresh = email_helper._get_smtp()  # type: ignore[attr-defined]
+
+    assert fresh is not stale
+    assert stale.closed
+    assert email_helper._smtp_connections == [fresh]  # type: ignore[attr-defined]
+
+
+def test_send_email_resends_once_after_server_disconnect(smtp_connections):
+    stale = email_helper._get_smtp()  # type: ignore[attr-defined]
+    stale.disconnect_next_send = True
+
+    email_helper.send_email("Subject", "Body", ["ops@example.com"])
+
+    assert stale.closed
+    assert stale.sent == []
+    [fresh] = smtp_connections[1:]
+    [message] = fresh.sent
+    assert message["To"] == "ops@example.com"
+
+
+def test_submit_email_task_runs_on_email_pool(smtp_connections):
+    thread_names = []
+
+    def task(recipient):
+        thread_names.append(threading.current_thread().name)
+        email_helper.send_email("Subject", "Body", [recipient])
+
+    email_helper.submit_email_task(task, "ops@example.com").result(timeout=5)
+
+    assert thread_names[0].startswith("smtp-send")
+    [smtp] = smtp_connections
+    assert len(smtp.sent) == 1
+
+
+def test_submit_email_task_logs_failures(smtp_connections, monkeypatch):
+    errors = []
+    monkeypatch.setattr(
+        email_helper.app_logger,
+        "error",
+        lambda message, **kwargs: errors.append((message, kwargs)),
+    )
+
+    def failing_task():
+        raise RuntimeError("boom")
+
+    future = email_helper.submit_email_task(failing_task)
+    with pytest.raises(RuntimeError):
+        future.result(timeout=5)
+    email_helper.close_smtp_connections()
+
+    [(message, kwargs)] = errors
+    assert message == "Queued email task failed"
+    assert isinstance(kwargs["exc_info"][1], RuntimeError)
+
+
+def test_close_smtp_connections_quits_pooled_connections(smtp_connections):
+    email_helper.submit_email_task(
+        email_helper.send_email, "Subject", "Body", ["ops@example.com"]
+    ).result(timeout=5)
+
+    email_helper.close_smtp_connections()
+
+    [smtp] = smtp_connections
+    assert smtp.closed
+    assert email_helper._smtp_connections == []  # type: ignore[attr-defined]
+
+
+def test_send_bulk_upload_report_logs_only_when_debug_enabled(monkeypatch):
+    records = []
+    monkeypatch.setattr(
+        email_helper.app_logger,
+        "debug",
+        lambda message, **kwargs: records.append((message, kwargs)),
+    )
+    report = dict(
+        job_id="job-4", summary=SUMMARY, results=_rows(1), recipients=["a@example.com"]
+    )
+
+    monkeypatch.setattr(email_helper.app_logger, "isEnabledFor", lambda level: False)
+    email_helper.send_bulk_upload_report(**report)
+    assert records == []
+
+    monkeypatch.setattr(email_helper.app_logger, "isEnabledFor", lambda level: True)
+    email_helper.send_bulk_upload_report(**report)
+    [(message, kwargs)] = records
+    assert message == "Bulk upload report"
+    assert kwargs["extra"] == {"job_id": "job-4", "recipient_count": 1, "failed": False}
@@ -0,0 +1,104 @@
+import pytest
+
+from app.core.config import settings
+from app.helpers import listing_cache
+from app.helpers.listing_types import ListingType
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(settings, "LISTING_CACHE_TTL_SECONDS", 60)
+    monkeypatch.setattr(
+        settings, "LISTING_CACHE_MAX_ENTRIES", 2 * listing_cache._SHARD_COUNT  # type: ignore[attr-defined]
+    )
+    listing_cache.refresh_cache_enabled()
+    yield listing_cache._ListingResponseCache()  # type: ignore[attr-defined]
+    monkeypatch.undo()
+    listing_cache.refresh_cache_enabled()
+
+
+def _keys_in_one_shard(cache, count: int) -> list[bytes]:
+    """Distinct keys that all hash to the shard of the first one."""
+    target = cache._shard(b"key-0")
+    keys = []
+    index = 0
+    while len(keys) < count:
+        key = f"key-{index}".encode()
+        if cache._shard(key) is target:
+            keys.append(key)
+        index += 1
+    return keys
+
+
+def test_shard_evicts_least_recently_used_key(cache):
+    first, second, third = _keys_in_one_shard(cache, 3)
+    cache.set(first, {"id": 1}, entity=ListingType.locations)
+    cache.set(second, {"id": 2}, entity=ListingType.locations)
+
+    # Touch `first` so `second` becomes the shard's LRU entry
+    assert cache.get(first) == {"id": 1}
+    cache.set(third, {"id": 3}, entity=ListingType.racks)
+
+    assert cache.get(second) is None
+    assert cache.get(first) == {"id": 1}
+    assert cache.get(third) == {"id": 3}
+    assert cache._entity_index["locations"] == {first}
+    assert second not in cache._key_to_entity
+
+
+def test_eviction_is_per_shard(cache):
+    [key] = _keys_in_one_shard(cache, 1)
+    cache.set(key, {"id": 1}, entity=ListingType.locations)
+
+    # Filling other shards never evicts from this one
+    other_keys = [
+        f"other-{index}".encode()
+        for index in range(200)
+        if cache._shard(f"other-{index}".encode()) is not cache._shard(key)
+    ]
+    for other in other_keys:
+        cache.set(other, {"id": 2}, entity=ListingType.racks)
+
+    assert cache.get(key) == {"id": 1}
+
+
+def test_invalidate_entity_only_drops_that_entity(cache):
+    cache.set(b"loc-1", {"id": 1}, entity=ListingType.locations)
+    cache.set(b"loc-2", {"id": 2}, entity="locations")
+    cache.set(b"rack-1", {"id": 3}, entity=ListingType.racks)
+
+    cache.invalidate_entity(ListingType.locations)
+
+    assert cache.get(b"loc-1") is None
+    assert cache.get(b"loc-2") is None
+    assert cache.get(b"rack-1") == {"id": 3}
+    assert "locations" not in cache._entity_index
+    assert cache._key_to_entity == {b"rack-1": "racks"}
+
+
+def test_set_reindexes_key_under_new_entity(cache):
+    cache.set(b"shared", {"id": 1}, entity=ListingType.locations)
+    cache.set(b"shared", {"id": 2}, entity=ListingType.racks)
+
+    assert "locations" not in cache._entity_index
+    assert cache._key_to_entity[b"shared"] == "racks"
+
+    # The old entity no longer owns the key ...
+    cache.invalidate_entity(ListingType.locations)
+    assert cache.get(b"shared") == {"id": 2}
+
+    # ... the new one does
+    cache.invalidate_entity(ListingType.racks)
+    assert cache.get(b"shared") is None
+    assert cache._key_to_entity == {}
+
+
+def test_invalidate_all_clears_every_shard_and_index(cache):
+    for index in range(20):
+        cache.set(f"key-{index}".encode(), {"id": index}, entity=ListingType.devices)
+
+    cache.invalidate_all()
+
+    assert all(not shard.store for shard in cache._shards)
+    assert cache._entity_index == {}
+    assert cache._key_to_entity == {}
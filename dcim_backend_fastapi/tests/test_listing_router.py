@@ -10,9 +10,16 @@ from app.helpers.auth_helper import get_current_user
 from app.helpers.rbac_helper import require_at_least_viewer
 
 
+class DummyLocationAccess:
+    def __init__(self, location_id: int) -> None:
+        self.location_id = location_id
+
+
 class DummyUser:
     def __init__(self, user_id: int = 1) -> None:
         self.id = user_id
+        # Non-admin listings are scoped to the user's assigned locations
+        self.location_accesses = [DummyLocationAccess(1)]
 
 
 class DummyAccessLevel:
@@ -26,8 +33,11 @@ class DummyListingHandler:
         self.total = total
         self.data = data or [{"id": 1, "name": "dummy"}]
 
+        self.calls = []
+
     def __call__(self, db, offset: int, page_size: int, **filters):
         # Return predictable totals and data for assertions
+        self.calls.append({"offset": offset, "page_size": page_size, **filters})
         return self.total, self.data
 
 
@@ -72,9 +82,10 @@ def client(monkeypatch):
         {listing_types.ListingType.locations: handler},
     )
 
-    listing_cache.listing_cache.cache.clear()
+    listing_cache.listing_cache.invalidate_all()
 
     with TestClient(app) as c:
+        c.listing_handler = handler  # type: ignore[attr-defined]
         yield c
 
     app.dependency_overrides.clear()
@@ -139,3 +150,66 @@ def test_list_dcim_entities_normalizes_and_parses_filters(client):
     assert "results" in body
 
 
+
+
+def _location_page(*ids: int) -> list[dict]:
+    return [{"id": location_id, "name": f"L{location_id}"} for location_id in ids]
+
+
+def test_list_dcim_entities_full_page_returns_next_cursor(client):
+    handler = client.listing_handler
+    handler.total, handler.data = 5, _location_page(3, 4)
+
+    response = client.get(
+        "/api/dcim/list",
+        params={"entity": "locations", "page_size": 2, "after_id": 2},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["next_cursor"] == 4
+    assert handler.calls[0]["after_id"] == 2
+
+
+def test_list_dcim_entities_short_final_page_has_no_next_cursor(client):
+    handler = client.listing_handler
+    handler.total, handler.data = 5, _location_page(5)
+
+    response = client.get(
+        "/api/dcim/list",
+        params={"entity": "locations", "page_size": 2, "after_id": 4},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    body = response.json()
+    assert body["results"] == _location_page(5)
+    assert body["next_cursor"] is None
+
+
+def test_list_dcim_entities_caches_pages_per_after_id(client):
+    handler = client.listing_handler
+    handler.total, handler.data = 4, _location_page(1, 2)
+    first_page = {"entity": "locations", "page_size": 2}
+    second_page = {**first_page, "after_id": 2}
+
+    client.get("/api/dcim/list", params=first_page)
+    handler.data = _location_page(3, 4)
+    second = client.get("/api/dcim/list", params=second_page)
+    first_again = client.get("/api/dcim/list", params=first_page)
+
+    # The cursor is part of the page key: two handler calls, then a cache hit
+    assert [call["after_id"] for call in handler.calls] == [None, 2]
+    assert second.json()["results"] == _location_page(3, 4)
+    assert first_again.json()["results"] == _location_page(1, 2)
+    # The total is keyed without the cursor, so the second page reuses it
+    assert handler.calls[1]["include_total"] is False
+
+
+def test_list_dcim_entities_after_id_unsupported_entity_returns_400(client):
+    response = client.get(
+        "/api/dcim/list",
+        params={"entity": "wings", "after_id": 10},
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "after_id is not supported" in response.json()["detail"]
+    assert client.listing_handler.calls == []
@@ -12,12 +12,24 @@ class DummyQuery:
     def __init__(self, result):
         self._result = result
 
+    def options(self, *_, **__):
+        return self
+
     def filter(self, *_, **__):
         return self
 
+    def join(self, *_, **__):
+        return self
+
+    def order_by(self, *_, **__):
+        return self
+
     def first(self):
         return self._result
 
+    def all(self):
+        return [] if self._result is None else [self._result]
+
     def delete(self):
         # No-op for tests
         return 0
@@ -30,7 +42,7 @@ class DummyDBSession:
         self._added = []
 
     # SQLAlchemy-like API used in login_router
-    def query(self, model):
+    def query(self, model, *_):
         if getattr(model, "__name__", "") == "User":
             return DummyQuery(self._user)
         if getattr(model, "__name__", "") == "Token":
@@ -67,6 +79,7 @@ class DummyUser:
         self.email = "admin@example.com"
         self.is_active = is_active
         self.user_roles = [DummyUserRole(DummyRole("ADMIN", True))]
+        self.created_at = datetime(2024, 1, 1)
         self.last_login: datetime | None = None
 
 
@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.base import Base
+from app.helpers import lookup_cache
+from app.models import auth_models  # noqa: F401 - registers the auth tables
+from app.models.entity_models import Make
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def _attach_dcim_schema(dbapi_connection, _):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS dcim")
+
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(settings, "LOOKUP_CACHE_TTL_SECONDS", 300)
+    lookup_cache.invalidate_lookup_cache()
+
+    session = Session(engine)
+    session.add(Make(name="Dell"))
+    session.commit()
+    yield session
+
+    session.close()
+    lookup_cache.invalidate_lookup_cache()
+    engine.dispose()
+
+
+def test_snapshot_is_reused_until_a_cached_model_is_committed(db):
+    first = lookup_cache.get_lookup_tables(db)
+    assert lookup_cache.get_lookup_tables(db) is first
+
+    db.add(Make(name="HPE"))
+    db.flush()
+    # Flushed but not committed: other sessions cannot see the row yet
+    assert lookup_cache.get_lookup_tables(db) is first
+
+    db.commit()
+
+    reloaded = lookup_cache.get_lookup_tables(db)
+    assert reloaded is not first
+    assert sorted(reloaded.makes.values()) == ["Dell", "HPE"]
+
+
+def test_rollback_keeps_snapshot(db):
+    first = lookup_cache.get_lookup_tables(db)
+
+    db.add(Make(name="HPE"))
+    db.flush()
+    db.rollback()
+    # A later unrelated commit must not clear it either
+    db.commit()
+
+    assert lookup_cache.get_lookup_tables(db) is first
+
+
+def test_load_racing_a_clear_is_not_stored(db, monkeypatch):
+    real_load = lookup_cache._load_lookup_tables  # type: ignore[attr-defined]
+    loads = []
+
+    def load_while_a_write_commits(session):
+        tables = real_load(session)
+        loads.append(tables)
+        if len(loads) == 1:
+            lookup_cache.invalidate_lookup_cache()
+        return tables
+
+    monkeypatch.setattr(lookup_cache, "_load_lookup_tables", load_while_a_write_commits)
+
+    raced = lookup_cache.get_lookup_tables(db)
+    fresh = lookup_cache.get_lookup_tables(db)
+
+    assert fresh is not raced
+    assert len(loads) == 2
+    assert lookup_cache.get_lookup_tables(db) is fresh
+
+
+def test_zero_ttl_reloads_every_call(db, monkeypatch):
+    monkeypatch.setattr(settings, "LOOKUP_CACHE_TTL_SECONDS", 0)
+
+    first = lookup_cache.get_lookup_tables(db)
+    second = lookup_cache.get_lookup_tables(db)
+
+    assert first is not second
+    assert first == second
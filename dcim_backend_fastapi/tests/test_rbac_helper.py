@@ -1,6 +1,17 @@
+import time
+
+import pytest
 from fastapi import HTTPException, status
 
-from app.helpers import rbac_helper
+from app.core.config import settings
+from app.helpers import auth_helper, rbac_helper
+
+
+@pytest.fixture(autouse=True)
+def _clear_decoded_tokens():
+    auth_helper._decoded_token_cache.clear()  # type: ignore[attr-defined]
+    yield
+    auth_helper._decoded_token_cache.clear()  # type: ignore[attr-defined]
 
 
 def test_access_level_from_roles_priority_admin_over_editor():
@@ -25,7 +36,7 @@ def test_access_level_from_roles_viewer_default():
     assert level is rbac_helper.AccessLevel.viewer
 
 
-def _make_jwt(roles, is_superuser: bool = False) -> str:
+def _make_jwt(roles, is_superuser: bool = False, exp: int | None = None) -> str:
     from app.core.config import settings
     import jwt
 
@@ -36,6 +47,8 @@ def _make_jwt(roles, is_superuser: bool = False) -> str:
     }
     if is_superuser:
         payload["is_superuser"] = True
+    if exp is not None:
+        payload["exp"] = exp
 
     return jwt.encode(payload, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
@@ -98,3 +111,73 @@ def test_require_admin_raises_for_non_admin():
             raise AssertionError("Expected HTTPException for non-admin access")
 
 
+
+
+def _count_level_resolutions(monkeypatch) -> list:
+    calls = []
+    resolve = rbac_helper._access_level_from_claims  # type: ignore[attr-defined]
+
+    def counting(payload):
+        calls.append(payload)
+        return resolve(payload)
+
+    monkeypatch.setattr(rbac_helper, "_access_level_from_claims", counting)
+    return calls
+
+
+def test_get_access_level_resolves_roles_once_per_token(monkeypatch):
+    calls = _count_level_resolutions(monkeypatch)
+    header = f"Bearer {_make_jwt(['editor'])}"
+
+    levels = [rbac_helper.get_access_level(authorization=header) for _ in range(3)]
+
+    assert levels == [rbac_helper.AccessLevel.editor] * 3
+    assert len(calls) == 1
+
+
+def test_get_access_level_rechecks_expiry_on_cached_hit(monkeypatch):
+    exp = int(time.time()) + 60
+    header = f"Bearer {_make_jwt(['admin'], exp=exp)}"
+    assert rbac_helper.get_access_level(authorization=header) is rbac_helper.AccessLevel.admin
+
+    monkeypatch.setattr(auth_helper.time, "time", lambda: exp + 1)
+
+    with pytest.raises(HTTPException) as exc_info:
+        rbac_helper.get_access_level(authorization=header)
+    assert exc_info.value.status_code == 419
+
+
+def test_access_level_cache_follows_decode_cache_size(monkeypatch):
+    monkeypatch.setattr(settings, "JWT_DECODE_CACHE_MAX_ENTRIES", 1)
+    calls = _count_level_resolutions(monkeypatch)
+    first = f"Bearer {_make_jwt(['viewer'])}"
+    second = f"Bearer {_make_jwt(['editor'])}"
+
+    rbac_helper.get_access_level(authorization=first)
+    rbac_helper.get_access_level(authorization=second)
+    # `first` was evicted together with its decoded claims
+    rbac_helper.get_access_level(authorization=first)
+
+    assert len(calls) == 3
+
+
+def test_access_level_dropped_with_decode_cache(monkeypatch):
+    calls = _count_level_resolutions(monkeypatch)
+    header = f"Bearer {_make_jwt(['viewer'])}"
+
+    rbac_helper.get_access_level(authorization=header)
+    auth_helper._decoded_token_cache.clear()  # type: ignore[attr-defined]
+    rbac_helper.get_access_level(authorization=header)
+
+    assert len(calls) == 2
+
+
+def test_get_access_level_without_decode_cache(monkeypatch):
+    monkeypatch.setattr(settings, "JWT_DECODE_CACHE_MAX_ENTRIES", 0)
+    calls = _count_level_resolutions(monkeypatch)
+    header = f"Bearer {_make_jwt(['admin'])}"
+
+    levels = [rbac_helper.get_access_level(authorization=header) for _ in range(2)]
+
+    assert levels == [rbac_helper.AccessLevel.admin] * 2
+    assert len(calls) == 2
@@ -1,21 +1,29 @@
+import json
+
 import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.db.base import Base
 from app.db.session import get_db
+from app.helpers import summary_cache
 from app.helpers.auth_helper import get_current_user
-from app.helpers.rbac_helper import require_at_least_viewer
+from app.helpers.rbac_helper import AccessLevel, require_at_least_viewer
 
 
-class DummyAccessLevel:
-    def __init__(self, value: str = "viewer") -> None:
-        self.value = value
+class DummyLocationAccess:
+    def __init__(self, location_id: int) -> None:
+        self.location_id = location_id
 
 
 class DummyUser:
-    def __init__(self, user_id: int = 1) -> None:
+    def __init__(self, user_id: int = 1, location_ids=(1,)) -> None:
         self.id = user_id
+        self.location_accesses = [DummyLocationAccess(i) for i in location_ids]
 
 
 @pytest.fixture
@@ -41,9 +49,8 @@ def client():
 
     app.dependency_overrides[get_db] = _override_get_db
     app.dependency_overrides[get_current_user] = lambda: DummyUser(1)
-    app.dependency_overrides[require_at_least_viewer] = lambda: DummyAccessLevel(
-        "viewer"
-    )
+    # Only unscoped (admin) summaries are cached
+    app.dependency_overrides[require_at_least_viewer] = lambda: AccessLevel.admin
 
     with TestClient(app) as c:
         yield c
@@ -74,3 +81,157 @@ def test_get_location_summary_returns_payload(client, monkeypatch):
     assert data == sample_payload
 
 
+
+
+@pytest.fixture
+def summary_db(monkeypatch):
+    """In-memory SQLite database with two locations, racks and devices."""
+    from app.models import auth_models  # noqa: F401 - registers the auth tables
+    from app.models.entity_models import (
+        Building,
+        Datacenter,
+        Device,
+        DeviceType,
+        Floor,
+        Location,
+        Make,
+        Rack,
+        Wing,
+    )
+    import app.main as main_module
+
+    async def _noop_prewarm(app_logger):  # type: ignore[unused-argument]
+        return None
+
+    monkeypatch.setattr(main_module, "_prewarm_database", _noop_prewarm)
+    monkeypatch.setattr(summary_cache.settings, "SUMMARY_CACHE_TTL_SECONDS", 60)
+    summary_cache.invalidate_location_summary_cache()
+
+    # One shared connection: the sync endpoint runs in a worker thread
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _attach_dcim_schema(dbapi_connection, _):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS dcim")
+
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    make = Make(name="Dell")
+    session.add(make)
+    session.flush()
+    device_type = DeviceType(name="Server", make_id=make.id)
+    session.add(device_type)
+    for name in ("Loc1", "Loc2"):
+        location = Location(name=name)
+        session.add(location)
+        session.flush()
+        building = Building(name=f"{name}-B", location_id=location.id)
+        session.add(building)
+        session.flush()
+        scope = {"location_id": location.id, "building_id": building.id}
+        wing = Wing(name=f"{name}-W", **scope)
+        session.add(wing)
+        session.flush()
+        floor = Floor(name=f"{name}-F", wing_id=wing.id, **scope)
+        session.add(floor)
+        session.flush()
+        datacenter = Datacenter(name=f"{name}-DC", wing_id=wing.id, floor_id=floor.id, **scope)
+        session.add(datacenter)
+        session.flush()
+        rack = Rack(
+            name=f"{name}-R",
+            wing_id=wing.id,
+            floor_id=floor.id,
+            datacenter_id=datacenter.id,
+            **scope,
+        )
+        session.add(rack)
+        session.flush()
+        session.add(
+            Device(
+                name=f"{name}-D",
+                wings_id=wing.id,
+                floor_id=floor.id,
+                dc_id=datacenter.id,
+                rack_id=rack.id,
+                make_id=make.id,
+                devicetype_id=device_type.id,
+                **scope,
+            )
+        )
+    session.commit()
+
+    def _override_get_db():
+        yield session
+
+    app.dependency_overrides[get_db] = _override_get_db
+    yield session
+
+    app.dependency_overrides.clear()
+    summary_cache.invalidate_location_summary_cache()
+    session.close()
+    engine.dispose()
+
+
+def _get_summary(user: DummyUser, access_level: AccessLevel):
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[require_at_least_viewer] = lambda: access_level
+    with TestClient(app) as c:
+        return c.get("/api/dcim/summary/locations")
+
+
+def test_cached_summary_bytes_match_uncached_response(summary_db):
+    # A viewer assigned to every location gets the same rows, uncached
+    uncached = _get_summary(DummyUser(2, location_ids=(1, 2)), AccessLevel.viewer)
+    assert summary_cache.get_cached_location_summary() is None
+
+    first = _get_summary(DummyUser(1), AccessLevel.admin)
+    cached_blob = summary_cache.get_cached_location_summary()
+    second = _get_summary(DummyUser(1), AccessLevel.admin)
+
+    assert uncached.status_code == first.status_code == second.status_code == 200
+    assert json.loads(cached_blob) == uncached.json()
+    assert uncached.json()["total_locations"] == 2
+    # Same bytes as the app's default pretty-printed response
+    assert first.content == second.content == cached_blob == uncached.content
+
+
+def test_cached_summary_is_served_until_invalidated(summary_db):
+    from app.models.entity_models import Location
+
+    first = _get_summary(DummyUser(1), AccessLevel.admin)
+    summary_db.add(Location(name="Loc3"))
+    summary_db.commit()
+
+    still_cached = _get_summary(DummyUser(1), AccessLevel.admin)
+    summary_cache.invalidate_location_summary_cache()
+    refreshed = _get_summary(DummyUser(1), AccessLevel.admin)
+
+    assert still_cached.content == first.content
+    assert refreshed.json()["total_locations"] == 3
+
+
+def test_invalidate_location_summary_cache_drops_entry(monkeypatch):
+    monkeypatch.setattr(summary_cache.settings, "SUMMARY_CACHE_TTL_SECONDS", 60)
+    cache = summary_cache._location_summary_cache  # type: ignore[attr-defined]
+
+    blob = summary_cache.set_cached_location_summary({"total_locations": 0, "results": []})
+    assert cache._entry[1] is blob
+    assert summary_cache.get_cached_location_summary() is blob
+
+    summary_cache.invalidate_location_summary_cache()
+
+    assert cache._entry is None
+    assert summary_cache.get_cached_location_summary() is None
+
+
+def test_expired_summary_entry_is_not_returned(monkeypatch):
+    monkeypatch.setattr(summary_cache.settings, "SUMMARY_CACHE_TTL_SECONDS", 60)
+    cache = summary_cache._location_summary_cache  # type: ignore[attr-defined]
+    monkeypatch.setattr(cache, "_entry", (0.0, b"{}"))
+
+    assert summary_cache.get_cached_location_summary() is None